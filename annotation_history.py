@@ -0,0 +1,217 @@
+# Undo/redo journal of annotation edits stored as compact deltas
+# Journal d'annulation/rétablissement des modifications d'annotations stocké sous forme de deltas compacts
+from collections import deque
+
+
+# Kinds of journal entries
+# Types d'entrées du journal
+ADD = "add"  # An annotation was appended / Une annotation a été ajoutée
+REMOVE = "remove"  # An annotation was deleted from a list position / Une annotation a été supprimée d'une position de la liste
+CLEAR = "clear"  # Every annotation was deleted / Toutes les annotations ont été supprimées
+MOVE = "move"  # An annotation was translated / Une annotation a été translatée
+RESIZE = "resize"  # A handle of an annotation was dragged / Une poignée d'une annotation a été glissée
+
+# Default memory cap of the journal in bytes
+# Plafond mémoire par défaut du journal en octets
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+# Estimated cost of an entry and of an annotation object, excluding their point arrays
+# Coût estimé d'une entrée et d'un objet annotation, hors tableaux de points
+_ENTRY_BYTES = 128
+_ANNOTATION_BYTES = 160
+
+
+# Estimates the memory held by a geometry_state tuple
+# Estime la mémoire retenue par un tuple geometry_state
+def _state_bytes(state):
+    return sum(getattr(value, "nbytes", 0) for value in state)
+
+
+# True when two geometry_state tuples hold the same values; arrays are compared by identity
+# since resize always assigns a new array
+# Vrai si deux tuples geometry_state contiennent les mêmes valeurs ; les tableaux sont comparés par
+# identité puisque resize affecte toujours un nouveau tableau
+def _same_state(before, after):
+    return all(
+        a is b or (not hasattr(a, "nbytes") and a == b) for a, b in zip(before, after)
+    )
+
+
+# One undoable edit; before and after hold what undo and redo need
+# Une modification annulable ; before et after contiennent ce dont undo et redo ont besoin
+class _Entry:
+    __slots__ = ("kind", "target", "before", "after", "size")
+
+    def __init__(self, kind, target, before, after, size):
+        self.kind = kind
+        self.target = target  # Annotation, or list of annotations for CLEAR / Annotation, ou liste d'annotations pour CLEAR
+        self.before = before
+        self.after = after
+        self.size = size  # Estimated bytes / Octets estimés
+
+
+# Bounded command journal over an annotation list and its AnnotationIndex
+# Journal de commandes borné sur une liste d'annotations et son AnnotationIndex
+class AnnotationHistory:
+    # Initializes an empty journal editing annotations and index in place
+    # Initialise un journal vide modifiant annotations et index sur place
+    def __init__(self, annotations, index, max_bytes=DEFAULT_MAX_BYTES):
+        self.annotations = annotations  # The application's list, edited in place / La liste de l'application, modifiée sur place
+        self.index = index  # AnnotationIndex kept in sync with the list / AnnotationIndex synchronisé avec la liste
+        self.max_bytes = max_bytes  # Oldest entries are evicted above this estimate / Les entrées les plus anciennes sont évincées au-delà de cette estimation
+        self._undo = deque()  # Oldest entry on the left / Entrée la plus ancienne à gauche
+        self._redo = []
+        self._bytes = 0  # Estimated size of both stacks / Taille estimée des deux piles
+        self._open_move = None  # MOVE entry of the drag in progress / Entrée MOVE du glissement en cours
+
+    def __len__(self):
+        return len(self._undo)
+
+    # Memory currently accounted to the journal
+    # Mémoire actuellement comptée pour le journal
+    @property
+    def size_bytes(self):
+        return self._bytes
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    # Forgets every entry, e.g. when the annotations are replaced wholesale
+    # Oublie toutes les entrées, par exemple quand les annotations sont remplacées en bloc
+    def reset(self):
+        self._undo.clear()
+        self._redo.clear()
+        self._bytes = 0
+        self._open_move = None
+
+    # Changes the memory cap, evicting old entries if needed
+    # Change le plafond mémoire, en évinçant d'anciennes entrées si nécessaire
+    def set_max_bytes(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._evict()
+
+    # Records an annotation that was just appended to the list
+    # Enregistre une annotation qui vient d'être ajoutée à la liste
+    def record_add(self, annotation):
+        position = len(self.annotations) - 1
+        size = _ENTRY_BYTES + _ANNOTATION_BYTES + _state_bytes(annotation.geometry_state())
+        self._push(_Entry(ADD, annotation, position, self.index.stamp_of(annotation), size))
+
+    # Records an annotation removed from position; stamp is its former AnnotationIndex z-order
+    # Enregistre une annotation retirée de position ; stamp est son ancien ordre z dans AnnotationIndex
+    def record_remove(self, annotation, position, stamp):
+        size = _ENTRY_BYTES + _ANNOTATION_BYTES + _state_bytes(annotation.geometry_state())
+        self._push(_Entry(REMOVE, annotation, position, stamp, size))
+
+    # Records the removal of every annotation; removed is the former list in drawing order
+    # and stamps their former AnnotationIndex z-orders
+    # Enregistre la suppression de toutes les annotations ; removed est l'ancienne liste dans l'ordre
+    # de dessin et stamps leurs anciens ordres z dans AnnotationIndex
+    def record_clear(self, removed, stamps):
+        size = _ENTRY_BYTES + sum(
+            _ANNOTATION_BYTES + _state_bytes(annotation.geometry_state())
+            for annotation in removed
+        )
+        self._push(_Entry(CLEAR, removed, stamps, None, size))
+
+    # Records a translation; the deltas of one drag are summed into a single entry
+    # Enregistre une translation ; les deltas d'un même glissement sont additionnés en une seule entrée
+    def record_move(self, annotation, dx, dy):
+        entry = self._open_move
+        if entry is not None and entry.target is annotation and self._undo and self._undo[-1] is entry:
+            entry.before = (entry.before[0] + dx, entry.before[1] + dy)
+            return
+        entry = _Entry(MOVE, annotation, (dx, dy), None, _ENTRY_BYTES)
+        self._push(entry)
+        self._open_move = entry
+
+    # Records a resize from the geometry_state taken before the drag to the current one
+    # Enregistre un redimensionnement entre le geometry_state pris avant le glissement et l'actuel
+    def record_resize(self, annotation, before):
+        after = annotation.geometry_state()
+        if _same_state(before, after):
+            return
+        size = _ENTRY_BYTES + _state_bytes(before) + _state_bytes(after)
+        self._push(_Entry(RESIZE, annotation, before, after, size))
+
+    # Ends the drag in progress, so the next move starts a new entry
+    # Termine le glissement en cours, pour que le prochain déplacement commence une nouvelle entrée
+    def end_gesture(self):
+        self._open_move = None
+
+    # Reverts the newest entry; returns False if there is nothing to undo
+    # Annule l'entrée la plus récente ; retourne False s'il n'y a rien à annuler
+    def undo(self):
+        if not self._undo:
+            return False
+        self._open_move = None
+        entry = self._undo.pop()
+        self._apply(entry, undo=True)
+        self._redo.append(entry)
+        return True
+
+    # Replays the newest undone entry; returns False if there is nothing to redo
+    # Rejoue l'entrée annulée la plus récente ; retourne False s'il n'y a rien à rétablir
+    def redo(self):
+        if not self._redo:
+            return False
+        self._open_move = None
+        entry = self._redo.pop()
+        self._apply(entry, undo=False)
+        self._undo.append(entry)
+        return True
+
+    # Adds a new entry, which discards the redo stack, then enforces the memory cap
+    # Ajoute une nouvelle entrée, ce qui abandonne la pile de rétablissement, puis applique le plafond mémoire
+    def _push(self, entry):
+        for discarded in self._redo:
+            self._bytes -= discarded.size
+        self._redo.clear()
+        self._open_move = None
+        self._undo.append(entry)
+        self._bytes += entry.size
+        self._evict()
+
+    # Drops the oldest entries until the estimate fits, always keeping the newest one
+    # Supprime les entrées les plus anciennes jusqu'à respecter l'estimation, en gardant toujours la plus récente
+    def _evict(self):
+        while self._bytes > self.max_bytes and len(self._undo) > 1:
+            self._bytes -= self._undo.popleft().size
+
+    # Applies an entry in either direction; every kind but CLEAR costs O(1) in the number
+    # of points and, at the end of the list, in the number of annotations
+    # Applique une entrée dans un sens ou dans l'autre ; chaque type sauf CLEAR coûte O(1) en nombre
+    # de points et, en fin de liste, en nombre d'annotations
+    def _apply(self, entry, undo):
+        annotation = entry.target
+        kind = entry.kind
+        if kind == MOVE:
+            dx, dy = entry.before
+            if undo:
+                dx, dy = -dx, -dy
+            annotation.move(dx, dy)
+            self.index.update(annotation)
+        elif kind == RESIZE:
+            annotation.restore_geometry(entry.before if undo else entry.after)
+            self.index.update(annotation)
+        elif kind == CLEAR:
+            if undo:
+                # The former stamps keep older REMOVE entries in their z-order
+                # Les anciens ordres z gardent les entrées REMOVE plus anciennes à leur place
+                self.annotations[:] = annotation
+                for removed, stamp in zip(annotation, entry.before):
+                    self.index.add(removed, stamp)
+            else:
+                self.annotations.clear()
+                self.index.clear()
+        elif (kind == ADD) == undo:
+            # Undoing an add or redoing a remove takes the annotation out of the list
+            # Annuler un ajout ou rétablir une suppression retire l'annotation de la liste
+            del self.annotations[entry.before]
+            self.index.remove(annotation)
+        else:
+            self.annotations.insert(entry.before, annotation)
+            self.index.add(annotation, entry.after)
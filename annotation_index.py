@@ -0,0 +1,162 @@
+import math
+
+# Uniform grid over annotation bounding boxes for fast hit-testing
+# Grille uniforme sur les boîtes englobantes des annotations pour un test de collision rapide
+class AnnotationIndex:
+    def __init__(self, cell_size=128):
+        """
+        Initializes an empty AnnotationIndex.
+        Initialise un AnnotationIndex vide.
+
+        Args:
+            cell_size (int): Size of a grid cell in image pixels.
+                             Taille d'une cellule de la grille en pixels d'image.
+        """
+        self.cell_size = cell_size
+        self._cells = {}  # (column, row) -> set of annotation ids / (colonne, ligne) -> ensemble d'identifiants d'annotations
+        self._entries = {}  # id -> [annotation, z-order stamp, cells] / id -> [annotation, ordre z, cellules]
+        self._unbounded = set()  # Annotations without a bounding box / Annotations sans boîte englobante
+        self._next_stamp = 0  # Increases with every add, so it follows the list order / Augmente à chaque ajout, suit donc l'ordre de la liste
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """
+        Removes every annotation from the index.
+        Supprime toutes les annotations de l'index.
+        """
+        self._cells.clear()
+        self._entries.clear()
+        self._unbounded.clear()
+
+    def rebuild(self, annotations):
+        """
+        Rebuilds the index from a list of annotations in drawing order.
+        Reconstruit l'index à partir d'une liste d'annotations dans l'ordre de dessin.
+        """
+        self.clear()
+        for annotation in annotations:
+            self.add(annotation)
+
+    def add(self, annotation, stamp=None):
+        """
+        Adds an annotation on top of the others (annotations are appended to the list).
+        Ajoute une annotation au-dessus des autres (les annotations sont ajoutées en fin de liste).
+
+        Args:
+            annotation (Annotation): The annotation to index.
+                                     L'annotation à indexer.
+            stamp (int): z-order stamp returned by stamp_of, to put a removed annotation back
+                         at its former place in the list instead of on top.
+                         Ordre z retourné par stamp_of, pour remettre une annotation supprimée
+                         à son ancienne place dans la liste plutôt qu'au-dessus.
+        """
+        key = id(annotation)
+        if key in self._entries:
+            self.remove(annotation)
+        if stamp is None:
+            stamp = self._next_stamp
+            self._next_stamp += 1
+        self._entries[key] = [annotation, stamp, ()]
+        self._insert(key)
+
+    def remove(self, annotation):
+        """
+        Removes an annotation from the index; unknown annotations are ignored.
+        Supprime une annotation de l'index ; les annotations inconnues sont ignorées.
+        """
+        key = id(annotation)
+        if key not in self._entries:
+            return
+        self._discard(key)
+        del self._entries[key]
+
+    def stamp_of(self, annotation):
+        """
+        Returns the z-order stamp of an indexed annotation, or None.
+        Retourne l'ordre z d'une annotation indexée, ou None.
+        """
+        entry = self._entries.get(id(annotation))
+        return entry[1] if entry is not None else None
+
+    def update(self, annotation):
+        """
+        Re-buckets an annotation after it was moved or resized, keeping its z-order.
+        Replace une annotation dans la grille après un déplacement ou un redimensionnement, en gardant son ordre z.
+        """
+        key = id(annotation)
+        if key not in self._entries:
+            self.add(annotation)
+            return
+        self._discard(key)
+        self._insert(key)
+
+    def hit_test(self, point):
+        """
+        Returns the topmost annotation under a point, testing only the annotations
+        whose grid cell contains the point.
+        Retourne l'annotation la plus haute sous un point, en ne testant que les annotations
+        dont la cellule de la grille contient le point.
+
+        Args:
+            point (tuple): (x, y) coordinates in image space.
+                           Coordonnées (x, y) dans l'espace de l'image.
+
+        Returns:
+            Annotation: The topmost hit, or None.
+                        L'annotation touchée la plus haute, ou Aucun.
+        """
+        cell = (
+            math.floor(point[0] / self.cell_size),
+            math.floor(point[1] / self.cell_size),
+        )
+        candidates = self._cells.get(cell, set()) | self._unbounded
+        # Highest stamp first, as reversed(self.annotations) did
+        # Ordre z décroissant, comme le faisait reversed(self.annotations)
+        for key in sorted(candidates, key=lambda k: self._entries[k][1], reverse=True):
+            annotation = self._entries[key][0]
+            if annotation.is_point_inside(point):
+                return annotation
+        return None
+
+    def _insert(self, key):
+        """
+        Puts an indexed annotation into the cells covered by its bounding box, grown by
+        the selection tolerance of the annotation classes.
+        Place une annotation indexée dans les cellules couvertes par sa boîte englobante,
+        agrandie de la tolérance de sélection des classes d'annotation.
+        """
+        entry = self._entries[key]
+        bbox = entry[0].get_bounding_box()
+        if bbox is None:
+            self._unbounded.add(key)
+            return
+        margin = getattr(entry[0], "thickness", 2) + 10
+        first_column = math.floor((bbox[0] - margin) / self.cell_size)
+        first_row = math.floor((bbox[1] - margin) / self.cell_size)
+        last_column = math.floor((bbox[2] + margin) / self.cell_size)
+        last_row = math.floor((bbox[3] + margin) / self.cell_size)
+        cells = [
+            (column, row)
+            for column in range(first_column, last_column + 1)
+            for row in range(first_row, last_row + 1)
+        ]
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(key)
+        entry[2] = cells
+
+    def _discard(self, key):
+        """
+        Takes an indexed annotation out of its cells.
+        Retire une annotation indexée de ses cellules.
+        """
+        self._unbounded.discard(key)
+        entry = self._entries[key]
+        for cell in entry[2]:
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._cells[cell]
+        entry[2] = ()
@@ -5,6 +5,20 @@ from PIL import ImageDraw, ImageFont # Import for PIL drawing
 # Base class for all annotations
 # Classe de base pour toutes les annotations
 class Annotation:
+    # Slots instead of a per-instance dict keep long sessions with many annotations compact
+    # Des slots au lieu d'un dictionnaire par instance gardent compactes les longues sessions avec beaucoup d'annotations
+    __slots__ = ("color", "thickness", "_bbox", "_handles")
+
+    # False for annotations that must be drawn on every frame instead of a cached BGRA overlay
+    # Faux pour les annotations qui doivent être dessinées sur chaque trame au lieu d'une superposition BGRA en cache
+    overlay_cacheable = True
+
+    # Attributes changed by resize, saved and restored by the undo history; move and resize
+    # must assign them new values rather than modify them in place
+    # Attributs modifiés par resize, sauvegardés et restaurés par l'historique d'annulation ; move
+    # et resize doivent leur affecter de nouvelles valeurs plutôt que les modifier sur place
+    _handle_fields = ()
+
     def __init__(self, color, thickness=2):
         """
         Initializes an Annotation object.
@@ -16,9 +30,17 @@ class Annotation:
             thickness (int): Thickness of the annotation line.
                              Épaisseur de la ligne de l'annotation.
         """
+        self._bbox = None # Cached bounding box / Boîte englobante en cache
+        self._handles = None # Cached resize handles / Poignées de redimensionnement en cache
         self.color = color  # BGR format for OpenCV / Format BGR pour OpenCV
         self.thickness = thickness # Épaisseur de l'annotation
 
+    # Drops the cached bounding box and handles; called by every method changing the geometry
+    # Efface la boîte englobante et les poignées en cache ; appelé par chaque méthode modifiant la géométrie
+    def _geometry_changed(self):
+        self._bbox = None
+        self._handles = None
+
     def draw(self, frame):
         """
         Draws the annotation on the given OpenCV frame.
@@ -28,6 +50,25 @@ class Annotation:
         """
         pass
 
+    def color_for(self, frame):
+        """
+        Returns the drawing color for a frame. On BGRA overlay layers the alpha channel is
+        set to opaque, so the drawn pixels also mark their coverage.
+        Retourne la couleur de dessin pour un cadre. Sur les couches de superposition BGRA, le
+        canal alpha est mis à opaque, pour que les pixels dessinés marquent aussi leur couverture.
+
+        Args:
+            frame (numpy.ndarray): BGR frame or BGRA layer to draw on.
+                                   Cadre BGR ou couche BGRA sur lequel dessiner.
+
+        Returns:
+            tuple: BGR or BGRA color tuple.
+                   Tuple de couleur BGR ou BGRA.
+        """
+        if frame.ndim == 3 and frame.shape[2] == 4:
+            return tuple(self.color[:3]) + (255,)
+        return self.color
+
     def draw_pil(self, draw_obj):
         """
         Draws the annotation using PIL ImageDraw object.
@@ -71,32 +112,77 @@ class Annotation:
 
     def get_bounding_box(self):
         """
-        Returns the bounding box of the annotation (x1, y1, x2, y2).
-        This method should be overridden by subclasses.
-        Retourne la boîte englobante de l'annotation (x1, y1, x2, y2).
-        Cette méthode doit être surchargée par les sous-classes.
+        Returns the bounding box of the annotation (x1, y1, x2, y2), cached until move,
+        resize or restore_geometry changes the geometry.
+        Retourne la boîte englobante de l'annotation (x1, y1, x2, y2), mise en cache
+        jusqu'à ce que move, resize ou restore_geometry modifie la géométrie.
 
         Returns:
             tuple: (x1, y1, x2, y2) coordinates of the bounding box, or None.
                    Coordonnées (x1, y1, x2, y2) de la boîte englobante, ou Aucun.
         """
-        return None
+        if self._bbox is None:
+            self._bbox = self._compute_bounding_box()
+        return self._bbox
 
     def get_resize_handles(self):
         """
-        Returns a dictionary of resize handles for the annotation.
-        Each handle is a (name, point) tuple.
-        This method should be overridden by subclasses.
-        Retourne un dictionnaire de poignées de redimensionnement pour l'annotation.
-        Chaque poignée est un tuple (nom, point).
-        Cette méthode doit être surchargée par les sous-classes.
+        Returns a dictionary of resize handles for the annotation, cached like the
+        bounding box. The dictionary is shared and must not be modified.
+        Retourne un dictionnaire de poignées de redimensionnement pour l'annotation, mis en
+        cache comme la boîte englobante. Le dictionnaire est partagé et ne doit pas être modifié.
 
         Returns:
             dict: Dictionary of handle names to their (x, y) coordinates.
                   Dictionnaire des noms de poignées et de leurs coordonnées (x, y).
         """
+        if self._handles is None:
+            self._handles = self._compute_resize_handles()
+        return self._handles
+
+    def _compute_bounding_box(self):
+        """
+        Computes the bounding box (x1, y1, x2, y2), or None.
+        This method should be overridden by subclasses.
+        Calcule la boîte englobante (x1, y1, x2, y2), ou Aucun.
+        Cette méthode doit être surchargée par les sous-classes.
+        """
+        return None
+
+    def _compute_resize_handles(self):
+        """
+        Computes the resize handles as a dictionary of names to (x, y) points.
+        This method should be overridden by subclasses.
+        Calcule les poignées de redimensionnement sous forme de dictionnaire de noms vers des points (x, y).
+        Cette méthode doit être surchargée par les sous-classes.
+        """
         return {}
 
+    def geometry_state(self):
+        """
+        Returns the values of the attributes changed by resize, to undo a resize later.
+        Retourne les valeurs des attributs modifiés par resize, pour annuler un redimensionnement plus tard.
+
+        Returns:
+            tuple: Values of _handle_fields, shared with the annotation rather than copied,
+                   followed by the bounding box.
+                   Valeurs de _handle_fields, partagées avec l'annotation plutôt que copiées,
+                   suivies de la boîte englobante.
+        """
+        return tuple(getattr(self, name) for name in self._handle_fields) + (
+            self.get_bounding_box(),
+        )
+
+    def restore_geometry(self, state):
+        """
+        Restores values returned by geometry_state, without recomputing the bounding box.
+        Restaure des valeurs retournées par geometry_state, sans recalculer la boîte englobante.
+        """
+        for name, value in zip(self._handle_fields, state):
+            setattr(self, name, value)
+        self._handles = None
+        self._bbox = state[-1]
+
     def resize(self, handle, current_mouse_point, initial_drag_point):
         """
         Resizes the annotation based on the dragged handle and mouse movement.
@@ -117,6 +203,9 @@ class Annotation:
 # Line annotation class
 # Classe d'annotation de ligne
 class LineAnnotation(Annotation):
+    __slots__ = ("start_point", "end_point")
+    _handle_fields = ("start_point", "end_point")
+
     def __init__(self, start_point, end_point, color, thickness=2):
         """
         Initializes a LineAnnotation object.
@@ -141,7 +230,7 @@ class LineAnnotation(Annotation):
         Draws the line on the OpenCV frame.
         Dessine la ligne sur le cadre OpenCV.
         """
-        cv2.line(frame, self.start_point, self.end_point, self.color, self.thickness)
+        cv2.line(frame, self.start_point, self.end_point, self.color_for(frame), self.thickness)
 
     def is_point_inside(self, point):
         """
@@ -176,8 +265,9 @@ class LineAnnotation(Annotation):
         """
         self.start_point = (int(self.start_point[0] + dx), int(self.start_point[1] + dy))
         self.end_point = (int(self.end_point[0] + dx), int(self.end_point[1] + dy))
+        self._geometry_changed()
 
-    def get_bounding_box(self):
+    def _compute_bounding_box(self):
         """
         Returns the bounding box of the line.
         Retourne la boîte englobante de la ligne.
@@ -186,7 +276,7 @@ class LineAnnotation(Annotation):
         x2, y2 = self.end_point
         return (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
 
-    def get_resize_handles(self):
+    def _compute_resize_handles(self):
         """
         Returns resize handles at the start and end points of the line.
         Retourne les poignées de redimensionnement aux points de début et de fin de la ligne.
@@ -202,10 +292,14 @@ class LineAnnotation(Annotation):
             self.start_point = current_mouse_point
         elif handle == "end":
             self.end_point = current_mouse_point
+        self._geometry_changed()
 
 # Rectangle annotation class
 # Classe d'annotation de rectangle
 class RectangleAnnotation(Annotation):
+    __slots__ = ("p1", "p2", "filled")
+    _handle_fields = ("p1", "p2")
+
     def __init__(self, p1, p2, color, thickness=2, filled=False):
         """
         Initializes a RectangleAnnotation object.
@@ -234,9 +328,9 @@ class RectangleAnnotation(Annotation):
         Dessine le rectangle sur le cadre OpenCV.
         """
         if self.filled:
-            cv2.rectangle(frame, self.p1, self.p2, self.color, -1) # -1 for filled rectangle / -1 pour un rectangle rempli
+            cv2.rectangle(frame, self.p1, self.p2, self.color_for(frame), -1) # -1 for filled rectangle / -1 pour un rectangle rempli
         else:
-            cv2.rectangle(frame, self.p1, self.p2, self.color, self.thickness)
+            cv2.rectangle(frame, self.p1, self.p2, self.color_for(frame), self.thickness)
 
     def is_point_inside(self, point):
         """
@@ -244,11 +338,9 @@ class RectangleAnnotation(Annotation):
         Vérifie si un point est à l'intérieur ou près de la boîte englobante du rectangle.
         """
         x, y = point
-        x1, y1 = self.p1
-        x2, y2 = self.p2
+        x1, y1, x2, y2 = self.get_bounding_box() # Normalized corners / Coins normalisés
         margin = 5 # Add a small margin for easier selection / Ajoute une petite marge pour une sélection plus facile
-        return min(x1, x2) - margin <= x <= max(x1, x2) + margin and \
-               min(y1, y2) - margin <= y <= max(y1, y2) + margin
+        return x1 - margin <= x <= x2 + margin and y1 - margin <= y <= y2 + margin
 
     def move(self, dx, dy):
         """
@@ -257,8 +349,9 @@ class RectangleAnnotation(Annotation):
         """
         self.p1 = (int(self.p1[0] + dx), int(self.p1[1] + dy))
         self.p2 = (int(self.p2[0] + dx), int(self.p2[1] + dy))
+        self._geometry_changed()
 
-    def get_bounding_box(self):
+    def _compute_bounding_box(self):
         """
         Returns the bounding box of the rectangle.
         Retourne la boîte englobante du rectangle.
@@ -267,7 +360,7 @@ class RectangleAnnotation(Annotation):
         x2, y2 = self.p2
         return (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
 
-    def get_resize_handles(self):
+    def _compute_resize_handles(self):
         """
         Returns resize handles at the four corners of the rectangle's bounding box.
         Retourne les poignées de redimensionnement aux quatre coins de la boîte englobante du rectangle.
@@ -308,10 +401,14 @@ class RectangleAnnotation(Annotation):
 
         self.p1 = (int(new_x1), int(new_y1))
         self.p2 = (int(new_x2), int(new_y2))
+        self._geometry_changed()
 
 # Circle annotation class
 # Classe d'annotation de cercle
 class CircleAnnotation(Annotation):
+    __slots__ = ("center", "radius", "filled")
+    _handle_fields = ("center", "radius")
+
     def __init__(self, center, radius, color=(0, 0, 255), thickness=2, filled=False):
         """
         Initializes a CircleAnnotation object.
@@ -340,9 +437,9 @@ class CircleAnnotation(Annotation):
         Dessine le cercle sur le cadre OpenCV.
         """
         if self.filled:
-            cv2.circle(frame, self.center, self.radius, self.color, -1) # -1 for filled circle / -1 pour un cercle rempli
+            cv2.circle(frame, self.center, self.radius, self.color_for(frame), -1) # -1 for filled circle / -1 pour un cercle rempli
         else:
-            cv2.circle(frame, self.center, self.radius, self.color, self.thickness)
+            cv2.circle(frame, self.center, self.radius, self.color_for(frame), self.thickness)
 
     def is_point_inside(self, point):
         """
@@ -358,8 +455,9 @@ class CircleAnnotation(Annotation):
         Déplace le cercle en mettant à jour son point central.
         """
         self.center = (int(self.center[0] + dx), int(self.center[1] + dy))
+        self._geometry_changed()
 
-    def get_bounding_box(self):
+    def _compute_bounding_box(self):
         """
         Returns the bounding box of the circle.
         Retourne la boîte englobante du cercle.
@@ -367,7 +465,7 @@ class CircleAnnotation(Annotation):
         x, y = self.center
         return (x - self.radius, y - self.radius, x + self.radius, y + self.radius)
 
-    def get_resize_handles(self):
+    def _compute_resize_handles(self):
         """
         Returns resize handles at cardinal points and corners of the bounding box.
         Retourne les poignées de redimensionnement aux points cardinaux et aux coins de la boîte englobante.
@@ -394,18 +492,75 @@ class CircleAnnotation(Annotation):
         # Le nouveau rayon est la distance du centre à la position actuelle de la souris.
         new_radius = np.sqrt((current_mouse_point[0] - self.center[0])**2 + (current_mouse_point[1] - self.center[1])**2)
         self.radius = int(new_radius)
+        self._geometry_changed()
+
+# Simplifies a polyline with the Ramer-Douglas-Peucker algorithm
+# Simplifie une polyligne avec l'algorithme de Ramer-Douglas-Peucker
+def simplify_stroke(points, tolerance):
+    """
+    Removes the points of a freehand path that deviate less than tolerance from the
+    simplified path. The first and last points are always kept.
+    Supprime les points d'un chemin à main levée qui s'écartent de moins de tolerance du
+    chemin simplifié. Le premier et le dernier point sont toujours conservés.
+
+    Args:
+        points (list or numpy.ndarray): (x, y) points of the path.
+                                        Points (x, y) du chemin.
+        tolerance (float): Maximum allowed deviation in image pixels.
+                           Écart maximal autorisé en pixels d'image.
+
+    Returns:
+        numpy.ndarray: The kept points as an int32 (M, 2) array.
+                       Les points conservés dans un tableau int32 (M, 2).
+    """
+    points = np.asarray(points, dtype=np.int32).reshape(-1, 2)
+    if len(points) < 3 or tolerance <= 0:
+        return points
+    coords = points.astype(np.float64)
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    tolerance_sq = tolerance * tolerance
+    # Explicit stack instead of recursion, so long strokes cannot exceed the recursion limit
+    # Pile explicite au lieu de la récursion, pour que les longs tracés ne dépassent pas la limite de récursion
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        start = coords[first]
+        chord = coords[last] - start
+        offsets = coords[first + 1:last] - start
+        chord_sq = chord @ chord
+        if chord_sq > 0:
+            # Distance to the chord segment (not the infinite line) handles closed loops
+            # La distance au segment (et non à la droite) gère les boucles fermées
+            t = np.clip(offsets @ chord / chord_sq, 0.0, 1.0)
+            deviations = offsets - t[:, None] * chord
+        else:
+            deviations = offsets
+        distances = np.einsum("ij,ij->i", deviations, deviations)
+        farthest = int(distances.argmax())
+        if distances[farthest] > tolerance_sq:
+            split = first + 1 + farthest
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return points[keep]
 
 # Freehand drawing annotation class
 # Classe d'annotation de dessin à main levée
 class FreeDrawAnnotation(Annotation):
+    __slots__ = ("_points",)
+    _handle_fields = ("_points",)
+
     def __init__(self, points, color, thickness=2):
         """
         Initializes a FreeDrawAnnotation object.
         Initialise un objet FreeDrawAnnotation.
 
         Args:
-            points (list): List of (x, y) tuples representing the drawn path.
-                           Liste de tuples (x, y) représentant le chemin dessiné.
+            points (list or numpy.ndarray): (x, y) points of the drawn path, stored as an int32 (N, 2) array.
+                                            Points (x, y) du chemin dessiné, stockés dans un tableau int32 (N, 2).
             color (tuple): BGR color tuple.
                            Tuple de couleur BGR.
             thickness (int): Thickness of the drawn line.
@@ -414,44 +569,83 @@ class FreeDrawAnnotation(Annotation):
         super().__init__(color, thickness)
         self.points = points
 
+    @property
+    def points(self):
+        """
+        Contiguous int32 (N, 2) array of the path points.
+        Tableau int32 (N, 2) contigu des points du chemin.
+        """
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        self._points = np.ascontiguousarray(points, dtype=np.int32).reshape(-1, 2)
+        self._geometry_changed()
+
     def draw(self, frame):
         """
-        Draws the freehand path by connecting all points with lines.
-        Dessine le chemin à main levée en connectant tous les points avec des lignes.
+        Draws the freehand path with a single polyline call.
+        Dessine le chemin à main levée en un seul appel de polyligne.
         """
-        for i in range(1, len(self.points)):
-            cv2.line(frame, self.points[i-1], self.points[i], self.color, self.thickness)
+        if len(self._points) > 1:
+            cv2.polylines(frame, [self._points], False, self.color_for(frame), self.thickness)
 
     def is_point_inside(self, point):
         """
         Checks if a point is near any segment of the freehand drawing.
         Vérifie si un point est proche d'un segment du dessin à main levée.
         """
-        for i in range(len(self.points) - 1):
-            line_segment = LineAnnotation(self.points[i], self.points[i+1], self.color, self.thickness)
-            if line_segment.is_point_inside(point):
-                return True
-        return False
+        if len(self._points) < 2:
+            return False
+        tolerance = self.thickness + 10 # Same tolerance as LineAnnotation / Même tolérance que LineAnnotation
+        x1, y1, x2, y2 = self.get_bounding_box()
+        x, y = point
+        if not (x1 - tolerance <= x <= x2 + tolerance and y1 - tolerance <= y <= y2 + tolerance):
+            return False
+
+        # Distance from the point to every segment at once
+        # Distance du point à tous les segments à la fois
+        starts = self._points[:-1].astype(np.float64)
+        segments = self._points[1:] - starts
+        offsets = np.array(point, dtype=np.float64) - starts
+        lengths = np.einsum("ij,ij->i", segments, segments)
+        projections = np.einsum("ij,ij->i", offsets, segments)
+        # Position of the closest point along each segment, 0 for zero-length segments
+        # Position du point le plus proche sur chaque segment, 0 pour les segments de longueur nulle
+        t = np.clip(np.divide(projections, lengths, out=np.zeros_like(lengths), where=lengths > 0), 0.0, 1.0)
+        closest = offsets - segments * t[:, None]
+        distances = np.einsum("ij,ij->i", closest, closest)
+        return bool(distances.min() <= tolerance * tolerance)
 
     def move(self, dx, dy):
         """
         Moves the freehand drawing by translating all its points.
         Déplace le dessin à main levée en translatant tous ses points.
         """
-        self.points = [(int(p[0] + dx), int(p[1] + dy)) for p in self.points]
+        offset = np.array((int(dx), int(dy)), dtype=np.int32)
+        bbox = self._bbox
+        # A new array, since geometry_state snapshots share the current one
+        # Un nouveau tableau, car les instantanés de geometry_state partagent l'actuel
+        self._points = self._points + offset
+        self._geometry_changed()
+        if bbox is not None:
+            # Shifting the box is cheaper than scanning the points again
+            # Décaler la boîte coûte moins cher que de parcourir à nouveau les points
+            x1, y1, x2, y2 = bbox
+            self._bbox = (x1 + int(dx), y1 + int(dy), x2 + int(dx), y2 + int(dy))
 
-    def get_bounding_box(self):
+    def _compute_bounding_box(self):
         """
         Returns the bounding box of the freehand drawing.
         Retourne la boîte englobante du dessin à main levée.
         """
-        if not self.points:
+        if not len(self._points):
             return None
-        x_coords = [p[0] for p in self.points]
-        y_coords = [p[1] for p in self.points]
-        return (min(x_coords), min(y_coords), max(x_coords), max(y_coords))
+        x1, y1 = self._points.min(axis=0)
+        x2, y2 = self._points.max(axis=0)
+        return (int(x1), int(y1), int(x2), int(y2))
 
-    def get_resize_handles(self):
+    def _compute_resize_handles(self):
         """
         Returns resize handles at the corners of the freehand drawing's bounding box.
         Retourne les poignées de redimensionnement aux coins de la boîte englobante du dessin à main levée.
@@ -498,31 +692,21 @@ class FreeDrawAnnotation(Annotation):
         new_w = max(1, new_x2 - new_x1) # Ensure minimum width/height of 1 to avoid division by zero
         new_h = max(1, new_y2 - new_y1) # Assure une largeur/hauteur minimale de 1 pour éviter la division par zéro
 
-        scale_x = new_w / orig_w
-        scale_y = new_h / orig_h
-
-        # Apply scaling and translation to all points
-        # Applique la mise à l'échelle et la translation à tous les points
-        new_points = []
-        for p_x, p_y in self.points:
-            # Translate point relative to the fixed point
-            # Translate le point par rapport au point fixe
-            translated_x = p_x - fixed_x
-            translated_y = p_y - fixed_y
-
-            # Scale
-            # Mise à l'échelle
-            scaled_x = translated_x * scale_x
-            scaled_y = translated_y * scale_y
-
-            # Translate back from the fixed point to the new position
-            # Translate de nouveau du point fixe à la nouvelle position
-            new_points.append((int(scaled_x + fixed_x), int(scaled_y + fixed_y)))
-        self.points = new_points
+        # Scale all points around the fixed point in one vectorized operation
+        # (astype truncates toward zero like int() did)
+        # Met à l'échelle tous les points autour du point fixe en une opération vectorisée
+        # (astype tronque vers zéro comme le faisait int())
+        fixed = np.array((fixed_x, fixed_y), dtype=np.float64)
+        scale = np.array((new_w / orig_w, new_h / orig_h))
+        self.points = ((self._points - fixed) * scale + fixed).astype(np.int32)
 
 # Text annotation class
 # Classe d'annotation de texte
 class TextAnnotation(Annotation):
+    __slots__ = ("position", "text", "font_size")
+    _handle_fields = ("position", "font_size")
+    overlay_cacheable = False # Anti-aliased edges do not blend correctly over BGRA layers / Les bords lissés ne se mélangent pas correctement sur les couches BGRA
+
     def __init__(self, position, text, font_size=20, color=(0, 0, 255)):
         """
         Initializes a TextAnnotation object.
@@ -551,7 +735,7 @@ class TextAnnotation(Annotation):
         # font_size / 20 is a heuristic to convert font_size to OpenCV's fontScale
         # font_size / 20 est une heuristique pour convertir la taille de police en fontScale d'OpenCV
         cv2.putText(frame, self.text, self.position, cv2.FONT_HERSHEY_SIMPLEX, 
-                    self.font_size / 20, self.color, 2, cv2.LINE_AA)
+                    self.font_size / 20, self.color_for(frame), 2, cv2.LINE_AA)
 
     def is_point_inside(self, point):
         """
@@ -574,8 +758,9 @@ class TextAnnotation(Annotation):
         Déplace le texte en mettant à jour sa position.
         """
         self.position = (int(self.position[0] + dx), int(self.position[1] + dy))
+        self._geometry_changed()
 
-    def get_bounding_box(self):
+    def _compute_bounding_box(self):
         """
         Returns the bounding box of the text.
         Retourne la boîte englobante du texte.
@@ -587,7 +772,7 @@ class TextAnnotation(Annotation):
         # La boîte englobante va de (x1, y1 - text_height) à (x1 + text_width, y1)
         return (x1, y1 - text_height, x1 + text_width, y1)
 
-    def get_resize_handles(self):
+    def _compute_resize_handles(self):
         """
         Returns a single resize handle for text (typically at the bottom-right).
         Retourne une seule poignée de redimensionnement pour le texte (généralement en bas à droite).
@@ -611,11 +796,76 @@ class TextAnnotation(Annotation):
                 # Ensure font size doesn't go below a minimum
                 # S'assure que la taille de police ne descend pas en dessous d'un minimum
                 self.font_size = max(8, int(self.font_size * scale_factor))
+                self._geometry_changed()
+
+# Redaction methods of BlurAnnotation
+# Méthodes de masquage de BlurAnnotation
+REDACTION_GAUSSIAN = "gaussian"  # Gaussian blur / Flou gaussien
+REDACTION_BOX = "box"  # Box blur, constant cost whatever the kernel size / Flou moyen, coût constant quelle que soit la taille du noyau
+REDACTION_PIXELATE = "pixelate"  # Mosaic of flat blocks / Mosaïque de blocs unis
+REDACTION_SOLID = "solid"  # Filled with the annotation color / Rempli avec la couleur de l'annotation
+REDACTION_METHODS = (REDACTION_GAUSSIAN, REDACTION_BOX, REDACTION_PIXELATE, REDACTION_SOLID)
+
+# Regions larger than this many pixels are Gaussian-blurred at reduced resolution
+# Les régions de plus de pixels que cela sont floutées à résolution réduite
+REDACTION_DOWNSCALE_AREA = 160 * 160
+
+# Computes the redacted pixels of a region
+# Calcule les pixels masqués d'une région
+def redact_region(roi, method=REDACTION_GAUSSIAN, strength=25, color=(0, 0, 0)):
+    """
+    Returns a redacted copy of a region; the region itself is not modified.
+    Retourne une copie masquée d'une région ; la région elle-même n'est pas modifiée.
+
+    Args:
+        roi (numpy.ndarray): Pixels of the region.
+                             Pixels de la région.
+        method (str): One of REDACTION_METHODS.
+                      Une des valeurs de REDACTION_METHODS.
+        strength (int): Kernel size of the blurs, twice the block size of the mosaic.
+                        Taille du noyau des flous, double de la taille des blocs de la mosaïque.
+        color (tuple): Fill color of the solid method.
+                       Couleur de remplissage de la méthode pleine.
+
+    Returns:
+        numpy.ndarray: Redacted pixels with the shape of roi.
+                       Pixels masqués de la forme de roi.
+    """
+    h, w = roi.shape[:2]
+    if method == REDACTION_SOLID:
+        return _filled_like(roi, color)
+    if method == REDACTION_PIXELATE:
+        block = max(2, strength // 2)
+        small = cv2.resize(
+            roi, (max(1, w // block), max(1, h // block)), interpolation=cv2.INTER_AREA
+        )
+        return cv2.resize(small, (w, h), interpolation=cv2.INTER_NEAREST)
+    # Ensure the kernel size is odd, as GaussianBlur requires
+    # S'assure que la taille du noyau est impaire, comme l'exige GaussianBlur
+    kernel_size = strength if strength % 2 == 1 else strength + 1
+    if method == REDACTION_BOX:
+        # Running sums over rows then columns: the cost does not grow with the kernel
+        # Sommes glissantes sur les lignes puis les colonnes : le coût ne croît pas avec le noyau
+        return cv2.blur(roi, (kernel_size, kernel_size))
+    factor = kernel_size // 8
+    if factor < 2 or w * h < REDACTION_DOWNSCALE_AREA:
+        return cv2.GaussianBlur(roi, (kernel_size, kernel_size), 0)
+    # Large region: blur a reduced copy with a proportionally smaller kernel, then upsample
+    # Grande région : floute une copie réduite avec un noyau proportionnellement plus petit, puis l'agrandit
+    sigma = 0.3 * ((kernel_size - 1) * 0.5 - 1) + 0.8 # Sigma OpenCV derives from the kernel size / Sigma déduit par OpenCV de la taille du noyau
+    small_kernel = max(3, (kernel_size // factor) | 1)
+    small = cv2.resize(
+        roi, (max(1, w // factor), max(1, h // factor)), interpolation=cv2.INTER_AREA
+    )
+    small = cv2.GaussianBlur(small, (small_kernel, small_kernel), sigma / factor)
+    return cv2.resize(small, (w, h), interpolation=cv2.INTER_LINEAR)
 
 # Blur annotation class (inherits from RectangleAnnotation)
 # Classe d'annotation de flou (hérite de RectangleAnnotation)
 class BlurAnnotation(RectangleAnnotation):
-    def __init__(self, p1, p2, blur_strength=25):
+    __slots__ = ("blur_strength", "method", "_cached")
+
+    def __init__(self, p1, p2, blur_strength=25, method=REDACTION_GAUSSIAN):
         """
         Initializes a BlurAnnotation object.
         Initialise un objet BlurAnnotation.
@@ -625,38 +875,71 @@ class BlurAnnotation(RectangleAnnotation):
                         Coordonnées (x, y) du premier coin de la zone de flou.
             p2 (tuple): (x, y) coordinates of the second corner of the blur area.
                         Coordonnées (x, y) du deuxième coin de la zone de flou.
-            blur_strength (int): Strength of the Gaussian blur (must be odd).
-                                 Force du flou gaussien (doit être impair).
+            blur_strength (int): Kernel size of the blur, or block size of the mosaic.
+                                 Taille du noyau du flou, ou taille des blocs de la mosaïque.
+            method (str): One of REDACTION_METHODS.
+                          Une des valeurs de REDACTION_METHODS.
         """
-        super().__init__(p1, p2, (0,0,0)) # Color is irrelevant for blur, set to black / La couleur est sans importance pour le flou, mise à noir
+        super().__init__(p1, p2, (0,0,0)) # Color is only used by the solid method / La couleur n'est utilisée que par la méthode pleine
         self.blur_strength = blur_strength
+        self.method = method
+        self._cached = None # (key, redacted pixels) of the last cached draw / (clé, pixels masqués) du dernier dessin mis en cache
 
-    def draw(self, frame):
-        """
-        Applies a Gaussian blur to the rectangular region of interest.
-        Applique un flou gaussien à la région d'intérêt rectangulaire.
+    # Blurs are computed from the live pixels below; a solid fill does not depend on them
+    # Les flous sont calculés à partir des pixels sous-jacents ; un remplissage plein n'en dépend pas
+    @property
+    def overlay_cacheable(self):
+        return self.method == REDACTION_SOLID
+
+    def draw(self, frame, sequence=None, below=()):
         """
-        # Ensure points are ordered for ROI extraction
-        # S'assure que les points sont ordonnés pour l'extraction de la ROI
-        x1, y1 = min(self.p1[0], self.p2[0]), min(self.p1[1], self.p2[1])
-        x2, y2 = max(self.p1[0], self.p2[0]), max(self.p1[1], self.p2[1])
-        
-        h, w, _ = frame.shape
+        Redacts the rectangular region of interest with the annotation's method.
+        Masque la région d'intérêt rectangulaire avec la méthode de l'annotation.
+
+        Args:
+            frame (numpy.ndarray): Frame to draw on, modified in place.
+                                   Cadre sur lequel dessiner, modifié sur place.
+            sequence (object): Number identifying the image the frame was copied from, when
+                               its pixels never change (file mode). Only the redacted pixels are
+                               kept, and reused until the sequence, below or the rectangle changes.
+                               Numéro identifiant l'image dont le cadre a été copié, lorsque ses
+                               pixels ne changent jamais (mode fichier). Seuls les pixels masqués
+                               sont gardés, et réutilisés jusqu'à ce que la séquence, below ou le
+                               rectangle change.
+            below (tuple): Description of the annotations drawn under the region, since they
+                           change its pixels (see draw_annotations).
+                           Description des annotations dessinées sous la région, car elles
+                           changent ses pixels (voir draw_annotations).
+        """
+        # Points ordered for ROI extraction, from the cached bounding box
+        # Points ordonnés pour l'extraction de la ROI, à partir de la boîte englobante en cache
+        x1, y1, x2, y2 = self.get_bounding_box()
+
+        h, w = frame.shape[:2]
         # Clamp coordinates to frame boundaries
         # Clampe les coordonnées aux limites du cadre
         x1, y1, x2, y2 = max(0, x1), max(0, y1), min(w, x2), min(h, y2)
-        
+
         if x2 > x1 and y2 > y1: # Ensure valid region / S'assure d'une région valide
             roi = frame[y1:y2, x1:x2]
-            # Ensure blur_strength is odd for GaussianBlur kernel size
-            # S'assure que blur_strength est impair pour la taille du noyau de GaussianBlur
-            kernel_size = self.blur_strength if self.blur_strength % 2 == 1 else self.blur_strength + 1
-            blurred_roi = cv2.GaussianBlur(roi, (kernel_size, kernel_size), 0)
-            frame[y1:y2, x1:x2] = blurred_roi
+            if sequence is None:
+                roi[:] = redact_region(roi, self.method, self.blur_strength, self.color_for(frame))
+                return
+            key = (
+                sequence, (x1, y1, x2, y2), frame.shape, self.method, self.blur_strength, below
+            )
+            if self._cached is None or self._cached[0] != key:
+                self._cached = (
+                    key,
+                    redact_region(roi, self.method, self.blur_strength, self.color_for(frame)),
+                )
+            roi[:] = self._cached[1]
 
 # Arrow annotation class (inherits from LineAnnotation)
 # Classe d'annotation de flèche (hérite de LineAnnotation)
 class ArrowAnnotation(LineAnnotation):
+    __slots__ = ("tip_length",)
+
     def __init__(self, start_point, end_point, color=(0, 0, 255), thickness=2, tip_length=0.3):
         """
         Initializes an ArrowAnnotation object.
@@ -682,11 +965,13 @@ class ArrowAnnotation(LineAnnotation):
         Draws the arrow on the OpenCV frame.
         Dessine la flèche sur le cadre OpenCV.
         """
-        cv2.arrowedLine(frame, self.start_point, self.end_point, self.color, self.thickness, tipLength=self.tip_length)
+        cv2.arrowedLine(frame, self.start_point, self.end_point, self.color_for(frame), self.thickness, tipLength=self.tip_length)
 
 # Highlight annotation class (inherits from RectangleAnnotation)
 # Classe d'annotation de surlignage (hérite de RectangleAnnotation)
 class HighlightAnnotation(RectangleAnnotation):
+    __slots__ = ("opacity",)
+
     def __init__(self, p1, p2, color=(255, 255, 0), opacity=0.3):
         """
         Initializes a HighlightAnnotation object.
@@ -710,20 +995,170 @@ class HighlightAnnotation(RectangleAnnotation):
         Draws a translucent highlight rectangle on the OpenCV frame.
         Dessine un rectangle de surlignage translucide sur le cadre OpenCV.
         """
-        overlay = frame.copy() # Create a copy to draw the highlight on / Crée une copie pour dessiner le surlignage
-        
-        # Ensure points are ordered for rectangle drawing
-        # S'assure que les points sont ordonnés pour le dessin du rectangle
-        x1, y1 = min(self.p1[0], self.p2[0]), min(self.p1[1], self.p2[1])
-        x2, y2 = max(self.p1[0], self.p2[0]), max(self.p1[1], self.p2[1])
-        
-        h, w, _ = frame.shape
+        rect = self.clamped_rect(frame)
+        if rect is not None:
+            blend_rectangles(frame, [rect], self.color_for(frame), self.opacity)
+
+    def clamped_rect(self, frame):
+        """
+        Returns the highlight area clamped to the frame as inclusive (x1, y1, x2, y2)
+        coordinates, as filled by cv2.rectangle, or None if it is empty.
+        Retourne la zone de surlignage limitée au cadre en coordonnées inclusives
+        (x1, y1, x2, y2), telle que remplie par cv2.rectangle, ou None si elle est vide.
+        """
+        # Points ordered for rectangle drawing, from the cached bounding box
+        # Points ordonnés pour le dessin du rectangle, à partir de la boîte englobante en cache
+        x1, y1, x2, y2 = self.get_bounding_box()
+
+        h, w = frame.shape[:2]
         # Clamp coordinates to frame boundaries
         # Clampe les coordonnées aux limites du cadre
         x1, y1, x2, y2 = max(0, x1), max(0, y1), min(w, x2), min(h, y2)
-        
-        if x2 > x1 and y2 > y1: # Ensure valid region / S'assure d'une région valide
-            cv2.rectangle(overlay, (x1, y1), (x2, y2), self.color, -1) # Draw filled rectangle on overlay / Dessine un rectangle rempli sur la superposition
-            # Blend the overlay with the original frame based on opacity
-            # Mélange la superposition avec le cadre original en fonction de l'opacité
-            cv2.addWeighted(overlay, self.opacity, frame, 1 - self.opacity, 0, frame)
\ No newline at end of file
+        if x2 <= x1 or y2 <= y1:
+            return None # Empty or off-frame highlight / Surlignage vide ou hors du cadre
+        # cv2.rectangle fills the far edge too, when it is inside the frame
+        # cv2.rectangle remplit aussi le bord opposé, s'il est dans le cadre
+        return int(x1), int(y1), int(min(x2, w - 1)), int(min(y2, h - 1))
+
+
+# Blends a constant color into rectangles of a frame, touching only the pixels they cover
+# Mélange une couleur constante dans des rectangles d'un cadre, en ne touchant que les pixels couverts
+def blend_rectangles(frame, rects, color, opacity):
+    """
+    Blends color over the union of rectangles in one pass per group of overlapping
+    rectangles, so overlapping areas are blended once and the cost follows their area.
+    Mélange la couleur sur l'union des rectangles en une passe par groupe de rectangles
+    qui se chevauchent, pour que les zones communes soient mélangées une seule fois et
+    que le coût suive leur surface.
+
+    Args:
+        frame (numpy.ndarray): Frame to draw on, modified in place.
+                               Cadre sur lequel dessiner, modifié sur place.
+        rects (list): Inclusive (x1, y1, x2, y2) rectangles inside the frame.
+                      Rectangles inclusifs (x1, y1, x2, y2) à l'intérieur du cadre.
+        color (tuple): Color with one value per frame channel.
+                       Couleur avec une valeur par canal du cadre.
+        opacity (float): Opacity of the color (0.0 to 1.0).
+                         Opacité de la couleur (0.0 à 1.0).
+    """
+    for (x1, y1, x2, y2), members in _group_overlapping(rects):
+        roi = frame[y1:y2 + 1, x1:x2 + 1]
+        fill = _filled_like(roi, color)
+        if len(members) == 1:
+            cv2.addWeighted(fill, opacity, roi, 1 - opacity, 0, dst=roi)
+            continue
+        mask = np.zeros(roi.shape[:2], dtype=np.uint8)
+        for mx1, my1, mx2, my2 in members:
+            mask[my1 - y1:my2 - y1 + 1, mx1 - x1:mx2 - x1 + 1] = 255
+        blended = cv2.addWeighted(fill, opacity, roi, 1 - opacity, 0)
+        cv2.copyTo(blended, mask, roi)
+
+
+# Returns an array shaped like image and filled with color
+# Retourne un tableau de la forme de image rempli avec color
+def _filled_like(image, color):
+    filled = np.empty_like(image)
+    # Much faster than broadcasting a per-channel tuple with numpy
+    # Beaucoup plus rapide que la diffusion d'un tuple par canal avec numpy
+    cv2.rectangle(filled, (0, 0), (image.shape[1], image.shape[0]), color, -1)
+    return filled
+
+
+# Groups rectangles whose bounds overlap, returning (union bounds, members) pairs
+# Regroupe les rectangles dont les limites se chevauchent, en retournant des paires (limites de l'union, membres)
+def _group_overlapping(rects):
+    groups = []
+    for rect in rects:
+        bounds, members = rect, [rect]
+        merged = True
+        while merged:
+            # A grown group can reach groups it did not overlap before
+            # Un groupe agrandi peut atteindre des groupes qu'il ne chevauchait pas avant
+            merged = False
+            remaining = []
+            for other_bounds, other_members in groups:
+                if (other_bounds[0] <= bounds[2] and bounds[0] <= other_bounds[2]
+                        and other_bounds[1] <= bounds[3] and bounds[1] <= other_bounds[3]):
+                    bounds = (
+                        min(bounds[0], other_bounds[0]),
+                        min(bounds[1], other_bounds[1]),
+                        max(bounds[2], other_bounds[2]),
+                        max(bounds[3], other_bounds[3]),
+                    )
+                    members += other_members
+                    merged = True
+                else:
+                    remaining.append((other_bounds, other_members))
+            groups = remaining
+        groups.append((bounds, members))
+    return groups
+
+
+# Pixels an annotation can draw outside its bounding box besides its thickness (estimated text
+# sizes, line caps)
+# Pixels qu'une annotation peut dessiner hors de sa boîte englobante en plus de son épaisseur
+# (tailles de texte estimées, extrémités des lignes)
+_DRAW_MARGIN = 16
+
+
+# True if two (x1, y1, x2, y2) boxes come within margin pixels; None stands for an empty box
+# Vrai si deux boîtes (x1, y1, x2, y2) sont à moins de margin pixels ; None représente une boîte vide
+def _overlaps(a, b, margin):
+    if a is None or b is None:
+        return False
+    return (
+        a[0] - margin <= b[2] and b[0] <= a[2] + margin
+        and a[1] - margin <= b[3] and b[1] <= a[3] + margin
+    )
+
+
+# Draws annotations in order, merging consecutive highlights of the same color and opacity
+# Dessine les annotations dans l'ordre, en fusionnant les surlignages consécutifs de même couleur et opacité
+def draw_annotations(frame, annotations, sequence=None):
+    """
+    Draws a list of annotations like calling draw on each of them, except that
+    consecutive highlights sharing a color and an opacity are blended in one pass,
+    so their overlaps are not darkened twice.
+    Dessine une liste d'annotations comme en appelant draw sur chacune, sauf que les
+    surlignages consécutifs de même couleur et opacité sont mélangés en une passe,
+    pour que leurs chevauchements ne soient pas assombris deux fois.
+
+    Args:
+        sequence (object): Number identifying a static image the frame was copied from,
+                           passed to the blurs so they can reuse their redacted pixels (see
+                           BlurAnnotation.draw).
+                           Numéro identifiant une image statique dont le cadre a été copié,
+                           transmis aux flous pour qu'ils réutilisent leurs pixels masqués
+                           (voir BlurAnnotation.draw).
+    """
+    batch_key, rects = None, []
+    drawn = []  # (id, bounding box, color, thickness) of the annotations drawn so far, with a sequence / (id, boîte englobante, couleur, épaisseur) des annotations déjà dessinées, avec une séquence
+    for annotation in annotations:
+        if sequence is not None:
+            bbox = annotation.get_bounding_box()
+            if isinstance(annotation, BlurAnnotation):
+                below = tuple(
+                    entry for entry in drawn
+                    if _overlaps(entry[1], bbox, entry[3] + _DRAW_MARGIN)
+                )
+            drawn.append((id(annotation), bbox, annotation.color, annotation.thickness))
+        if type(annotation) is HighlightAnnotation:
+            key = (annotation.color_for(frame), annotation.opacity)
+            if key != batch_key and rects:
+                blend_rectangles(frame, rects, *batch_key)
+                rects = []
+            batch_key = key
+            rect = annotation.clamped_rect(frame)
+            if rect is not None:
+                rects.append(rect)
+            continue
+        if rects:
+            blend_rectangles(frame, rects, *batch_key)
+            rects = []
+        batch_key = None
+        if sequence is not None and isinstance(annotation, BlurAnnotation):
+            annotation.draw(frame, sequence, below)
+        else:
+            annotation.draw(frame)
+    if rects:
+        blend_rectangles(frame, rects, *batch_key)
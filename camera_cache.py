@@ -0,0 +1,120 @@
+# Persistent cache of camera capabilities and last successful settings
+# Cache persistant des capacités des caméras et des derniers paramètres fonctionnels
+import json
+import os
+
+
+# Bumped whenever the layout of the cache file changes; older files are discarded
+# Incrémenté à chaque changement de structure du fichier de cache ; les anciens fichiers sont ignorés
+CACHE_VERSION = 2
+
+
+# Key of a device in the cache: its identity, or its backend, index and name when it has none
+# Clé d'un périphérique dans le cache : son identité, ou son backend, son index et son nom s'il n'en a pas
+def device_key(identity, backend, index, name):
+    if identity is not None:
+        return identity
+    return f"{backend}:{index}:{name}"
+
+
+# Device list keyed by device identity, so a camera keeps its entry when its index changes;
+# devices without an identity are keyed by backend, index and name and marked unstable
+# Liste des périphériques indexée par identité, pour qu'une caméra garde son entrée si son index
+# change ; les périphériques sans identité sont indexés par backend, index et nom et marqués instables
+class CameraCache:
+    # Initializes an empty cache stored at path, for cameras opened with backend
+    # Initialise un cache vide stocké à l'emplacement path, pour des caméras ouvertes avec backend
+    def __init__(self, path, backend):
+        self.path = path  # JSON file next to camera_config.json / Fichier JSON à côté de camera_config.json
+        self.backend = backend  # Capture backend name, part of the keys of unstable devices / Nom du backend de capture, partie des clés des périphériques instables
+        self.devices = {}  # device_key -> device entry / device_key -> entrée du périphérique
+        self.last_identity = None  # Key of the last camera that streamed / Clé de la dernière caméra ayant diffusé
+
+    # Loads the cache file, starting empty if it is missing, invalid or from another version
+    # Charge le fichier de cache, en repartant de zéro s'il est absent, invalide ou d'une autre version
+    def load(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return self
+        devices = data.get("devices")
+        if isinstance(devices, dict):
+            self.devices = devices
+            self.last_identity = data.get("last_identity")
+        return self
+
+    # Writes the cache atomically so a crash never leaves a truncated file
+    # Écrit le cache de façon atomique pour qu'un plantage ne laisse jamais un fichier tronqué
+    def save(self):
+        data = {
+            "version": CACHE_VERSION,
+            "last_identity": self.last_identity,
+            "devices": self.devices,
+        }
+        temporary_path = self.path + ".tmp"
+        try:
+            with open(temporary_path, "w") as f:
+                json.dump(data, f)
+            os.replace(temporary_path, self.path)
+        except OSError as e:
+            print(f"Error saving camera cache: {e}")
+
+    # Replaces the device list with a fresh enumeration, keeping the settings of known devices
+    # Remplace la liste des périphériques par une nouvelle énumération, en gardant les paramètres des périphériques connus
+    def update_devices(self, devices):
+        """
+        Args:
+            devices (list): CameraDevice-like objects with index, name, resolutions,
+                            formats, frame_rates and identity attributes; identity may be None.
+                            Objets de type CameraDevice avec les attributs index, name,
+                            resolutions, formats, frame_rates et identity ; identity peut être None.
+        """
+        updated = {}
+        for device in devices:
+            key = device_key(device.identity, self.backend, device.index, device.name)
+            previous = self.devices.get(key, {})
+            updated[key] = {
+                "identity": device.identity,
+                "index": device.index,
+                "name": device.name,
+                "resolutions": [list(size) for size in device.resolutions],
+                "formats": list(device.formats),
+                "frame_rates": list(device.frame_rates),
+                "last_settings": previous.get("last_settings", {}),
+            }
+        self.devices = updated
+        if self.last_identity not in self.devices:
+            self.last_identity = None
+
+    # Records the settings a camera streamed with, and makes it the camera opened at startup
+    # Enregistre les paramètres avec lesquels une caméra a diffusé et en fait la caméra ouverte au démarrage
+    def record_settings(self, identity, index, name, settings):
+        key = device_key(identity, self.backend, index, name)
+        entry = self.devices.setdefault(
+            key,
+            {
+                "identity": identity,
+                "index": index,
+                "name": name,
+                "resolutions": [],
+                "formats": [],
+                "frame_rates": [],
+                "last_settings": {},
+            },
+        )
+        entry["index"] = index
+        entry["last_settings"] = settings
+        self.last_identity = key
+
+    # Returns (key, entry) of the camera to open at startup, or None; entry["identity"] is
+    # None for devices without a stable identity, whose capabilities must not be reused
+    # Retourne (clé, entrée) de la caméra à ouvrir au démarrage, ou None ; entry["identity"] est
+    # None pour les périphériques sans identité stable, dont les capacités ne doivent pas être réutilisées
+    def last_device(self):
+        entry = self.devices.get(self.last_identity)
+        if entry is None:
+            return None
+        return self.last_identity, entry
@@ -0,0 +1,250 @@
+# Camera enumeration on Linux through /dev/video* nodes, sysfs and V4L2 ioctls
+# Énumération des caméras sous Linux via les nœuds /dev/video*, sysfs et les ioctl V4L2
+import os
+import re
+import struct
+from collections import namedtuple
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows / Non disponible sous Windows
+    fcntl = None
+
+
+# A video device node; is_capture is None when its capabilities could not be read.
+# identity stays the same for a physical camera when its index changes between boots.
+# Un nœud de périphérique vidéo ; is_capture vaut None si ses capacités n'ont pas pu être lues.
+# identity reste la même pour une caméra physique lorsque son index change entre deux démarrages.
+CameraDevice = namedtuple(
+    "CameraDevice",
+    [
+        "index",
+        "path",
+        "name",
+        "is_capture",
+        "resolutions",
+        "formats",
+        "frame_rates",
+        "identity",
+    ],
+)
+
+# V4L2 ioctl request codes and flags (linux/videodev2.h)
+# Codes de requête ioctl et drapeaux V4L2 (linux/videodev2.h)
+VIDIOC_QUERYCAP = 0x80685600
+VIDIOC_ENUM_FMT = 0xC0405602
+VIDIOC_ENUM_FRAMESIZES = 0xC02C564A
+VIDIOC_ENUM_FRAMEINTERVALS = 0xC034564B
+V4L2_CAP_VIDEO_CAPTURE = 0x00000001
+V4L2_CAP_DEVICE_CAPS = 0x80000000
+V4L2_BUF_TYPE_VIDEO_CAPTURE = 1
+V4L2_FRMSIZE_TYPE_DISCRETE = 1
+V4L2_FRMIVAL_TYPE_DISCRETE = 1
+
+_QUERYCAP_FORMAT = "16s32s32sIII12x"  # struct v4l2_capability
+_FMTDESC_FORMAT = "III32sII12x"  # struct v4l2_fmtdesc
+_FRMSIZE_FORMAT = "IIIII16x8x"  # struct v4l2_frmsizeenum, discrete member of the union
+_FRMIVAL_FORMAT = "IIIIIII16x8x"  # struct v4l2_frmivalenum, discrete member of the union
+_MAX_ENUM = 64  # Guards against drivers that never return EINVAL / Protège contre les pilotes qui ne retournent jamais EINVAL
+
+_VIDEO_NODE = re.compile(r"^video(\d+)$")
+
+
+# Reads a stripped text attribute from sysfs, or None if it does not exist
+# Lit un attribut texte de sysfs sans espaces superflus, ou None s'il n'existe pas
+def _read_sysfs(path):
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+# Queries a device node with V4L2 ioctls
+# Interroge un nœud de périphérique avec les ioctl V4L2
+def query_v4l2_device(path):
+    """
+    Returns (card_name, is_capture, capabilities) for a V4L2 device node, where capabilities
+    is (resolutions, formats, frame_rates), or None if the node cannot be opened or queried
+    (e.g. missing permissions).
+    Retourne (nom_carte, est_capture, capacités) pour un nœud V4L2, où capacités vaut
+    (résolutions, formats, cadences), ou None si le nœud ne peut pas être ouvert ou interrogé
+    (par exemple, permissions manquantes).
+    """
+    if fcntl is None:
+        return None
+    try:
+        fd = os.open(path, os.O_RDWR | os.O_NONBLOCK)
+    except OSError:
+        return None
+    try:
+        buffer = bytearray(struct.calcsize(_QUERYCAP_FORMAT))
+        fcntl.ioctl(fd, VIDIOC_QUERYCAP, buffer)
+        _driver, card, _bus, _version, capabilities, device_caps = struct.unpack(
+            _QUERYCAP_FORMAT, buffer
+        )
+        # device_caps describes this node, capabilities the whole physical device
+        # device_caps décrit ce nœud, capabilities le périphérique physique entier
+        if capabilities & V4L2_CAP_DEVICE_CAPS:
+            capabilities = device_caps
+        is_capture = bool(capabilities & V4L2_CAP_VIDEO_CAPTURE)
+        name = card.split(b"\0", 1)[0].decode("utf-8", "replace")
+        capabilities = _enumerate_capabilities(fd) if is_capture else ([], [], [])
+        return name, is_capture, capabilities
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+# Lists the discrete frame sizes, pixel formats and frame rates of a capture node
+# Liste les tailles de trame discrètes, les formats de pixels et les cadences d'un nœud de capture
+def _enumerate_capabilities(fd):
+    sizes = set()
+    formats = []
+    frame_rates = set()
+    for format_index in range(_MAX_ENUM):
+        fmtdesc = bytearray(
+            struct.pack(
+                _FMTDESC_FORMAT, format_index, V4L2_BUF_TYPE_VIDEO_CAPTURE, 0, b"", 0, 0
+            )
+        )
+        try:
+            fcntl.ioctl(fd, VIDIOC_ENUM_FMT, fmtdesc)
+        except OSError:
+            break
+        pixel_format = struct.unpack(_FMTDESC_FORMAT, fmtdesc)[4]
+        formats.append(pixel_format.to_bytes(4, "little").decode("ascii", "replace"))
+        for size_index in range(_MAX_ENUM):
+            frmsize = bytearray(
+                struct.pack(_FRMSIZE_FORMAT, size_index, pixel_format, 0, 0, 0)
+            )
+            try:
+                fcntl.ioctl(fd, VIDIOC_ENUM_FRAMESIZES, frmsize)
+            except OSError:
+                break
+            _index, _format, size_type, width, height = struct.unpack(
+                _FRMSIZE_FORMAT, frmsize
+            )
+            if size_type != V4L2_FRMSIZE_TYPE_DISCRETE:
+                break  # Stepwise/continuous ranges have no list to offer / Les plages n'ont pas de liste à proposer
+            sizes.add((width, height))
+            frame_rates.update(_enumerate_frame_rates(fd, pixel_format, width, height))
+    resolutions = sorted(
+        sizes, key=lambda size: (size[0] * size[1], size[0]), reverse=True
+    )
+    return resolutions, formats, sorted(frame_rates, reverse=True)
+
+
+# Lists the discrete frame rates of one pixel format and frame size
+# Liste les cadences discrètes d'un format de pixels et d'une taille de trame
+def _enumerate_frame_rates(fd, pixel_format, width, height):
+    rates = []
+    for interval_index in range(_MAX_ENUM):
+        frmival = bytearray(
+            struct.pack(
+                _FRMIVAL_FORMAT, interval_index, pixel_format, width, height, 0, 0, 0
+            )
+        )
+        try:
+            fcntl.ioctl(fd, VIDIOC_ENUM_FRAMEINTERVALS, frmival)
+        except OSError:
+            break
+        ival_type, numerator, denominator = struct.unpack(_FRMIVAL_FORMAT, frmival)[4:]
+        if ival_type != V4L2_FRMIVAL_TYPE_DISCRETE:
+            break
+        if numerator:
+            # The interval is a fraction of a second; the rate is its inverse
+            # L'intervalle est une fraction de seconde ; la cadence est son inverse
+            rates.append(round(denominator / numerator, 2))
+    return rates
+
+
+# Builds an identifier of the physical camera behind a videoN node from sysfs
+# Construit un identifiant de la caméra physique derrière un nœud videoN à partir de sysfs
+def device_identity(index, sysfs_root="/sys"):
+    """
+    Returns "vendor:product@bus-path" for USB cameras, the resolved sysfs device path for
+    other devices, or None if the node is unknown to sysfs.
+    Retourne "fabricant:produit@chemin-bus" pour les caméras USB, le chemin sysfs résolu du
+    périphérique pour les autres, ou None si le nœud est inconnu de sysfs.
+    """
+    device_link = os.path.join(
+        sysfs_root, "class", "video4linux", f"video{index}", "device"
+    )
+    if not os.path.exists(device_link):
+        return None
+    device_path = os.path.realpath(device_link)
+    # device points to the USB interface (e.g. .../1-2/1-2:1.0); the IDs are on its parent
+    # device pointe vers l'interface USB (par ex. .../1-2/1-2:1.0) ; les identifiants sont sur son parent
+    usb_device = os.path.dirname(device_path)
+    vendor = _read_sysfs(os.path.join(usb_device, "idVendor"))
+    product = _read_sysfs(os.path.join(usb_device, "idProduct"))
+    if vendor and product:
+        return f"{vendor}:{product}@{os.path.basename(usb_device)}"
+    return device_path
+
+
+# Lists the /dev/video* nodes with their names and capture capabilities
+# Liste les nœuds /dev/video* avec leurs noms et leurs capacités de capture
+def enumerate_v4l2_cameras(dev_root="/dev", sysfs_root="/sys", query=query_v4l2_device):
+    """
+    Enumerates video device nodes without opening them through OpenCV.
+    Énumère les nœuds de périphériques vidéo sans les ouvrir via OpenCV.
+
+    Args:
+        dev_root (str): Directory holding the videoN nodes.
+                        Répertoire contenant les nœuds videoN.
+        sysfs_root (str): Root of the sysfs tree, replaceable by a fake tree in tests.
+                          Racine de l'arborescence sysfs, remplaçable par une fausse arborescence dans les tests.
+        query (callable): Function returning the query_v4l2_device tuple or None for a node path.
+                          Fonction retournant le tuple de query_v4l2_device ou None pour un chemin de nœud.
+
+    Returns:
+        list: CameraDevice entries sorted by index.
+              Entrées CameraDevice triées par index.
+    """
+    try:
+        entries = os.listdir(dev_root)
+    except OSError:
+        return []
+
+    devices = []
+    for entry in entries:
+        match = _VIDEO_NODE.match(entry)
+        if not match:
+            continue
+        index = int(match.group(1))
+        path = os.path.join(dev_root, entry)
+        sysfs_dir = os.path.join(sysfs_root, "class", "video4linux", entry)
+        name = _read_sysfs(os.path.join(sysfs_dir, "name"))
+        is_capture = None
+        resolutions, formats, frame_rates = [], [], []
+
+        result = query(path) if query else None
+        if result is not None:
+            card_name, is_capture, (resolutions, formats, frame_rates) = result
+            name = name or card_name
+        else:
+            # Without ioctl access, UVC cameras expose their video stream on the node with
+            # sysfs index 0; the following nodes are metadata nodes
+            # Sans accès ioctl, les caméras UVC exposent leur flux vidéo sur le nœud d'index sysfs 0 ;
+            # les nœuds suivants sont des nœuds de métadonnées
+            node_index = _read_sysfs(os.path.join(sysfs_dir, "index"))
+            if node_index is not None and node_index != "0":
+                is_capture = False
+
+        devices.append(
+            CameraDevice(
+                index,
+                path,
+                name or f"Webcam {index}",
+                is_capture,
+                resolutions,
+                formats,
+                frame_rates,
+                device_identity(index, sysfs_root),
+            )
+        )
+    devices.sort(key=lambda device: device.index)
+    return devices
@@ -1,11 +1,17 @@
-from visiodoc_app import VisioDoc3
+import time
+
+# Taken before the heavy imports so the time to first frame covers the whole startup
+# Pris avant les imports lourds pour que le temps jusqu'à la première trame couvre tout le démarrage
+LAUNCH_TIME = time.perf_counter()
+
+from visiodoc_app import VisioDoc3  # noqa: E402
 
 # This is the main entry point for the VisioDoc3 application.
 # C'est le point d'entrée principal de l'application VisioDoc3.
 if __name__ == "__main__":
     # Create an instance of the VisioDoc3 application.
     # Crée une instance de l'application VisioDoc3.
-    app = VisioDoc3()
+    app = VisioDoc3(launch_time=LAUNCH_TIME)
     # Start the Tkinter event loop, which keeps the application running.
     # Démarre la boucle d'événements Tkinter, qui maintient l'application en cours d'exécution.
     app.mainloop()
\ No newline at end of file
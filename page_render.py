@@ -0,0 +1,192 @@
+# Background rendering of document pages with a bounded cache of rendered pages
+# Rendu en arrière-plan des pages de document avec un cache borné des pages rendues
+import threading
+from collections import OrderedDict
+
+from paged_document import open_paged_document
+
+
+# Default memory budget of the rendered page cache in bytes
+# Budget mémoire par défaut du cache des pages rendues en octets
+DEFAULT_CACHE_BYTES = 192 * 1024 * 1024
+
+# Pages rendered ahead on each side of the current page
+# Pages rendues à l'avance de chaque côté de la page courante
+DEFAULT_PREFETCH = 2
+
+# Zoom above which the visible part of a page is rasterized again at the zoom resolution
+# instead of upscaling the 72 DPI page
+# Zoom au-delà duquel la partie visible d'une page est à nouveau rastérisée à la résolution
+# du zoom au lieu d'agrandir la page à 72 DPI
+MAX_UPSCALE = 1.5
+
+
+# Estimated memory of a PIL image; RGB pixels are stored in 4 bytes
+# Mémoire estimée d'une image PIL ; les pixels RGB sont stockés sur 4 octets
+def _image_bytes(image):
+    width, height = image.size
+    return width * height * 4
+
+
+# Worker thread rendering the requested page and its neighbours, most recently used pages kept
+# Thread de travail rendant la page demandée et ses voisines, les pages les plus récemment utilisées étant conservées
+class PageRenderService(threading.Thread):
+    # Initializes the service for a path accepted by open_paged_document; on_ready(page_number, image)
+    # is called from this thread after each rendered page, image being None if the page could not be rendered
+    # Initialise le service pour un chemin accepté par open_paged_document ; on_ready(numéro_de_page, image)
+    # est appelé depuis ce thread après chaque page rendue, image valant None si la page n'a pas pu être rendue
+    def __init__(
+        self,
+        path,
+        on_ready=None,
+        on_detail=None,
+        cache_bytes=DEFAULT_CACHE_BYTES,
+        prefetch=DEFAULT_PREFETCH,
+    ):
+        super().__init__(daemon=True)
+        self.path = path  # The thread opens its own document, PyMuPDF and PIL objects are not shared between threads / Le thread ouvre son propre document, les objets PyMuPDF et PIL ne sont pas partagés entre threads
+        self.on_ready = on_ready
+        self.on_detail = on_detail  # on_detail(page_number, source_box, size, image) after request_detail / après request_detail
+        self.cache_bytes = cache_bytes  # Least recently used pages are dropped above this / Les pages les moins récemment utilisées sont supprimées au-delà
+        self.prefetch = prefetch
+        self._cache = OrderedDict()  # page_number -> image, most recent last / numéro_de_page -> image, la plus récente en dernier
+        self._cached_bytes = 0
+        self._pending = []  # Pages still to render, next one first / Pages restant à rendre, la prochaine en premier
+        self._failed = set()  # Pages that raised while rendering / Pages ayant échoué au rendu
+        self._current = None  # Last requested page / Dernière page demandée
+        self._detail = None  # Pending (page_number, source_box, size) of request_detail / (numéro_de_page, source_box, size) en attente de request_detail
+        self._condition = threading.Condition()
+        self._run_flag = True
+
+    # Renders pending pages until stopped
+    # Rend les pages en attente jusqu'à l'arrêt
+    def run(self):
+        try:
+            document = open_paged_document(self.path)
+        except Exception as e:
+            print(f"Error opening document for rendering: {e}")
+            return
+        if document is None:
+            print(f"Not a paged document: {self.path}")
+            return
+        try:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(
+                        lambda: self._pending or self._detail or not self._run_flag
+                    )
+                    if not self._run_flag:
+                        return
+                    # The current page first, then the zoomed view, then the neighbours
+                    # La page courante d'abord, puis la vue zoomée, puis les voisines
+                    detail = None
+                    if self._detail and not (
+                        self._pending and self._pending[0] == self._current
+                    ):
+                        detail, self._detail = self._detail, None
+                    else:
+                        page_number = self._pending.pop(0)
+                    # Pages far from the current one are released; its neighbours stay loaded
+                    # Les pages éloignées de la courante sont libérées ; ses voisines restent chargées
+                    document.focus(self._current)
+                if detail is not None:
+                    self._render_detail(document, detail)
+                    continue
+                try:
+                    image = document.render_page(page_number)
+                except Exception as e:
+                    print(f"Error rendering page {page_number + 1}: {e}")
+                    with self._condition:
+                        self._failed.add(page_number)
+                    image = None
+                else:
+                    self._store(page_number, image)
+                if self.on_ready is not None and self._run_flag:
+                    self.on_ready(page_number, image)
+        finally:
+            document.close()
+
+    # Renders a request_detail rectangle and hands it to on_detail
+    # Rend un rectangle de request_detail et le transmet à on_detail
+    def _render_detail(self, document, detail):
+        page_number, source_box, size = detail
+        try:
+            image = document.render_clip(page_number, source_box, size)
+        except Exception as e:
+            print(f"Error rendering page {page_number + 1}: {e}")
+            return
+        if self.on_detail is not None and self._run_flag:
+            self.on_detail(page_number, source_box, size, image)
+
+    # Stops the thread after the page being rendered, if any
+    # Arrête le thread après la page en cours de rendu, le cas échéant
+    def stop(self):
+        with self._condition:
+            self._run_flag = False
+            self._pending.clear()
+            self._detail = None
+            self._condition.notify_all()
+
+    # Returns the cached image of a page and marks it as recently used, or None
+    # Retourne l'image en cache d'une page et la marque comme récemment utilisée, ou None
+    def get(self, page_number):
+        with self._condition:
+            image = self._cache.get(page_number)
+            if image is not None:
+                self._cache.move_to_end(page_number)
+            return image
+
+    # Makes page_number the current page: it is rendered first, then its neighbours,
+    # and pages queued for an earlier current page are cancelled; on_ready is called
+    # for it even if it failed before
+    # Fait de page_number la page courante : elle est rendue d'abord, puis ses voisines,
+    # et les pages mises en file pour une page courante précédente sont annulées ; on_ready
+    # est appelé pour elle même si elle a échoué auparavant
+    def request(self, page_number, page_count):
+        wanted = [page_number]
+        for distance in range(1, self.prefetch + 1):
+            # Forward first, as pages are mostly read in order
+            # Vers l'avant d'abord, les pages étant le plus souvent lues dans l'ordre
+            wanted.append(page_number + distance)
+            wanted.append(page_number - distance)
+        with self._condition:
+            self._current = page_number
+            # A page asked for again is retried; failed neighbours are not prefetched again
+            # Une page demandée à nouveau est réessayée ; les voisines en échec ne sont pas prérendues à nouveau
+            self._failed.discard(page_number)
+            self._pending = [
+                number
+                for number in wanted
+                if 0 <= number < page_count
+                and number not in self._cache
+                and number not in self._failed
+            ]
+            if self._pending:
+                self._condition.notify()
+
+    # Asks for a sharp rendering of the visible rectangle of a page, for documents whose
+    # supports_clip is True; only the latest request is kept, so the views passed through
+    # while zooming are never rendered
+    # Demande un rendu net du rectangle visible d'une page, pour les documents dont supports_clip
+    # est vrai ; seule la dernière demande est conservée, les vues traversées pendant un zoom
+    # ne sont donc jamais rendues
+    def request_detail(self, page_number, source_box, size):
+        with self._condition:
+            self._detail = (page_number, source_box, size)
+            self._condition.notify()
+
+    # Adds a rendered page, evicting least recently used pages over the budget
+    # Ajoute une page rendue, en évinçant les pages les moins récemment utilisées au-delà du budget
+    def _store(self, page_number, image):
+        with self._condition:
+            self._cache[page_number] = image
+            self._cached_bytes += _image_bytes(image)
+            # Prefetched neighbours must not push out the page on screen
+            # Les voisines prérendues ne doivent pas chasser la page affichée
+            if self._current in self._cache:
+                self._cache.move_to_end(self._current)
+            # The most recently used page always stays, even if it exceeds the budget alone
+            # La page la plus récemment utilisée reste toujours, même si elle dépasse seule le budget
+            while self._cached_bytes > self.cache_bytes and len(self._cache) > 1:
+                _, evicted = self._cache.popitem(last=False)
+                self._cached_bytes -= _image_bytes(evicted)
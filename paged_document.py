@@ -0,0 +1,261 @@
+# Lazy page access to multi-page documents: PDF, multi-page images and image folders
+# Accès paresseux aux pages des documents multipages : PDF, images multipages et dossiers d'images
+import os
+import re
+
+import fitz  # PyMuPDF
+from PIL import Image
+
+
+# Pages kept loaded on each side of the focused page
+# Pages gardées chargées de chaque côté de la page ciblée
+DEFAULT_KEEP_PAGES = 2
+
+# File extensions listed as pages of an image folder
+# Extensions de fichier listées comme pages d'un dossier d'images
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tif", ".tiff", ".webp")
+
+
+# Renders a PDF page to an RGB PIL image
+# Rend une page PDF en image PIL RGB
+def render_pdf_page(page):
+    """
+    Returns the page rasterized at 72 DPI as an RGB PIL image.
+    Retourne la page rastérisée à 72 DPI en image PIL RGB.
+    """
+    pix = page.get_pixmap(alpha=False)
+    # samples_mv exposes the pixmap buffer without the bytes copy made by pix.samples;
+    # frombytes copies it once into the image, which then no longer depends on the pixmap
+    # samples_mv expose le tampon du pixmap sans la copie en bytes faite par pix.samples ;
+    # frombytes le copie une seule fois dans l'image, qui ne dépend alors plus du pixmap
+    return Image.frombytes(
+        "RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", pix.stride
+    )
+
+
+# Renders part of a PDF page at the size it is displayed
+# Rend une partie d'une page PDF à la taille où elle est affichée
+def render_pdf_clip(page, source_box, size):
+    """
+    Rasterizes a rectangle of the page through a fitz.Matrix matching the display scale.
+    Rastérise un rectangle de la page avec une fitz.Matrix correspondant à l'échelle d'affichage.
+
+    Args:
+        page (fitz.Page): The page.
+                          La page.
+        source_box (tuple): (x1, y1, x2, y2) rectangle in pixels of the 72 DPI page image.
+                            Rectangle (x1, y1, x2, y2) en pixels de l'image de la page à 72 DPI.
+        size (tuple): (width, height) of the rectangle on screen.
+                      (largeur, hauteur) du rectangle à l'écran.
+
+    Returns:
+        PIL.Image.Image: RGB image of exactly size pixels.
+                         Image RGB de exactement size pixels.
+    """
+    x1, y1, x2, y2 = source_box
+    origin = page.rect.tl  # Pixel (0, 0) of the 72 DPI image / Pixel (0, 0) de l'image à 72 DPI
+    clip = fitz.Rect(x1, y1, x2, y2) + (origin.x, origin.y, origin.x, origin.y)
+    matrix = fitz.Matrix(size[0] / (x2 - x1), size[1] / (y2 - y1))
+    pix = page.get_pixmap(matrix=matrix, clip=clip, alpha=False)
+    image = Image.frombytes(
+        "RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", pix.stride
+    )
+    # The clip is rounded to whole device pixels; the difference is below one pixel
+    # Le découpage est arrondi au pixel de sortie ; la différence est inférieure à un pixel
+    if image.size != tuple(size):
+        image = image.resize(size, Image.BILINEAR)
+    return image
+
+
+
+# Every paged document has page_count, render_page(page_number),
+# render_thumbnail(page_number, size), focus(page_number) and close(); supports_clip
+# tells whether render_clip(page_number, source_box, size) is available.
+# A document is only used by the thread that opened it.
+# Chaque document paginé a page_count, render_page(numéro_de_page),
+# render_thumbnail(numéro_de_page, size), focus(numéro_de_page) et close() ; supports_clip
+# indique si render_clip(numéro_de_page, source_box, size) est disponible.
+# Un document n'est utilisé que par le thread qui l'a ouvert.
+
+
+# PDF document whose page objects are only loaded when used and released when far away
+# Document PDF dont les objets de page ne sont chargés qu'à l'usage et libérés lorsqu'ils sont éloignés
+class PdfDocument:
+    supports_clip = True
+
+    # Opens a PDF; only the cross-reference table is read, whatever the page count
+    # Ouvre un PDF ; seule la table des références croisées est lue, quel que soit le nombre de pages
+    def __init__(self, path, keep_pages=DEFAULT_KEEP_PAGES):
+        self.path = path
+        self.keep_pages = keep_pages  # Loaded pages farther than this from the focus are released / Les pages chargées plus loin que cela de la page ciblée sont libérées
+        self._document = fitz.open(path)
+        self._pages = {}  # page_number -> fitz.Page / numéro_de_page -> fitz.Page
+
+    # Number of pages, read from the document without loading any page
+    # Nombre de pages, lu dans le document sans charger de page
+    @property
+    def page_count(self):
+        return self._document.page_count
+
+    # Returns a page, loading it on first use
+    # Retourne une page, en la chargeant à la première utilisation
+    def page(self, page_number):
+        page = self._pages.get(page_number)
+        if page is None:
+            page = self._document.load_page(page_number)
+            self._pages[page_number] = page
+        return page
+
+    # Renders a page at 72 DPI
+    # Rend une page à 72 DPI
+    def render_page(self, page_number):
+        return render_pdf_page(self.page(page_number))
+
+    # Rasterizes a page directly at thumbnail size, fitting within size
+    # Rastérise une page directement à la taille de la vignette, dans les limites de size
+    def render_thumbnail(self, page_number, size):
+        page = self.page(page_number)
+        scale = min(size[0] / page.rect.width, size[1] / page.rect.height)
+        pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
+        return Image.frombytes(
+            "RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", pix.stride
+        )
+
+    # Renders a rectangle of a page at its display size
+    # Rend un rectangle d'une page à sa taille d'affichage
+    def render_clip(self, page_number, source_box, size):
+        return render_pdf_clip(self.page(page_number), source_box, size)
+
+    # Makes page_number the page in use and releases the pages far from it
+    # Fait de page_number la page utilisée et libère les pages éloignées
+    def focus(self, page_number):
+        for number in [
+            number
+            for number in self._pages
+            if abs(number - page_number) > self.keep_pages
+        ]:
+            del self._pages[number]
+
+    # Number of page objects currently loaded
+    # Nombre d'objets de page actuellement chargés
+    def loaded_pages(self):
+        return len(self._pages)
+
+    # Releases every page and closes the document
+    # Libère toutes les pages et ferme le document
+    def close(self):
+        self._pages.clear()
+        self._document.close()
+
+
+# Frames of a multi-page TIFF or an animated GIF, decoded one at a time through seek()
+# Trames d'un TIFF multipage ou d'un GIF animé, décodées une à une via seek()
+class ImageSequenceDocument:
+    supports_clip = False
+
+    # Opens the file; PIL only reads the header until a frame is decoded
+    # Ouvre le fichier ; PIL ne lit que l'en-tête jusqu'au décodage d'une trame
+    def __init__(self, path):
+        self.path = path
+        self._image = Image.open(path)
+
+    # Number of frames; counting GIF frames scans the file once, without decoding pixels
+    # Nombre de trames ; compter les trames d'un GIF parcourt le fichier une fois, sans décoder les pixels
+    @property
+    def page_count(self):
+        return getattr(self._image, "n_frames", 1)
+
+    # Decodes a frame as an RGB image
+    # Décode une trame en image RGB
+    def render_page(self, page_number):
+        self._image.seek(page_number)
+        return self._image.convert("RGB")
+
+    # Decodes a frame and reduces it to fit within size
+    # Décode une trame et la réduit pour tenir dans size
+    def render_thumbnail(self, page_number, size):
+        image = self.render_page(page_number)
+        image.thumbnail(size)
+        return image
+
+    # Frames are not kept, there is nothing to release
+    # Les trames ne sont pas conservées, il n'y a rien à libérer
+    def focus(self, page_number):
+        pass
+
+    def close(self):
+        self._image.close()
+
+
+# Natural sort key, so that page2.png comes before page10.png
+# Clé de tri naturel, pour que page2.png vienne avant page10.png
+def _natural_key(name):
+    return [
+        int(part) if part.isdigit() else part.lower()
+        for part in re.split(r"(\d+)", name)
+    ]
+
+
+# Images of a folder, in natural name order, one page per file
+# Images d'un dossier, dans l'ordre naturel des noms, une page par fichier
+class ImageFolderDocument:
+    supports_clip = False
+
+    # Lists the image files of the folder; no file is opened
+    # Liste les fichiers image du dossier ; aucun fichier n'est ouvert
+    def __init__(self, path):
+        self.path = path
+        self._files = [
+            os.path.join(path, name)
+            for name in sorted(os.listdir(path), key=_natural_key)
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        ]
+
+    @property
+    def page_count(self):
+        return len(self._files)
+
+    # Decodes the first frame of a file as an RGB image
+    # Décode la première trame d'un fichier en image RGB
+    def render_page(self, page_number):
+        with Image.open(self._files[page_number]) as image:
+            return image.convert("RGB")
+
+    # Decodes a file at reduced size; JPEG files are scaled down while decoding
+    # Décode un fichier à taille réduite ; les fichiers JPEG sont réduits pendant le décodage
+    def render_thumbnail(self, page_number, size):
+        with Image.open(self._files[page_number]) as image:
+            image.draft("RGB", size)
+            image = image.convert("RGB")
+        image.thumbnail(size)
+        return image
+
+    def focus(self, page_number):
+        pass
+
+    def close(self):
+        pass
+
+
+# Opens a path as a paged document
+# Ouvre un chemin comme document paginé
+def open_paged_document(path):
+    """
+    Returns a PdfDocument for PDF files, an ImageFolderDocument for folders and an
+    ImageSequenceDocument for images with several frames, or None for a single image.
+    Retourne un PdfDocument pour les fichiers PDF, un ImageFolderDocument pour les dossiers
+    et un ImageSequenceDocument pour les images à plusieurs trames, ou None pour une image seule.
+
+    Raises:
+        OSError or RuntimeError: If the file cannot be opened by PIL or PyMuPDF.
+                                 Si le fichier ne peut pas être ouvert par PIL ou PyMuPDF.
+    """
+    if os.path.isdir(path):
+        return ImageFolderDocument(path)
+    if path.lower().endswith(".pdf"):
+        return PdfDocument(path)
+    document = ImageSequenceDocument(path)
+    if document.page_count > 1:
+        return document
+    document.close()
+    return None
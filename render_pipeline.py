@@ -0,0 +1,556 @@
+# Render pipeline with dirty tracking for the display area
+# Pipeline de rendu avec suivi des modifications pour la zone d'affichage
+import cv2
+import numpy as np
+from PIL import Image, ImageTk
+
+from annotations import draw_annotations
+
+
+# OpenCV interpolation used while a zoom/pan gesture is in progress, per render quality policy.
+# None means the gesture is rendered with LANCZOS like the settled view.
+# Interpolation OpenCV utilisée pendant un geste de zoom/panoramique, par politique de qualité.
+# None signifie que le geste est rendu avec LANCZOS comme la vue stabilisée.
+QUALITY_POLICIES = {
+    "fast": cv2.INTER_NEAREST,
+    "balanced": cv2.INTER_LINEAR,
+    "high": None,
+}
+DEFAULT_QUALITY_POLICY = "balanced"
+
+
+def select_interpolation(policy, interactive):
+    """
+    Chooses how the view is scaled according to the render quality policy.
+    Choisit comment la vue est mise à l'échelle selon la politique de qualité de rendu.
+
+    Args:
+        policy (str): Name of the policy in QUALITY_POLICIES.
+                      Nom de la politique dans QUALITY_POLICIES.
+        interactive (bool): True while the user is zooming or panning.
+                            Vrai pendant que l'utilisateur zoome ou effectue un panoramique.
+
+    Returns:
+        int or None: An OpenCV interpolation flag for the fast path, or None for LANCZOS.
+                     Un drapeau d'interpolation OpenCV pour le chemin rapide, ou Aucun pour LANCZOS.
+    """
+    if not interactive:
+        return None
+    return QUALITY_POLICIES.get(policy, QUALITY_POLICIES[DEFAULT_QUALITY_POLICY])
+
+
+# Caches each rendering stage and only recomputes the stages whose inputs changed
+# Met en cache chaque étape du rendu et ne recalcule que les étapes dont les entrées ont changé
+class RenderPipeline:
+    def __init__(self, background=(200, 200, 200)):
+        """
+        Initializes an empty RenderPipeline.
+        Initialise un RenderPipeline vide.
+
+        Args:
+            background (tuple): RGB color used for the empty areas of the view.
+                                Couleur RGB utilisée pour les zones vides de la vue.
+        """
+        self.background = background  # Grey background for empty areas / Fond gris pour les zones vides
+
+        # Stage 1: source image as a BGR array for OpenCV drawing
+        # Étape 1 : image source sous forme de tableau BGR pour le dessin OpenCV
+        self._source = None
+        self._base_bgr = None
+
+        # Stage 2: base image with annotations and overlays drawn on it
+        # Étape 2 : image de base avec les annotations et les superpositions dessinées
+        self._overlay_key = None
+        self._work_bgr = None  # Reused drawing buffer / Tampon de dessin réutilisé
+        self._display_rgbx = None  # Reused display buffer shared with annotated_image / Tampon d'affichage réutilisé partagé avec annotated_image
+        self.annotated_image = None  # PIL image at original resolution / Image PIL en résolution originale
+
+        # Stage 3: visible part of the annotated image scaled into a label-sized view
+        # Étape 3 : partie visible de l'image annotée mise à l'échelle dans une vue à la taille de l'étiquette
+        self._view_key = None
+        self.final_view = None
+        self.photo = None
+
+    def invalidate(self):
+        """
+        Drops every cached stage so the next render recomputes everything.
+        Supprime toutes les étapes en cache pour que le prochain rendu recalcule tout.
+        """
+        self._source = None
+        self._base_bgr = None
+        self._overlay_key = None
+        self._view_key = None
+
+    def render(
+        self,
+        source,
+        overlay_key,
+        draw_overlays,
+        zoom_level,
+        paste_position,
+        label_size,
+        interpolation=None,
+        detail=None,
+    ):
+        """
+        Renders the source image through the cached stages.
+        Rend l'image source à travers les étapes mises en cache.
+
+        Args:
+            source (PIL.Image.Image or numpy.ndarray): The base image to display, either a PIL RGB
+                                                       image or an OpenCV BGR frame (used without copy).
+                                                       L'image de base à afficher, soit une image PIL RGB,
+                                                       soit un cadre BGR OpenCV (utilisé sans copie).
+            overlay_key (tuple): Hashable description of everything draw_overlays depends on.
+                                 Description de tout ce dont dépend draw_overlays.
+            draw_overlays (callable): Draws annotations on a BGR frame and returns the frame.
+                                      Dessine les annotations sur un cadre BGR et retourne le cadre.
+            zoom_level (float): Current zoom level.
+                                Niveau de zoom actuel.
+            paste_position (tuple): (x, y) position of the scaled image on the view.
+                                    Position (x, y) de l'image mise à l'échelle sur la vue.
+            label_size (tuple): (width, height) of the display label.
+                                (largeur, hauteur) de l'étiquette d'affichage.
+            interpolation (int): OpenCV interpolation flag for fast interactive scaling,
+                                 or None for a high-quality LANCZOS view.
+                                 Drapeau d'interpolation OpenCV pour une mise à l'échelle interactive
+                                 rapide, ou Aucun pour une vue LANCZOS de haute qualité.
+            detail (tuple): (source_box, image) sharper rendering of the source, e.g. a PDF
+                            clip rasterized at the zoom resolution, used for the view when
+                            source_box is the visible rectangle and image has its view size.
+                            (source_box, image) rendu plus net de la source, par ex. un découpage
+                            PDF rastérisé à la résolution du zoom, utilisé pour la vue lorsque
+                            source_box est le rectangle visible et que l'image a sa taille de vue.
+
+        Returns:
+            bool: True if a new view was produced, False if the cached view is still valid.
+                  Vrai si une nouvelle vue a été produite, Faux si la vue en cache est toujours valide.
+        """
+        dirty = False
+
+        if source is not self._source:
+            if isinstance(source, np.ndarray):
+                # Camera frames are already BGR and are never modified in place
+                # Les trames de la caméra sont déjà en BGR et ne sont jamais modifiées sur place
+                self._base_bgr = source
+            else:
+                # Convert PIL RGB image to OpenCV BGR format once per source image
+                # Convertit l'image PIL RGB en format BGR OpenCV une seule fois par image source
+                self._base_bgr = cv2.cvtColor(np.asarray(source), cv2.COLOR_RGB2BGR)
+            self._source = source
+            dirty = True
+
+        if dirty or overlay_key != self._overlay_key:
+            self._ensure_buffers(self._base_bgr.shape)
+            np.copyto(self._work_bgr, self._base_bgr)
+            frame = draw_overlays(self._work_bgr)
+            # Single conversion to the display format, written into the reused buffer
+            # Conversion unique vers le format d'affichage, écrite dans le tampon réutilisé
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGBA, dst=self._display_rgbx)
+            self._overlay_key = overlay_key
+            dirty = True
+
+        view_key = (
+            zoom_level,
+            paste_position,
+            label_size,
+            interpolation,
+            None if detail is None else id(detail[1]),
+        )
+        if dirty or view_key != self._view_key:
+            self.final_view = Image.new("RGB", label_size, self.background)
+            visible = self.visible_region(
+                self.annotated_image.size, zoom_level, paste_position, label_size
+            )
+            if visible is not None:
+                source_box, destination = visible
+                size = (destination[2] - destination[0], destination[3] - destination[1])
+                # Only the visible source rectangle is filtered, so the cost depends on the window size
+                # Seul le rectangle source visible est filtré, le coût dépend donc de la taille de la fenêtre
+                if (
+                    detail is not None
+                    and detail[0] == source_box
+                    and detail[1].size == size
+                ):
+                    cropped = self._composite_detail(detail[1], source_box, size)
+                elif interpolation is None:
+                    cropped = self.annotated_image.resize(
+                        size, Image.LANCZOS, box=source_box
+                    )
+                else:
+                    cropped = self._fast_resize(source_box, size, interpolation)
+                self.final_view.paste(cropped, destination[:2])
+            self.photo = ImageTk.PhotoImage(image=self.final_view)
+            self._view_key = view_key
+            dirty = True
+
+        return dirty
+
+    def _composite_detail(self, detail_image, source_box, size):
+        """
+        Uses a sharp rendering of the visible region for the view, with the pixels changed
+        by the overlays scaled from the annotated image on top of it.
+        Utilise un rendu net de la région visible pour la vue, avec par-dessus les pixels
+        modifiés par les superpositions, mis à l'échelle depuis l'image annotée.
+
+        Args:
+            detail_image (PIL.Image.Image): RGB rendering of source_box at size.
+                                            Rendu RGB de source_box à la taille size.
+            source_box (tuple): (x1, y1, x2, y2) visible rectangle in image coordinates.
+                                Rectangle visible (x1, y1, x2, y2) en coordonnées d'image.
+            size (tuple): (width, height) of the scaled region.
+                          (largeur, hauteur) de la région mise à l'échelle.
+
+        Returns:
+            PIL.Image.Image: The view of the region.
+                             La vue de la région.
+        """
+        height, width = self._display_rgbx.shape[:2]
+        x1 = max(0, int(source_box[0]))
+        y1 = max(0, int(source_box[1]))
+        x2 = min(width, int(np.ceil(source_box[2])))
+        y2 = min(height, int(np.ceil(source_box[3])))
+        changed = (
+            np.any(self._work_bgr[y1:y2, x1:x2] != self._base_bgr[y1:y2, x1:x2], axis=2)
+            .astype(np.uint8)
+            * 255
+        )  # Pixels drawn by the overlays / Pixels dessinés par les superpositions
+        if not changed.any():
+            return detail_image
+        # Only the view rectangle covering the changed pixels, grown by the filter
+        # footprint, is scaled from the annotated image
+        # Seul le rectangle de la vue couvrant les pixels modifiés, agrandi de l'empreinte
+        # du filtre, est mis à l'échelle depuis l'image annotée
+        cx, cy, cw, ch = cv2.boundingRect(changed)
+        scale_x = size[0] / (source_box[2] - source_box[0])
+        scale_y = size[1] / (source_box[3] - source_box[1])
+        left = max(0, int((x1 + cx - 1 - source_box[0]) * scale_x))
+        top = max(0, int((y1 + cy - 1 - source_box[1]) * scale_y))
+        right = min(size[0], int(np.ceil((x1 + cx + cw + 1 - source_box[0]) * scale_x)))
+        bottom = min(size[1], int(np.ceil((y1 + cy + ch + 1 - source_box[1]) * scale_y)))
+        if right <= left or bottom <= top:
+            return detail_image
+        # Affine map from the crop to that rectangle; linear filtering of the mask also
+        # covers the anti-aliased fringe around the overlays
+        # Transformation affine du découpage vers ce rectangle ; le filtrage linéaire du
+        # masque couvre aussi la frange anticrénelée autour des superpositions
+        matrix = np.array(
+            [
+                [scale_x, 0, (x1 - source_box[0]) * scale_x - left],
+                [0, scale_y, (y1 - source_box[1]) * scale_y - top],
+            ]
+        )
+        patch_size = (right - left, bottom - top)
+        mask = cv2.warpAffine(changed, matrix, patch_size, flags=cv2.INTER_LINEAR)
+        overlay = cv2.cvtColor(
+            cv2.warpAffine(
+                self._display_rgbx[y1:y2, x1:x2],
+                matrix,
+                patch_size,
+                flags=cv2.INTER_LINEAR,
+            ),
+            cv2.COLOR_RGBA2RGB,
+        )
+        view = np.array(detail_image)
+        cv2.copyTo(overlay, mask, view[top:bottom, left:right])
+        return Image.fromarray(view)
+
+    def _fast_resize(self, source_box, size, interpolation):
+        """
+        Scales the visible region with OpenCV, rounding the source box to whole pixels.
+        Met à l'échelle la région visible avec OpenCV, en arrondissant la boîte source au pixel.
+
+        Args:
+            source_box (tuple): (x1, y1, x2, y2) visible rectangle in image coordinates.
+                                Rectangle visible (x1, y1, x2, y2) en coordonnées d'image.
+            size (tuple): (width, height) of the scaled region.
+                          (largeur, hauteur) de la région mise à l'échelle.
+            interpolation (int): OpenCV interpolation flag.
+                                 Drapeau d'interpolation OpenCV.
+
+        Returns:
+            PIL.Image.Image: The scaled region.
+                             La région mise à l'échelle.
+        """
+        height, width = self._display_rgbx.shape[:2]
+        x1 = max(0, int(source_box[0]))
+        y1 = max(0, int(source_box[1]))
+        x2 = min(width, max(x1 + 1, int(np.ceil(source_box[2]))))
+        y2 = min(height, max(y1 + 1, int(np.ceil(source_box[3]))))
+        scaled = cv2.resize(
+            self._display_rgbx[y1:y2, x1:x2], size, interpolation=interpolation
+        )
+        return Image.frombuffer("RGBX", size, scaled, "raw", "RGBX", 0, 1)
+
+    def _ensure_buffers(self, shape):
+        """
+        (Re)allocates the drawing and display buffers when the frame shape changes.
+        (Ré)alloue les tampons de dessin et d'affichage lorsque la forme du cadre change.
+
+        Args:
+            shape (tuple): (height, width, 3) shape of the BGR frame.
+                           Forme (hauteur, largeur, 3) du cadre BGR.
+        """
+        if self._work_bgr is not None and self._work_bgr.shape == shape:
+            return
+        height, width = shape[:2]
+        self._work_bgr = np.empty(shape, dtype=np.uint8)
+        self._display_rgbx = np.empty((height, width, 4), dtype=np.uint8)
+        # RGBX images built with frombuffer share memory with the array instead of copying it
+        # Les images RGBX créées avec frombuffer partagent la mémoire du tableau au lieu de la copier
+        self.annotated_image = Image.frombuffer(
+            "RGBX", (width, height), self._display_rgbx, "raw", "RGBX", 0, 1
+        )
+
+    @staticmethod
+    def visible_region(image_size, zoom_level, paste_position, label_size):
+        """
+        Computes which part of the image is visible on the label.
+        Calcule quelle partie de l'image est visible sur l'étiquette.
+
+        Args:
+            image_size (tuple): (width, height) of the image at original resolution.
+                                (largeur, hauteur) de l'image en résolution originale.
+            zoom_level (float): Current zoom level.
+                                Niveau de zoom actuel.
+            paste_position (tuple): (x, y) position of the scaled image on the label.
+                                    Position (x, y) de l'image mise à l'échelle sur l'étiquette.
+            label_size (tuple): (width, height) of the display label.
+                                (largeur, hauteur) de l'étiquette d'affichage.
+
+        Returns:
+            tuple: (source_box, destination) where source_box is the (x1, y1, x2, y2) float
+                   rectangle in image coordinates and destination the (x1, y1, x2, y2) integer
+                   rectangle on the label, or None if nothing is visible.
+                   (source_box, destination) où source_box est le rectangle (x1, y1, x2, y2)
+                   en coordonnées d'image et destination le rectangle (x1, y1, x2, y2) sur
+                   l'étiquette, ou Aucun si rien n'est visible.
+        """
+        scaled_width = int(image_size[0] * zoom_level)
+        scaled_height = int(image_size[1] * zoom_level)
+        # Prevent issues with zero or negative dimensions after scaling
+        # Prévient les problèmes avec des dimensions nulles ou négatives après la mise à l'échelle
+        if scaled_width <= 0 or scaled_height <= 0:
+            return None
+
+        paste_x, paste_y = paste_position
+        # Intersection of the scaled image with the label
+        # Intersection de l'image mise à l'échelle avec l'étiquette
+        x1 = max(0, paste_x)
+        y1 = max(0, paste_y)
+        x2 = min(label_size[0], paste_x + scaled_width)
+        y2 = min(label_size[1], paste_y + scaled_height)
+        if x2 <= x1 or y2 <= y1:
+            return None
+
+        # Map the visible label rectangle back to image coordinates
+        # Ramène le rectangle visible de l'étiquette en coordonnées d'image
+        scale_x = image_size[0] / scaled_width
+        scale_y = image_size[1] / scaled_height
+        source_box = (
+            (x1 - paste_x) * scale_x,
+            (y1 - paste_y) * scale_y,
+            (x2 - paste_x) * scale_x,
+            (y2 - paste_y) * scale_y,
+        )
+        return source_box, (x1, y1, x2, y2)
+
+
+# Raster layer of the freehand stroke being drawn, extended segment by segment
+# Couche raster du tracé à main levée en cours, complétée segment par segment
+class StrokePreviewLayer:
+    def __init__(self):
+        """
+        Initializes an empty StrokePreviewLayer.
+        Initialise un StrokePreviewLayer vide.
+        """
+        self._color_layer = None  # BGR stroke pixels at image resolution / Pixels BGR du tracé en résolution d'image
+        self._mask = None  # Coverage of the stroke / Couverture du tracé
+        self._drawn = 0  # Number of points already rasterized / Nombre de points déjà rastérisés
+        self._bbox = None  # (x1, y1, x2, y2) region touched by the stroke / Région touchée par le tracé
+        self._style = None  # (color, thickness, first point) the layer was drawn with / (couleur, épaisseur, premier point) utilisés pour la couche
+
+    def reset(self):
+        """
+        Clears the stroke, e.g. when it is committed as an annotation; only the region
+        it touched is erased, the buffers are kept for the next stroke.
+        Efface le tracé, par exemple lorsqu'il est validé comme annotation ; seule la région
+        touchée est effacée, les tampons sont conservés pour le prochain tracé.
+        """
+        if self._bbox is not None:
+            x1, y1, x2, y2 = self._bbox
+            self._mask[y1:y2, x1:x2] = 0
+        self._drawn = 0
+        self._bbox = None
+
+    def composite(self, frame, points, color, thickness):
+        """
+        Rasterizes the points added since the last call and draws the stroke on the frame.
+        Rastérise les points ajoutés depuis le dernier appel et dessine le tracé sur le cadre.
+
+        Args:
+            frame (numpy.ndarray): BGR frame to draw on.
+                                   Cadre BGR sur lequel dessiner.
+            points (list): (x, y) points of the stroke in image coordinates; only appended to.
+                           Points (x, y) du tracé en coordonnées d'image ; uniquement complétés en fin de liste.
+            color (tuple): BGR color of the stroke.
+                           Couleur BGR du tracé.
+            thickness (int): Thickness of the stroke.
+                             Épaisseur du tracé.
+        """
+        height, width = frame.shape[:2]
+        if self._mask is None or self._mask.shape != (height, width):
+            self._color_layer = np.zeros((height, width, 3), dtype=np.uint8)
+            self._mask = np.zeros((height, width), dtype=np.uint8)
+            self._drawn = 0
+            self._bbox = None
+        style = (color, thickness, tuple(points[0]) if len(points) else None)
+        if style != self._style or len(points) < self._drawn:
+            # Style changed or new stroke: rasterize again from the first point
+            # Style modifié ou nouveau tracé : rastérise à nouveau depuis le premier point
+            self.reset()
+            self._style = style
+
+        if len(points) > self._drawn:
+            # Overlap one point so the new segments join the previous ones
+            # Chevauche d'un point pour que les nouveaux segments rejoignent les précédents
+            new_points = np.asarray(
+                points[max(0, self._drawn - 1):], dtype=np.int32
+            ).reshape(-1, 2)
+            cv2.polylines(self._color_layer, [new_points], False, color, thickness)
+            cv2.polylines(self._mask, [new_points], False, 255, thickness)
+            self._drawn = len(points)
+            margin = thickness + 1
+            x1, y1 = new_points.min(axis=0) - margin
+            x2, y2 = new_points.max(axis=0) + margin + 1
+            if self._bbox is not None:
+                x1, y1 = min(x1, self._bbox[0]), min(y1, self._bbox[1])
+                x2, y2 = max(x2, self._bbox[2]), max(y2, self._bbox[3])
+            self._bbox = (
+                int(max(0, x1)),
+                int(max(0, y1)),
+                int(min(width, x2)),
+                int(min(height, y2)),
+            )
+
+        if self._bbox is not None:
+            x1, y1, x2, y2 = self._bbox
+            if x2 > x1 and y2 > y1:
+                # One masked copy over the region touched by the stroke
+                # Une seule copie masquée sur la région touchée par le tracé
+                cv2.copyTo(
+                    self._color_layer[y1:y2, x1:x2],
+                    self._mask[y1:y2, x1:x2],
+                    frame[y1:y2, x1:x2],
+                )
+
+
+# Committed annotations rasterized once into BGRA layers and composited over each new frame
+# Annotations validées rastérisées une seule fois dans des couches BGRA et composées sur chaque nouvelle trame
+class AnnotationOverlay:
+    def __init__(self):
+        """
+        Initializes an empty AnnotationOverlay.
+        Initialise un AnnotationOverlay vide.
+        """
+        self._key = None  # (revision, frame shape) the passes were built for / (révision, forme du cadre) des passes construites
+        self._passes = []  # Cached layers and live annotations in drawing order / Couches en cache et annotations dynamiques dans l'ordre de dessin
+        self._scratch = None  # Reused full-size BGRA drawing buffer / Tampon de dessin BGRA pleine taille réutilisé
+
+    def invalidate(self):
+        """
+        Forces the layers to be rasterized again on the next composite.
+        Force une nouvelle rastérisation des couches au prochain compositage.
+        """
+        self._key = None
+
+    def composite(self, frame, annotations, revision):
+        """
+        Draws the annotations on a frame, rebuilding the cached layers only when the
+        annotation revision or the frame shape changed.
+        Dessine les annotations sur un cadre, en ne reconstruisant les couches en cache que
+        lorsque la révision des annotations ou la forme du cadre a changé.
+
+        Args:
+            frame (numpy.ndarray): BGR frame to draw on, modified in place.
+                                   Cadre BGR sur lequel dessiner, modifié sur place.
+            annotations (list): Annotations in drawing order.
+                                Annotations dans l'ordre de dessin.
+            revision (int): Incremented by the caller whenever any annotation changes.
+                            Incrémenté par l'appelant à chaque modification d'une annotation.
+        """
+        key = (revision, frame.shape)
+        if key != self._key:
+            self._rebuild(annotations, frame.shape)
+            self._key = key
+
+        for layer, annotation in self._passes:
+            if annotation is not None:
+                # Blur and anti-aliased text are drawn on every frame, in z-order
+                # Le flou et le texte lissé sont dessinés sur chaque trame, dans l'ordre z
+                annotation.draw(frame)
+                continue
+            (x1, y1, x2, y2), color, alpha, inverse_alpha = layer
+            roi = frame[y1:y2, x1:x2]
+            if inverse_alpha is None:
+                # Fully opaque layer: one masked copy
+                # Couche entièrement opaque : une seule copie masquée
+                cv2.copyTo(color, alpha, roi)
+            else:
+                # Premultiplied blend: frame * (1 - alpha) + color
+                # Mélange prémultiplié : cadre * (1 - alpha) + couleur
+                cv2.multiply(roi, inverse_alpha, dst=roi, scale=1 / 255)
+                cv2.add(roi, color, dst=roi)
+
+    def _rebuild(self, annotations, shape):
+        """
+        Splits the annotations into runs separated by the annotations that are not
+        overlay_cacheable and rasterizes each run into a layer cropped to the pixels it covers.
+        Découpe les annotations en séries séparées par les annotations qui ne sont pas
+        overlay_cacheable et rastérise chaque série dans une couche recadrée sur les pixels couverts.
+
+        Args:
+            annotations (list): Annotations in drawing order.
+                                Annotations dans l'ordre de dessin.
+            shape (tuple): (height, width, 3) shape of the frames.
+                           Forme (hauteur, largeur, 3) des cadres.
+        """
+        self._passes = []
+        run = []
+        for annotation in annotations:
+            if not annotation.overlay_cacheable:
+                self._add_layer(run, shape)
+                self._passes.append((None, annotation))
+                run = []
+            else:
+                run.append(annotation)
+        self._add_layer(run, shape)
+
+    def _add_layer(self, run, shape):
+        """
+        Rasterizes a run of annotations into a premultiplied BGRA layer and stores its
+        covered region.
+        Rastérise une série d'annotations dans une couche BGRA prémultipliée et stocke sa
+        région couverte.
+        """
+        if not run:
+            return
+        height, width = shape[:2]
+        if self._scratch is None or self._scratch.shape[:2] != (height, width):
+            self._scratch = np.zeros((height, width, 4), dtype=np.uint8)
+        # Drawing opaque colors on a zeroed BGRA buffer, and translucent ones with addWeighted,
+        # yields premultiplied colors with the coverage in the alpha channel
+        # Dessiner des couleurs opaques sur un tampon BGRA nul, et les translucides avec addWeighted,
+        # donne des couleurs prémultipliées avec la couverture dans le canal alpha
+        draw_annotations(self._scratch, run)
+        x, y, w, h = cv2.boundingRect(self._scratch[:, :, 3])
+        if w == 0 or h == 0:
+            return
+        region = self._scratch[y:y + h, x:x + w]
+        color = np.ascontiguousarray(region[:, :, :3])
+        alpha = np.ascontiguousarray(region[:, :, 3])
+        inverse_alpha = None
+        if np.any((alpha > 0) & (alpha < 255)):
+            inverse_alpha = cv2.merge([cv2.bitwise_not(alpha)] * 3)
+        region[:] = 0  # Leave the scratch buffer clean for the next layer / Laisse le tampon propre pour la couche suivante
+        self._passes.append((((x, y, x + w, y + h), color, alpha, inverse_alpha), None))
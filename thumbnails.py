@@ -0,0 +1,233 @@
+# Page thumbnails generated in the background and cached on disk
+# Vignettes de pages générées en arrière-plan et mises en cache sur disque
+import hashlib
+import os
+import shutil
+import threading
+
+from PIL import Image
+
+from paged_document import open_paged_document, IMAGE_EXTENSIONS
+
+
+# Largest thumbnail size in pixels; the page keeps its aspect ratio inside it
+# Taille maximale d'une vignette en pixels ; la page garde ses proportions à l'intérieur
+THUMBNAIL_SIZE = (96, 128)
+
+# Bumped whenever the rendering of thumbnails changes; older cache folders are ignored
+# Incrémenté à chaque changement du rendu des vignettes ; les anciens dossiers de cache sont ignorés
+THUMBNAIL_VERSION = 1
+
+# Default size cap of the thumbnail cache on disk in bytes
+# Plafond de taille par défaut du cache de vignettes sur disque en octets
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+_HASH_BLOCK = 1024 * 1024  # Bytes read at a time while hashing / Octets lus à la fois pendant le hachage
+
+
+# Identifies the content of a document, so a renamed file keeps its thumbnails and an edited one does not
+# Identifie le contenu d'un document, pour qu'un fichier renommé garde ses vignettes et qu'un fichier modifié les perde
+def document_digest(path):
+    """
+    Returns the SHA-1 of a file's content. For folders, the names, sizes and modification
+    times of the image files are hashed instead of their content.
+    Retourne le SHA-1 du contenu d'un fichier. Pour les dossiers, les noms, tailles et dates
+    de modification des fichiers image sont hachés à la place de leur contenu.
+    """
+    digest = hashlib.sha1()
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if not name.lower().endswith(IMAGE_EXTENSIONS):
+                continue
+            stat = os.stat(os.path.join(path, name))
+            digest.update(f"{name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+        return digest.hexdigest()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# One folder of PNG thumbnails per document digest, least recently opened documents
+# removed above a size cap
+# Un dossier de vignettes PNG par empreinte de document, les documents ouverts le moins
+# récemment étant supprimés au-delà d'un plafond de taille
+class ThumbnailCache:
+    # Initializes a cache stored under root
+    # Initialise un cache stocké sous root
+    def __init__(self, root, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes  # Total size of the folders kept by prune / Taille totale des dossiers gardés par prune
+
+    # Folder holding the thumbnails of a document
+    # Dossier contenant les vignettes d'un document
+    def _folder(self, digest):
+        width, height = THUMBNAIL_SIZE
+        return os.path.join(self.root, f"{digest}-{width}x{height}-v{THUMBNAIL_VERSION}")
+
+    # Returns the cached thumbnail of a page, or None if it is missing or unreadable
+    # Retourne la vignette en cache d'une page, ou None si elle est absente ou illisible
+    def load(self, digest, page_number):
+        path = os.path.join(self._folder(digest), f"{page_number}.png")
+        try:
+            with Image.open(path) as image:
+                return image.convert("RGB")
+        except (OSError, ValueError):
+            return None
+
+    # Writes a thumbnail atomically so a crash never leaves a truncated file
+    # Écrit une vignette de façon atomique pour qu'un plantage ne laisse jamais un fichier tronqué
+    def save(self, digest, page_number, image):
+        folder = self._folder(digest)
+        path = os.path.join(folder, f"{page_number}.png")
+        temporary_path = path + ".tmp"
+        try:
+            os.makedirs(folder, exist_ok=True)
+            image.save(temporary_path, "PNG")
+            os.replace(temporary_path, path)
+        except OSError as e:
+            print(f"Error saving thumbnail: {e}")
+
+    # Marks the folder of a document as recently used, so prune removes it last
+    # Marque le dossier d'un document comme récemment utilisé, pour que prune le supprime en dernier
+    def touch(self, digest):
+        try:
+            os.utime(self._folder(digest))
+        except OSError:
+            pass  # Not cached yet / Pas encore en cache
+
+    # Removes whole document folders, least recently used first, until the cache fits
+    # max_bytes; the folder of keep_digest is never removed
+    # Supprime des dossiers de documents entiers, les moins récemment utilisés d'abord, jusqu'à
+    # ce que le cache tienne dans max_bytes ; le dossier de keep_digest n'est jamais supprimé
+    def prune(self, keep_digest=None):
+        try:
+            entries = [entry for entry in os.scandir(self.root) if entry.is_dir()]
+        except OSError:
+            return
+        folders = []
+        total = 0
+        for entry in entries:
+            try:
+                size = sum(
+                    file.stat().st_size for file in os.scandir(entry.path) if file.is_file()
+                )
+                folders.append((entry.stat().st_mtime, size, entry.path))
+            except OSError:
+                continue
+            total += size
+        keep = self._folder(keep_digest) if keep_digest is not None else None
+        for _mtime, size, path in sorted(folders):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+
+# Worker thread producing the thumbnails of a document, visible pages first
+# Thread de travail produisant les vignettes d'un document, pages visibles d'abord
+class ThumbnailService(threading.Thread):
+    # Initializes the service for a path accepted by open_paged_document;
+    # on_thumbnail(page_number, image) is called from this thread for every page, and again
+    # for the pages passed to set_visible as reload
+    # Initialise le service pour un chemin accepté par open_paged_document ;
+    # on_thumbnail(numéro_de_page, image) est appelé depuis ce thread pour chaque page, et à
+    # nouveau pour les pages passées à set_visible comme reload
+    def __init__(self, path, page_count, cache, on_thumbnail=None):
+        super().__init__(daemon=True)
+        self.path = path
+        self.page_count = page_count
+        self.cache = cache  # ThumbnailCache, or None to keep thumbnails in memory only / ThumbnailCache, ou None pour garder les vignettes en mémoire uniquement
+        self.on_thumbnail = on_thumbnail
+        self._done = set()  # Pages already handed to on_thumbnail / Pages déjà transmises à on_thumbnail
+        self._reload = []  # Done pages to hand over again, see set_visible / Pages faites à transmettre à nouveau, voir set_visible
+        self._visible = (0, 0)  # Inclusive range of pages shown in the strip / Plage inclusive des pages affichées dans le bandeau
+        self._condition = threading.Condition()
+        self._run_flag = True
+
+    # Produces every thumbnail, from the disk cache when possible, then waits for reloads
+    # until stopped
+    # Produit toutes les vignettes, depuis le cache disque si possible, puis attend des
+    # rechargements jusqu'à l'arrêt
+    def run(self):
+        try:
+            digest = document_digest(self.path) if self.cache is not None else None
+            document = open_paged_document(self.path)
+        except Exception as e:
+            print(f"Error opening document for thumbnails: {e}")
+            return
+        if digest is not None:
+            self.cache.touch(digest)
+            self.cache.prune(keep_digest=digest)
+        if document is None:
+            return
+        try:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(
+                        lambda: self._reload
+                        or len(self._done) < self.page_count
+                        or not self._run_flag
+                    )
+                    if not self._run_flag:
+                        return
+                    if self._reload:
+                        page_number = self._reload.pop(0)
+                    else:
+                        page_number = self._next_page()
+                        self._done.add(page_number)
+                image = None
+                if digest is not None:
+                    image = self.cache.load(digest, page_number)
+                if image is None:
+                    try:
+                        # Page objects are released as the worker moves through the document
+                        # Les objets de page sont libérés à mesure que le travail avance dans le document
+                        document.focus(page_number)
+                        image = document.render_thumbnail(page_number, THUMBNAIL_SIZE)
+                    except Exception as e:
+                        print(f"Error rendering thumbnail {page_number + 1}: {e}")
+                        continue
+                    if digest is not None:
+                        self.cache.save(digest, page_number, image)
+                if self.on_thumbnail is not None and self._run_flag:
+                    self.on_thumbnail(page_number, image)
+        finally:
+            document.close()
+
+    # Stops the thread after the thumbnail in progress
+    # Arrête le thread après la vignette en cours
+    def stop(self):
+        with self._condition:
+            self._run_flag = False
+            self._condition.notify_all()
+
+    # Makes the pages shown in the strip the next ones to be produced; reload lists pages
+    # the strip no longer holds, which are handed over again even if they are done
+    # Fait des pages affichées dans le bandeau les prochaines à produire ; reload liste les
+    # pages que le bandeau ne garde plus, transmises à nouveau même si elles sont faites
+    def set_visible(self, first, last, reload=()):
+        with self._condition:
+            self._visible = (first, last)
+            # Pages not done yet are handed over anyway, visible ones first
+            # Les pages pas encore faites sont transmises de toute façon, les visibles d'abord
+            self._reload = [
+                page_number for page_number in reload if page_number in self._done
+            ]
+            self._condition.notify()
+
+    # Returns the next page to produce: visible pages in order, then the others
+    # by distance to the visible range; called while some page is not done
+    # Retourne la prochaine page à produire : les pages visibles dans l'ordre, puis les
+    # autres par distance à la plage visible ; appelé tant qu'une page n'est pas faite
+    def _next_page(self):
+        first, last = self._visible
+        for page_number in range(max(0, first), min(self.page_count, last + 1)):
+            if page_number not in self._done:
+                return page_number
+        for distance in range(1, self.page_count):
+            for page_number in (last + distance, first - distance):
+                if 0 <= page_number < self.page_count and page_number not in self._done:
+                    return page_number
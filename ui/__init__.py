@@ -4,6 +4,7 @@ from ui.theme_manager import ThemeManager, get_theme_manager
 from ui.icon_loader import IconLoader, get_icon_loader
 from ui.compact_sidebar import CompactSidebar
 from ui.top_toolbar import TopToolbar
+from ui.thumbnail_strip import ThumbnailStrip
 
 __all__ = [
     "ThemeManager",
@@ -12,4 +13,5 @@ __all__ = [
     "get_icon_loader",
     "CompactSidebar",
     "TopToolbar",
+    "ThumbnailStrip",
 ]
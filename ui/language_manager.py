@@ -142,6 +142,7 @@ class LanguageManager:
                     "file": {
                         "label": "File",
                         "open": "Open",
+                        "open_folder": "Open Folder",
                         "save": "Save",
                         "close": "Close File",
                         "exit": "Exit",
@@ -232,6 +233,7 @@ class LanguageManager:
                     "file": {
                         "label": "Fichier",
                         "open": "Ouvrir",
+                        "open_folder": "Ouvrir un dossier",
                         "save": "Sauvegarder",
                         "close": "Fermer le fichier",
                         "exit": "Quitter",
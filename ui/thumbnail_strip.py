@@ -0,0 +1,225 @@
+"""Scrollable strip of page thumbnails for VisioDoc3."""
+# Bandeau défilant de vignettes de pages pour VisioDoc3
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PIL import Image, ImageTk
+
+from ui.theme_manager import get_theme_manager
+
+
+# Vertical strip of page thumbnails; only the rows on screen hold canvas items
+# Bandeau vertical de vignettes de pages ; seules les lignes à l'écran ont des éléments de canevas
+class ThumbnailStrip(ttk.Frame):
+    """
+    Shows one row per page with its thumbnail and number.
+
+    Rows are laid out on a fixed pitch so the visible pages follow from the scroll
+    position alone. Canvas items and PhotoImages only exist for the visible rows, and
+    thumbnails are only kept for WINDOW_ROWS rows on each side of them. Rows scrolled
+    back into view are listed to on_visible so their thumbnails can be loaded again.
+    """
+
+    WINDOW_ROWS = 20  # Thumbnails kept on each side of the visible rows / Vignettes gardées de chaque côté des lignes visibles
+
+    # Initializes an empty strip; thumbnail_size is the largest thumbnail in pixels
+    # Initialise un bandeau vide ; thumbnail_size est la plus grande vignette en pixels
+    def __init__(
+        self,
+        parent,
+        thumbnail_size: Tuple[int, int],
+        on_select: Optional[Callable[[int], None]] = None,
+        on_visible: Optional[Callable[[int, int, List[int]], None]] = None,
+        **kwargs,
+    ):
+        super().__init__(parent, **kwargs)
+        self.thumbnail_size = thumbnail_size
+        self.on_select = on_select  # Called with the clicked page / Appelé avec la page cliquée
+        self.on_visible = on_visible  # Called with the first and last visible pages and the visible pages without thumbnail / Appelé avec la première et la dernière page visibles et les pages visibles sans vignette
+        self.page_count = 0
+        self.current_page = None
+        self._thumbnails: Dict[int, Image.Image] = {}  # page -> PIL thumbnail, within the window / page -> vignette PIL, dans la fenêtre
+        self._rows: Dict[int, Tuple[list, Optional[ImageTk.PhotoImage]]] = {}  # Visible page -> (canvas items, PhotoImage) / Page visible -> (éléments du canevas, PhotoImage)
+        self._visible: Tuple[int, int] = (0, -1)
+        self._padding = 6
+        self._label_height = 16
+        self._row_height = thumbnail_size[1] + self._label_height + 2 * self._padding
+        self._build()
+
+    # Creates the canvas and its scrollbar
+    # Crée le canevas et sa barre de défilement
+    def _build(self):
+        theme = get_theme_manager()
+        width = self.thumbnail_size[0] + 2 * self._padding
+        self.canvas = tk.Canvas(
+            self,
+            width=width,
+            highlightthickness=0,
+            yscrollincrement=self._row_height,
+            background=theme.get_color("surface", "#f9fafb"),
+        )
+        self.scrollbar = ttk.Scrollbar(
+            self, orient=tk.VERTICAL, command=self._on_scrollbar
+        )
+        self.canvas.configure(yscrollcommand=self._on_canvas_scroll)
+        self.canvas.pack(side=tk.LEFT, fill=tk.Y, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.canvas.bind("<Configure>", lambda event: self._refresh())
+        self.canvas.bind("<Button-1>", self._on_click)
+        # Windows and macOS send MouseWheel, X11 sends Button-4/5
+        # Windows et macOS envoient MouseWheel, X11 envoie Button-4/5
+        self.canvas.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.canvas.bind("<Button-4>", lambda event: self._scroll(-1))
+        self.canvas.bind("<Button-5>", lambda event: self._scroll(1))
+
+    # Resets the strip for a document of page_count pages
+    # Réinitialise le bandeau pour un document de page_count pages
+    def set_page_count(self, page_count: int):
+        self.clear()
+        self.page_count = page_count
+        self.canvas.configure(
+            scrollregion=(0, 0, 0, page_count * self._row_height)
+        )
+        self.canvas.yview_moveto(0)
+        self._refresh()
+
+    # Removes every row and thumbnail
+    # Supprime toutes les lignes et vignettes
+    def clear(self):
+        self.canvas.delete("all")
+        self._rows.clear()
+        self._thumbnails.clear()
+        self.page_count = 0
+        self.current_page = None
+        self._visible = (0, -1)
+        self.canvas.configure(scrollregion=(0, 0, 0, 0))
+
+    # Stores the thumbnail of a page near the visible rows and shows it if its row is on screen
+    # Enregistre la vignette d'une page proche des lignes visibles et l'affiche si sa ligne est à l'écran
+    def set_thumbnail(self, page_number: int, image: Image.Image):
+        if not 0 <= page_number < self.page_count or not self._in_window(page_number):
+            return
+        self._thumbnails[page_number] = image
+        if page_number in self._rows:
+            self._delete_row(page_number)
+            self._create_row(page_number)
+
+    # Highlights the page being displayed and scrolls it into view
+    # Met en évidence la page affichée et la fait défiler dans la vue
+    def set_current(self, page_number: int):
+        previous, self.current_page = self.current_page, page_number
+        for number in (previous, page_number):
+            if number in self._rows:
+                self._delete_row(number)
+                self._create_row(number)
+        first, last = self._visible
+        if not first <= page_number <= last - 1:
+            self.canvas.yview_moveto(page_number / max(1, self.page_count))
+            self._refresh()
+
+    # Creates the rows that came into view, drops the others and reports the visible range
+    # Crée les lignes entrées dans la vue, supprime les autres et signale la plage visible
+    def _refresh(self):
+        if self.page_count == 0:
+            return
+        top = self.canvas.canvasy(0)
+        bottom = self.canvas.canvasy(self.canvas.winfo_height())
+        first = max(0, int(top // self._row_height))
+        last = min(self.page_count - 1, int(bottom // self._row_height))
+        for page_number in [n for n in self._rows if not first <= n <= last]:
+            self._delete_row(page_number)
+        for page_number in range(first, last + 1):
+            if page_number not in self._rows:
+                self._create_row(page_number)
+        if (first, last) != self._visible:
+            self._visible = (first, last)
+            for page_number in [n for n in self._thumbnails if not self._in_window(n)]:
+                del self._thumbnails[page_number]
+            if self.on_visible is not None:
+                missing = [
+                    n for n in range(first, last + 1) if n not in self._thumbnails
+                ]
+                self.on_visible(first, last, missing)
+
+    # True if a page is within WINDOW_ROWS rows of the visible ones
+    # Vrai si une page est à moins de WINDOW_ROWS lignes des lignes visibles
+    def _in_window(self, page_number: int) -> bool:
+        first, last = self._visible
+        return first - self.WINDOW_ROWS <= page_number <= last + self.WINDOW_ROWS
+
+    # Draws one row: a placeholder or the thumbnail, then the page number
+    # Dessine une ligne : un emplacement vide ou la vignette, puis le numéro de page
+    def _create_row(self, page_number: int):
+        theme = get_theme_manager()
+        top = page_number * self._row_height + self._padding
+        center = self._padding + self.thumbnail_size[0] // 2
+        current = page_number == self.current_page
+        items = []
+        photo = None
+        image = self._thumbnails.get(page_number)
+        if image is not None:
+            width, height = image.size
+            photo = ImageTk.PhotoImage(image)
+            items.append(
+                self.canvas.create_image(
+                    center, top + self.thumbnail_size[1] // 2, image=photo
+                )
+            )
+        else:
+            width, height = self.thumbnail_size
+        # Frame around the thumbnail, thicker and coloured for the current page
+        # Cadre autour de la vignette, plus épais et coloré pour la page courante
+        items.append(
+            self.canvas.create_rectangle(
+                center - width // 2 - 1,
+                top + self.thumbnail_size[1] // 2 - height // 2 - 1,
+                center + (width + 1) // 2,
+                top + self.thumbnail_size[1] // 2 + (height + 1) // 2,
+                outline=theme.get_color("primary" if current else "border", "#d1d5db"),
+                width=3 if current else 1,
+            )
+        )
+        items.append(
+            self.canvas.create_text(
+                center,
+                top + self.thumbnail_size[1] + self._label_height // 2 + 2,
+                text=str(page_number + 1),
+                fill=theme.get_color(
+                    "primary" if current else "text_secondary", "#374151"
+                ),
+            )
+        )
+        self._rows[page_number] = (items, photo)
+
+    def _delete_row(self, page_number: int):
+        items, _ = self._rows.pop(page_number)
+        for item in items:
+            self.canvas.delete(item)
+
+    # Selects the page under the pointer
+    # Sélectionne la page sous le pointeur
+    def _on_click(self, event):
+        page_number = int(self.canvas.canvasy(event.y) // self._row_height)
+        if 0 <= page_number < self.page_count and self.on_select is not None:
+            self.on_select(page_number)
+
+    def _on_mouse_wheel(self, event):
+        self._scroll(-1 if event.delta > 0 else 1)
+
+    # Scrolls by one row per wheel step
+    # Fait défiler d'une ligne par cran de molette
+    def _scroll(self, direction: int):
+        self.canvas.yview_scroll(direction, "units")
+        self._refresh()
+
+    def _on_scrollbar(self, *args):
+        self.canvas.yview(*args)
+        self._refresh()
+
+    # Keeps the scrollbar in sync when the canvas scrolls by itself
+    # Garde la barre de défilement synchronisée quand le canevas défile de lui-même
+    def _on_canvas_scroll(self, first, last):
+        self.scrollbar.set(first, last)
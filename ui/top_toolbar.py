@@ -168,6 +168,9 @@ class TopToolbar(ttk.Frame):
         self.file_menu.add_command(
             label=f"{lm.tr('menus.file.open')} (Ctrl+O)", command=self.app.open_file
         )
+        self.file_menu.add_command(
+            label=lm.tr("menus.file.open_folder"), command=self.app.open_folder
+        )
         self.file_menu.add_command(
             label=f"{lm.tr('menus.file.save')} (Ctrl+Shift+S)",
             command=self.app.save_image,
@@ -4,14 +4,104 @@ import threading
 import cv2
 import time
 import platform
+from collections import namedtuple
+
+
+# A captured frame with its monotonic sequence number and capture timestamp (time.perf_counter)
+# Une trame capturée avec son numéro de séquence monotone et son horodatage de capture (time.perf_counter)
+Frame = namedtuple("Frame", ["sequence", "timestamp", "image"])
+
+
+# Single-producer latest-frame handoff between the capture thread and its consumers
+# Transfert de la dernière trame entre le thread de capture (producteur unique) et ses consommateurs
+class FrameHandoff:
+    # Initializes an empty handoff
+    # Initialise un transfert vide
+    def __init__(self):
+        self._latest = None  # Latest published Frame, replaced atomically / Dernière trame publiée, remplacée de façon atomique
+        self._sequence = 0  # Sequence number of the latest frame / Numéro de séquence de la dernière trame
+        self._condition = (
+            threading.Condition()
+        )  # Only used to wake up waiting consumers / Utilisé uniquement pour réveiller les consommateurs en attente
+
+    # Publishes a new frame; the image must not be modified afterwards
+    # Publie une nouvelle trame ; l'image ne doit plus être modifiée ensuite
+    def publish(self, image, timestamp):
+        self._sequence += 1
+        # Swapping the reference is atomic, readers never see a partially written frame
+        # L'échange de référence est atomique, les lecteurs ne voient jamais une trame partiellement écrite
+        self._latest = Frame(self._sequence, timestamp, image)
+        with self._condition:
+            self._condition.notify_all()
+
+    # Returns the latest Frame without locking, or None if nothing was captured yet
+    # Retourne la dernière trame sans verrou, ou None si rien n'a encore été capturé
+    def latest(self):
+        return self._latest
+
+    # Returns the latest Frame if it is newer than the given sequence number, otherwise None
+    # Retourne la dernière trame si elle est plus récente que le numéro de séquence donné, sinon None
+    def newer_than(self, sequence):
+        latest = self._latest
+        if latest is not None and latest.sequence > sequence:
+            return latest
+        return None
+
+    # Blocks until a frame newer than the given sequence number is published or the timeout expires
+    # Bloque jusqu'à la publication d'une trame plus récente que le numéro donné ou l'expiration du délai
+    def wait_newer_than(self, sequence, timeout=None):
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self.newer_than(sequence) is not None, timeout
+            )
+        return self.newer_than(sequence)
+
+
+# Capture pacing modes: let read() block at the camera rate, sleep to a target FPS,
+# or drain the driver queue with grab() and only retrieve() the newest frame
+# Modes de cadence de capture : laisser read() bloquer au rythme de la caméra, dormir jusqu'à
+# une cadence cible, ou vider la file du pilote avec grab() et ne récupérer que la trame la plus récente
+PACING_FREE_RUN = "free_run"
+PACING_TARGET_FPS = "target_fps"
+PACING_LATEST = "latest"
+PACING_MODES = (PACING_FREE_RUN, PACING_TARGET_FPS, PACING_LATEST)
+
+# Pixel formats that can be requested from the driver; MJPG keeps USB 2 cameras at full
+# frame rate in high resolutions where uncompressed YUYV is limited by the bus bandwidth
+# Formats de pixels pouvant être demandés au pilote ; MJPG garde les caméras USB 2 à pleine
+# cadence en haute résolution, là où le YUYV non compressé est limité par la bande passante du bus
+CAPTURE_FORMATS = ("MJPG", "YUYV")
+
+
+# Converts a FOURCC code returned by CAP_PROP_FOURCC to its four-letter string
+# Convertit un code FOURCC retourné par CAP_PROP_FOURCC en sa chaîne de quatre lettres
+def decode_fourcc(value):
+    code = int(value)
+    if code <= 0:
+        return None
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
 
 
 # Thread-based video stream for non-blocking camera capture
 # Flux vidéo basé sur thread pour une capture de caméra sans blocage
 class VideoStreamThread(threading.Thread):
+    MAX_DRAINED_FRAMES = 8  # Upper bound of stale frames skipped per read / Nombre maximal de trames périmées ignorées par lecture
+    QUEUED_GRAB_TIME = 0.005  # A grab faster than this returned a queued frame / Une saisie plus rapide a retourné une trame en file
+
     # Initializes the video stream thread with camera settings
     # Initialise le thread de flux vidéo avec les paramètres de la caméra
-    def __init__(self, camera_index=0, width=1280, height=720):
+    def __init__(
+        self,
+        camera_index=0,
+        width=1280,
+        height=720,
+        on_frame=None,
+        pacing=PACING_FREE_RUN,
+        target_fps=30.0,
+        fourcc=None,
+        fps=None,
+        buffer_size=None,
+    ):
         super().__init__()
         self.camera_index = (
             camera_index  # Index of the camera device / Index du périphérique caméra
@@ -20,19 +110,30 @@ class VideoStreamThread(threading.Thread):
         self.height = height  # Frame height in pixels / Hauteur de la trame en pixels
         self.cap = None  # OpenCV VideoCapture object / Objet VideoCapture OpenCV
         self._run_flag = True  # Controls the main capture loop / Contrôle la boucle principale de capture
-        self.frame = None  # Latest captured frame / Dernière trame capturée
-        self.lock = (
-            threading.Lock()
-        )  # Thread lock for frame access / Verrou de thread pour l'accès à la trame
+        self.frames = (
+            FrameHandoff()
+        )  # Latest captured frame with its sequence number / Dernière trame capturée avec son numéro de séquence
         self.flip_h = False  # Horizontal flip state / État de retournement horizontal
         self.flip_v = False  # Vertical flip state / État de retournement vertical
+        self.on_frame = on_frame  # Called from this thread after each new frame; must not block or call Tk / Appelé depuis ce thread après chaque nouvelle trame ; ne doit ni bloquer ni appeler Tk
 
-        # Performance optimization
-        # Optimisation des performances
-        self._target_interval = (
-            0.033  # ~30 FPS target / Cible d'environ 30 images par seconde
-        )
-        self._last_frame_time = 0  # Timestamp for frame timing / Horodatage pour la synchronisation des trames
+        # Requested capture format, None leaves the driver default
+        # Format de capture demandé, None laisse la valeur par défaut du pilote
+        self.fourcc = fourcc  # Pixel format, e.g. "MJPG" / Format de pixels, par ex. "MJPG"
+        self.fps = fps  # Frame rate requested from the driver / Cadence demandée au pilote
+        self.buffer_size = buffer_size  # Driver queue length / Longueur de la file du pilote
+        self.negotiated = None  # Format actually granted by the driver / Format réellement accordé par le pilote
+
+        # Capture pacing, can be changed while the stream is running
+        # Cadence de capture, modifiable pendant que le flux tourne
+        self.pacing = pacing  # One of PACING_MODES / L'un des PACING_MODES
+        self.target_fps = target_fps  # Used by PACING_TARGET_FPS / Utilisé par PACING_TARGET_FPS
+        self._last_frame_time = 0  # Timestamp of the previous frame / Horodatage de la trame précédente
+
+        # Measured statistics
+        # Statistiques mesurées
+        self.measured_fps = 0.0  # Smoothed capture rate / Cadence de capture lissée
+        self.dropped_frames = 0  # Stale frames skipped by PACING_LATEST / Trames périmées ignorées par PACING_LATEST
 
     # Main thread execution - opens camera and captures frames
     # Exécution principale du thread - ouvre la caméra et capture les trames
@@ -46,11 +147,6 @@ class VideoStreamThread(threading.Thread):
             # Utilise le backend par défaut pour les autres plateformes
             self.cap = cv2.VideoCapture(self.camera_index)
 
-        # Set the desired frame dimensions
-        # Définit les dimensions souhaitées de la trame
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
-
         # Check if camera opened successfully
         # Vérifie si la caméra s'est ouverte avec succès
         if not self.cap.isOpened():
@@ -58,38 +154,149 @@ class VideoStreamThread(threading.Thread):
             self._run_flag = False
             return
 
+        self.negotiated = self._negotiate_format()
+
         self._last_frame_time = time.perf_counter()
+        next_deadline = None  # Start of the next read in PACING_TARGET_FPS / Début de la prochaine lecture en PACING_TARGET_FPS
 
         # Main capture loop
         # Boucle principale de capture
         while self._run_flag:
-            ret, frame = self.cap.read()
+            ret, frame = self._acquire()
             if ret:
-                with self.lock:
-                    # Apply horizontal flip if enabled
-                    # Applique le retournement horizontal si activé
-                    if self.flip_h:
-                        frame = cv2.flip(frame, 1)
-                    # Apply vertical flip if enabled
-                    # Applique le retournement vertical si activé
-                    if self.flip_v:
-                        frame = cv2.flip(frame, 0)
-                    self.frame = frame
+                timestamp = time.perf_counter()
+                # Flips run on this thread before publishing, so consumers never wait on them
+                # Les retournements s'exécutent sur ce thread avant la publication, les consommateurs ne les attendent jamais
+                # Apply horizontal flip if enabled
+                # Applique le retournement horizontal si activé
+                if self.flip_h:
+                    frame = cv2.flip(frame, 1)
+                # Apply vertical flip if enabled
+                # Applique le retournement vertical si activé
+                if self.flip_v:
+                    frame = cv2.flip(frame, 0)
+                self.frames.publish(frame, timestamp)
+                self._update_fps(timestamp)
+                # Notify the consumer that a new frame is available, unless stopping
+                # Notifie le consommateur qu'une nouvelle trame est disponible, sauf à l'arrêt
+                if self.on_frame and self._run_flag:
+                    self.on_frame()
             else:
                 break
 
-            # Adaptive timing based on actual frame rate
-            # Temporisation adaptative basée sur le taux de trames réel
-            elapsed = time.perf_counter() - self._last_frame_time
-            sleep_time = max(0, self._target_interval - elapsed)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-            self._last_frame_time = time.perf_counter()
+            if self.pacing == PACING_TARGET_FPS and self.target_fps > 0:
+                # Deadlines advance by exactly one interval, so the read and on_frame times
+                # do not add up to it; a stream that fell behind starts over from now
+                # rather than catching up with a burst
+                # Les échéances avancent d'exactement un intervalle, les temps de lecture et de
+                # on_frame ne s'y ajoutent donc pas ; un flux en retard repart de maintenant
+                # plutôt que de rattraper par une rafale
+                now = time.perf_counter()
+                next_deadline = (next_deadline or now) + 1.0 / self.target_fps
+                if next_deadline < now:
+                    next_deadline = now
+                time.sleep(next_deadline - now)
+            else:
+                next_deadline = None
 
         # Release the camera when done
         # Libère la caméra à la fin
         self.cap.release()
 
+    # Requests the capture format and reads back what the driver granted
+    # Demande le format de capture et relit ce que le pilote a accordé
+    def _negotiate_format(self):
+        # The pixel format must be set before the frame size, otherwise V4L2 may keep
+        # the previous format and reject sizes it cannot deliver in it
+        # Le format de pixels doit être défini avant la taille de trame, sinon V4L2 peut garder
+        # le format précédent et refuser les tailles qu'il ne peut pas fournir dans ce format
+        if self.fourcc:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.fourcc))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        if self.fps:
+            self.cap.set(cv2.CAP_PROP_FPS, float(self.fps))
+        if self.buffer_size:
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, int(self.buffer_size))
+
+        buffer_size = int(self.cap.get(cv2.CAP_PROP_BUFFERSIZE))
+        negotiated = {
+            "fourcc": decode_fourcc(self.cap.get(cv2.CAP_PROP_FOURCC)),
+            "width": int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "fps": self.cap.get(cv2.CAP_PROP_FPS) or None,
+            "buffer_size": buffer_size if buffer_size > 0 else None,
+        }
+        requested = {
+            "fourcc": self.fourcc,
+            "width": self.width,
+            "height": self.height,
+            "fps": self.fps,
+            "buffer_size": self.buffer_size,
+        }
+        # Report every requested value the driver did not grant
+        # Signale chaque valeur demandée que le pilote n'a pas accordée
+        for key, value in requested.items():
+            if value and negotiated[key] is not None and negotiated[key] != value:
+                print(
+                    f"Camera {self.camera_index}: requested {key}={value}, "
+                    f"driver granted {negotiated[key]}"
+                )
+        return negotiated
+
+    # Reads one frame according to the pacing mode
+    # Lit une trame selon le mode de cadence
+    def _acquire(self):
+        if self.pacing != PACING_LATEST:
+            # read() blocks until the driver delivers a frame
+            # read() bloque jusqu'à ce que le pilote livre une trame
+            return self.cap.read()
+
+        # Frames already queued by the driver are grabbed almost instantly; such a frame is
+        # stale and is replaced by the next grab, until a grab has to wait for the sensor,
+        # which means the queue is empty and the frame just grabbed is fresh
+        # Les trames déjà en file dans le pilote sont saisies presque instantanément ; une telle
+        # trame est périmée et remplacée par la saisie suivante, jusqu'à ce qu'une saisie attende
+        # le capteur, ce qui signifie que la file est vide et que la trame saisie est récente
+        for drained in range(self.MAX_DRAINED_FRAMES + 1):
+            start = time.perf_counter()
+            if not self.cap.grab():
+                return False, None
+            if time.perf_counter() - start > self.QUEUED_GRAB_TIME:
+                break
+            # The last stale frame is kept rather than grabbing forever
+            # La dernière trame périmée est gardée plutôt que de saisir indéfiniment
+            if drained < self.MAX_DRAINED_FRAMES:
+                self.dropped_frames += 1
+        return self.cap.retrieve()
+
+    # Updates the smoothed capture rate from the time between two frames
+    # Met à jour la cadence de capture lissée à partir du temps entre deux trames
+    def _update_fps(self, timestamp):
+        previous = self._last_frame_time
+        self._last_frame_time = timestamp
+        interval = timestamp - previous
+        if not previous or interval <= 0:
+            return
+        if self.measured_fps == 0.0:
+            self.measured_fps = 1.0 / interval
+        else:
+            self.measured_fps = 0.9 * self.measured_fps + 0.1 / interval
+
+    # Returns the measured stream statistics
+    # Retourne les statistiques mesurées du flux
+    def get_stats(self):
+        latest = self.frames.latest()
+        return {
+            "pacing": self.pacing,
+            "negotiated": self.negotiated,
+            "fps": self.measured_fps,
+            "dropped_frames": self.dropped_frames,
+            "frame_age": (
+                time.perf_counter() - latest.timestamp if latest is not None else None
+            ),
+        }
+
     # Stops the video stream thread gracefully
     # Arrête le thread de flux vidéo de manière appropriée
     def stop(self):
@@ -98,8 +305,18 @@ class VideoStreamThread(threading.Thread):
     # Returns the most recent captured frame
     # Retourne la trame capturée le plus récemment
     def get_frame(self):
-        with self.lock:
-            return self.frame
+        latest = self.frames.latest()
+        return latest.image if latest is not None else None
+
+    # Returns the latest Frame (sequence, timestamp, image) if newer than the given sequence, otherwise None
+    # Retourne la dernière trame (séquence, horodatage, image) si plus récente que la séquence donnée, sinon None
+    def get_frame_newer_than(self, sequence):
+        return self.frames.newer_than(sequence)
+
+    # Waits for a Frame newer than the given sequence, returns None on timeout
+    # Attend une trame plus récente que la séquence donnée, retourne None à l'expiration du délai
+    def wait_for_frame(self, sequence, timeout=None):
+        return self.frames.wait_newer_than(sequence, timeout)
 
     # Switches to a different camera by index
     # Change pour une caméra différente par index
@@ -113,11 +330,9 @@ class VideoStreamThread(threading.Thread):
     # Toggles horizontal flip of the video stream
     # Active/désactive le retournement horizontal du flux vidéo
     def flip_horizontal(self):
-        with self.lock:
-            self.flip_h = not self.flip_h
+        self.flip_h = not self.flip_h
 
     # Toggles vertical flip of the video stream
     # Active/désactive le retournement vertical du flux vidéo
     def flip_vertical(self):
-        with self.lock:
-            self.flip_v = not self.flip_v
+        self.flip_v = not self.flip_v
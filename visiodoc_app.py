@@ -9,6 +9,7 @@ import sys
 import platform
 
 from ui.theme_manager import get_theme_manager
+from ui.thumbnail_strip import ThumbnailStrip
 from ui.icon_loader import get_icon_loader
 from ui.compact_sidebar import CompactSidebar
 from ui.top_toolbar import TopToolbar
@@ -61,8 +62,6 @@ if platform.system() == "Windows":
     except ImportError:
         DSShow = None  # Set to None if pygrabber is not available / Définit à Aucun si pygrabber n'est pas disponible
 
-import fitz  # PyMuPDF for PDF handling / PyMuPDF pour la gestion des PDF
-
 # Import custom annotation classes
 # Importe les classes d'annotation personnalisées
 from annotations import (
@@ -74,13 +73,55 @@ from annotations import (
     BlurAnnotation,
     ArrowAnnotation,
     HighlightAnnotation,
+    REDACTION_GAUSSIAN,
+    REDACTION_METHODS,
+    draw_annotations,
+    simplify_stroke,
 )
 from tooltip import (
     Tooltip,
 )  # Import Tooltip class for hover help / Importe la classe Tooltip pour l'aide au survol
 from video_stream import (
     VideoStreamThread,
+    PACING_FREE_RUN,
+    PACING_MODES,
+    CAPTURE_FORMATS,
 )  # Import VideoStreamThread for camera handling / Importe VideoStreamThread pour la gestion de la caméra
+from annotation_index import (
+    AnnotationIndex,
+)
+from annotation_history import (
+    AnnotationHistory,
+    DEFAULT_MAX_BYTES,
+)
+from camera_enumeration import (
+    CameraDevice,
+    enumerate_v4l2_cameras,
+    device_identity,
+)
+from camera_cache import (
+    CameraCache,
+)
+from paged_document import (
+    open_paged_document,
+)
+from page_render import (
+    PageRenderService,
+    MAX_UPSCALE,
+)
+from thumbnails import (
+    ThumbnailCache,
+    ThumbnailService,
+    THUMBNAIL_SIZE,
+)
+from render_pipeline import (
+    RenderPipeline,
+    StrokePreviewLayer,
+    AnnotationOverlay,
+    DEFAULT_QUALITY_POLICY,
+    QUALITY_POLICIES,
+    select_interpolation,
+)  # Import RenderPipeline for cached display rendering / Importe RenderPipeline pour le rendu d'affichage mis en cache
 
 
 # Main application class for VisioDoc3
@@ -117,11 +158,23 @@ class VisioDoc3(tk.Tk):
     # Ensure config directory exists
     os.makedirs(config_dir, exist_ok=True)
     CONFIG_FILE = os.path.join(config_dir, "camera_config.json")
+    CAMERA_CACHE_FILE = os.path.join(config_dir, "camera_cache.json")
+    THUMBNAIL_CACHE_DIR = os.path.join(config_dir, "thumbnails")
 
-    def __init__(self):
+    # Interval at which the Tk thread checks for new camera frames, in milliseconds
+    # Intervalle auquel le fil Tk vérifie l'arrivée de nouvelles trames de caméra, en millisecondes
+    FRAME_POLL_MS = 5
+
+    def __init__(self, launch_time=None):
         """
         Initializes the VisioDoc3 application window and its components.
         Initialise la fenêtre de l'application VisioDoc3 et ses composants.
+
+        Args:
+            launch_time (float, optional): time.perf_counter() at process start, used to
+                                           measure the time to the first camera frame.
+                                           time.perf_counter() au démarrage du processus, utilisé
+                                           pour mesurer le temps jusqu'à la première trame de la caméra.
         """
         super().__init__()
         self.language_manager = get_language_manager()
@@ -157,10 +210,34 @@ class VisioDoc3(tk.Tk):
         self.video_stream_thread = (
             None  # Thread managing camera capture / Fil gérant la capture de la caméra
         )
+        self.displayed_frame = None  # Last camera Frame sent to the display / Dernière trame de la caméra envoyée à l'affichage
+        self.display_latency = None  # Smoothed capture-to-display latency in seconds / Latence lissée entre capture et affichage en secondes
+        self._last_stats_report = 0.0  # Time of the last status bar update / Heure de la dernière mise à jour de la barre d'état
+        self.camera_cache = CameraCache(
+            self.CAMERA_CACHE_FILE,
+            "dshow" if platform.system() == "Windows" else "any",  # As opened by VideoStreamThread / Comme ouvert par VideoStreamThread
+        ).load()  # Camera capabilities and last successful settings / Capacités des caméras et derniers paramètres fonctionnels
+        self.launch_time = (
+            launch_time if launch_time is not None else time.perf_counter()
+        )  # Start of the application, for the time to first frame / Démarrage de l'application, pour le temps jusqu'à la première trame
+        self.time_to_first_frame = None  # Seconds from launch to the first camera frame / Secondes entre le lancement et la première trame
+        self.camera_resolutions = {}  # Resolutions reported by V4L2 per camera index / Résolutions signalées par V4L2 par index de caméra
+        self.camera_formats = {}  # Pixel formats reported by V4L2 per camera index / Formats de pixels signalés par V4L2 par index de caméra
+        self.camera_frame_rates = {}  # Frame rates reported by V4L2 per camera index / Cadences signalées par V4L2 par index de caméra
+        self._negotiated_saved_for = None  # Stream whose negotiated format was saved / Flux dont le format négocié a été sauvegardé
         self.current_photo = None  # PhotoImage object for displaying on Tkinter label / Objet PhotoImage pour l'affichage sur l'étiquette Tkinter
+        self.render_pipeline = RenderPipeline()  # Cached render stages for the display / Étapes de rendu mises en cache pour l'affichage
+        self.annotation_overlay = AnnotationOverlay()  # Cached raster of the committed annotations for webcam frames / Raster en cache des annotations validées pour les trames de la webcam
+        self.stroke_preview = StrokePreviewLayer()  # Incremental raster of the freehand stroke in progress / Raster incrémental du tracé à main levée en cours
         self.annotations = []  # List to store all annotation objects / Liste pour stocker tous les objets d'annotation
-        self.undo_stack = []  # Stack for storing undone annotations for redo functionality / Pile pour stocker les annotations annulées pour la fonctionnalité de rétablissement
-        self.redo_stack = []  # Stack for storing annotations that can be redone / Pile pour stocker les annotations qui peuvent être rétablies
+        self.annotation_index = AnnotationIndex()  # Grid over self.annotations for hit-testing / Grille sur self.annotations pour le test de collision
+        self.annotations_revision = 0  # Incremented whenever an annotation changes / Incrémenté à chaque modification d'une annotation
+        self.history = AnnotationHistory(
+            self.annotations,
+            self.annotation_index,
+            self._read_config_file().get("history_max_bytes", DEFAULT_MAX_BYTES),
+        )  # Undo/redo journal of annotation edits, bounded in memory / Journal d'annulation/rétablissement des modifications d'annotations, borné en mémoire
+        self.resize_state = None  # geometry_state of the annotation before the current resize / geometry_state de l'annotation avant le redimensionnement en cours
 
         # Annotation tool state variables
         # Variables d'état de l'outil d'annotation
@@ -169,6 +246,17 @@ class VisioDoc3(tk.Tk):
         self.end_point = None  # Ending point for drawing operations / Point de fin pour les opérations de dessin
         self.drawing = False  # Flag indicating if a drawing operation is in progress / Drapeau indiquant si une opération de dessin est en cours
         self.current_freedraw_points = []  # List of points for freehand drawing / Liste de points pour le dessin à main levée
+        # Freehand input decimation and simplification, in screen pixels so they follow the zoom level
+        # Décimation et simplification du dessin à main levée, en pixels d'écran pour suivre le niveau de zoom
+        self.freedraw_min_distance = 2.0  # Motion events closer than this to the last point are dropped / Les mouvements plus proches du dernier point sont ignorés
+        self.freedraw_simplify_tolerance = 1.0  # Ramer-Douglas-Peucker tolerance on release, 0 disables it / Tolérance de Ramer-Douglas-Peucker au relâchement, 0 la désactive
+        self.blur_method = REDACTION_GAUSSIAN  # Redaction method of new blur annotations / Méthode de masquage des nouvelles annotations de flou
+        self.freedraw_stats = {
+            "strokes": 0,
+            "motion_events": 0,
+            "decimated_points": 0,
+            "simplified_points": 0,
+        }  # Points before and after each stage, for all strokes / Points avant et après chaque étape, pour tous les tracés
         self.current_annotation_color = (
             0,
             0,
@@ -184,8 +272,17 @@ class VisioDoc3(tk.Tk):
         # Variables du mode fichier (pour la visualisation d'images et de PDF)
         self.file_mode = False  # True if an image/PDF file is loaded, False for webcam / Vrai si un fichier image/PDF est chargé, Faux pour la webcam
         self.loaded_image = None  # PIL Image object of the loaded file / Objet PIL Image du fichier chargé
-        self.pdf_document = None  # PyMuPDF document object for PDFs / Objet document PyMuPDF pour les PDF
-        self.pdf_pages = []  # List of PDF page objects / Liste d'objets de page PDF
+        self.loaded_image_sequence = 0  # Incremented whenever loaded_image is replaced / Incrémenté à chaque remplacement de loaded_image
+        self.pdf_document = None  # Paged document (PDF, multi-page image or image folder) loading pages on demand / Document paginé (PDF, image multipage ou dossier d'images) chargeant les pages à la demande
+        self.page_renderer = None  # PageRenderService of the open PDF / PageRenderService du PDF ouvert
+        self.thumbnail_service = None  # ThumbnailService of the open PDF / ThumbnailService du PDF ouvert
+        self.thumbnail_cache = ThumbnailCache(
+            self.THUMBNAIL_CACHE_DIR
+        )  # Thumbnails on disk, by document content / Vignettes sur disque, par contenu de document
+        self.pdf_page_image = None  # Rendered image of the displayed page, before any flip / Image rendue de la page affichée, avant tout retournement
+        self.pdf_page_shown = None  # Number of the page in pdf_page_image / Numéro de la page dans pdf_page_image
+        self.pdf_detail = None  # ((page, source_box, size), image) sharp rendering of the zoomed view / Rendu net de la vue zoomée
+        self._requested_detail = None  # Key of the last detail request / Clé de la dernière demande de détail
         self.current_pdf_page = 0  # Current page number for PDF documents / Numéro de page actuel pour les documents PDF
 
         # Zoom and Pan state variables
@@ -196,6 +293,12 @@ class VisioDoc3(tk.Tk):
         self.pan_start_x = 0  # Starting X-coordinate for pan operation / Coordonnée X de départ pour l'opération de panoramique
         self.pan_start_y = 0  # Starting Y-coordinate for pan operation / Coordonnée Y de départ pour l'opération de panoramique
         self.is_panning = False  # Flag indicating if panning is in progress / Drapeau indiquant si le panoramique est en cours
+        self.render_quality = DEFAULT_QUALITY_POLICY  # Render quality policy for zoom/pan gestures / Politique de qualité de rendu pour les gestes de zoom/panoramique
+        self.interactive_render = False  # True while a zoom/pan gesture is in progress / Vrai pendant un geste de zoom/panoramique
+        self._settle_id = None  # Pending high-quality re-render after a gesture / Rendu haute qualité en attente après un geste
+        self._redraw_id = None  # Pending idle redraw, None when the display is up to date / Rafraîchissement en attente, Aucun si l'affichage est à jour
+        self._frame_ready = threading.Event()  # Set by the capture thread, cleared by _poll_frames / Levé par le fil de capture, effacé par _poll_frames
+        self._frame_poll_id = None  # Pending _poll_frames, None while no stream runs / _poll_frames en attente, Aucun tant qu'aucun flux ne tourne
         self.view_for_saving = None  # The final rendered image ready for saving / L'image finale rendue prête à être sauvegardée
 
         self.is_fullscreen = False  # Flag indicating if fullscreen mode is active / Drapeau indiquant si le mode plein écran est actif
@@ -330,9 +433,9 @@ class VisioDoc3(tk.Tk):
         # Protocole pour la gestion de l'événement de fermeture de fenêtre
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
-        # Start updating the display (main loop for rendering)
-        # Commence la mise à jour de l'affichage (boucle principale pour le rendu)
-        self.update_display()
+        # Draw the first frame; later redraws are requested by events
+        # Dessine la première trame ; les rafraîchissements suivants sont demandés par des événements
+        self.request_redraw()
 
         # Close PyInstaller splash screen if it's active
         # Ferme l'écran de démarrage de PyInstaller s'il est actif
@@ -443,6 +546,17 @@ class VisioDoc3(tk.Tk):
         self.image_label = ttk.Label(self.video_frame)
         self.image_label.grid(row=0, column=0, sticky="nsew")
 
+        # Page thumbnails, shown next to the page while a paged document is open
+        # Vignettes des pages, affichées à côté de la page tant qu'un document paginé est ouvert
+        self.thumbnail_strip = ThumbnailStrip(
+            self.video_frame,
+            THUMBNAIL_SIZE,
+            on_select=self.load_pdf_page,
+            on_visible=self._on_thumbnails_visible,
+        )
+        self.thumbnail_strip.grid(row=0, column=1, sticky="ns", padx=(5, 0))
+        self.thumbnail_strip.grid_remove()
+
         # Fullscreen exit button
         self.exit_fullscreen_button = ttk.Button(
             self.video_frame,
@@ -813,6 +927,7 @@ class VisioDoc3(tk.Tk):
         self.image_label.bind("<Button-2>", self.on_pan_start)
         self.image_label.bind("<B2-Motion>", self.on_pan_move)
         self.image_label.bind("<ButtonRelease-2>", self.on_pan_end)
+        self.image_label.bind("<Configure>", self.request_redraw)
 
     def _setup_controls(self):
         """Setup camera/PDF controls."""
@@ -902,6 +1017,34 @@ class VisioDoc3(tk.Tk):
         Si non trouvé ou échoue, il peuple toutes les caméras disponibles.
         Cette fonction s'exécute dans un fil séparé pour éviter de bloquer l'interface utilisateur.
         """
+        # Open the last camera that streamed straight from the capability cache, then
+        # revalidate the device list in the background (this thread)
+        # Ouvre la dernière caméra ayant diffusé directement depuis le cache des capacités,
+        # puis revalide la liste des périphériques en arrière-plan (ce fil)
+        cached = self.camera_cache.last_device()
+        if cached is not None:
+            _key, entry = cached
+            identity = entry["identity"]
+            index = entry["index"]
+            if self._cached_camera_present(identity, index, entry["name"]):
+                print(f"Opening cached camera {entry['name']} ({index})...")
+                # The settings dialog offers the cached capabilities until the scan replaces
+                # them, unless another camera may have taken the index
+                # La boîte de dialogue des paramètres propose les capacités en cache jusqu'à ce que
+                # l'analyse les remplace, sauf si une autre caméra a pu prendre l'index
+                if identity is not None:
+                    self._set_camera_capabilities(
+                        index,
+                        [tuple(size) for size in entry["resolutions"]],
+                        entry["formats"],
+                        entry["frame_rates"],
+                    )
+                resolution = entry["last_settings"].get("resolution")
+                self.after(0, lambda: self._open_cached_camera(index, resolution))
+                self.populate_cameras()
+                return
+            print(f"Cached camera {entry['name']} is no longer at index {index}.")
+
         # Try to load cached camera index from config file
         # Essaie de charger l'index de caméra mis en cache à partir du fichier de configuration
         cached_camera_index = self._load_camera_config()
@@ -940,43 +1083,197 @@ class VisioDoc3(tk.Tk):
         # Si la caméra mise en cache échoue ou n'est pas trouvée, procède à une analyse complète des caméras
         self.populate_cameras()
 
-    def _load_camera_config(self):
+    def _camera_identity(self, index):
         """
-        Loads the last used camera index from the configuration file.
-        Charge le dernier index de caméra utilisé à partir du fichier de configuration.
+        Identifies the physical camera behind an index for the capability cache.
+        Identifie la caméra physique derrière un index pour le cache des capacités.
+
+        Args:
+            index (int): The camera index.
+                         L'index de la caméra.
 
         Returns:
-            int or None: The cached camera index, or None if not found or error.
-                         L'index de caméra mis en cache, ou Aucun si non trouvé ou erreur.
+            str: The USB IDs and port (or sysfs path) on Linux, or None when the camera has
+                 no stable identity.
+                 Les identifiants USB et le port (ou chemin sysfs) sous Linux, ou None quand la
+                 caméra n'a pas d'identité stable.
+        """
+        return device_identity(index) if platform.system() == "Linux" else None
+
+    def _cached_camera_present(self, identity, index, name):
+        """
+        Checks that the cached camera is still the device at its index before opening it.
+        Vérifie que la caméra en cache est toujours le périphérique à son index avant de l'ouvrir.
+
+        A stable identity is compared with the one of the device at the index. Without one,
+        the device is probed again: its DirectShow name is read on Windows, and OpenCV opens
+        the index otherwise.
+        Une identité stable est comparée à celle du périphérique à l'index. Sans identité,
+        le périphérique est sondé à nouveau : son nom DirectShow est lu sous Windows, et
+        OpenCV ouvre l'index sinon.
+
+        Args:
+            identity (str): The cached identity, or None.
+                            L'identité en cache, ou None.
+
+        Returns:
+            bool: True if the camera can be opened from the cache.
+                  Vrai si la caméra peut être ouverte depuis le cache.
+        """
+        if identity is not None:
+            return self._camera_identity(index) == identity
+        if platform.system() == "Windows" and DSShow is not None:
+            try:
+                names = DSShow.get_input_devices()
+            except Exception as e:
+                print(f"Error using pygrabber: {e}")
+            else:
+                return index < len(names) and names[index] == name
+        cap = cv2.VideoCapture(index)
+        opened = cap.isOpened()
+        cap.release()
+        return opened
+
+    def _set_camera_capabilities(self, index, resolutions, formats, frame_rates):
+        """
+        Stores the capabilities offered by the settings dialog for a camera index.
+        Stocke les capacités proposées par la boîte de dialogue des paramètres pour un index de caméra.
+        """
+        self.camera_resolutions[index] = resolutions
+        self.camera_formats[index] = formats
+        self.camera_frame_rates[index] = frame_rates
+
+    def _scanned_camera(self, name, index):
+        """
+        Returns the cache entry of a camera found without V4L2, whose capabilities are unknown.
+        Retourne l'entrée de cache d'une caméra trouvée sans V4L2, dont les capacités sont inconnues.
+        """
+        return CameraDevice(
+            index, None, name, True, [], [], [], self._camera_identity(index)
+        )
+
+    def _open_cached_camera(self, index, resolution):
+        """
+        Starts the stream of the cached camera with its last successful resolution.
+        Démarre le flux de la caméra en cache avec sa dernière résolution fonctionnelle.
+
+        Args:
+            index (int): The cached camera index.
+                         L'index de la caméra en cache.
+            resolution (list): [width, height] the camera last streamed at, or None.
+                               [largeur, hauteur] de la dernière diffusion, ou None.
+        """
+        if self.video_stream_thread is not None:
+            return
+        if resolution:
+            self.current_resolution = tuple(resolution)
+        self.start_video_stream(
+            index, self.current_resolution[0], self.current_resolution[1]
+        )
+
+    def _update_camera_cache(self, devices):
+        """
+        Stores a fresh device enumeration in the capability cache (main thread).
+        Stocke une nouvelle énumération des périphériques dans le cache des capacités (fil principal).
+
+        Args:
+            devices (list): CameraDevice entries of the capture devices.
+                            Entrées CameraDevice des périphériques de capture.
+        """
+        self.camera_cache.update_devices(devices)
+        self.camera_cache.save()
+
+    def _read_config_file(self):
+        """
+        Reads the whole camera configuration file.
+        Lit l'intégralité du fichier de configuration de la caméra.
+
+        Returns:
+            dict: The configuration, or an empty dict if the file is missing or invalid.
+                  La configuration, ou un dictionnaire vide si le fichier est absent ou invalide.
         """
         if os.path.exists(self.CONFIG_FILE):
             try:
                 with open(self.CONFIG_FILE, "r") as f:
                     config = json.load(f)
-                    return config.get("last_camera_index")
+                    if isinstance(config, dict):
+                        return config
             except json.JSONDecodeError:
                 print("Error decoding camera config file.")
-        return None
+        return {}
 
-    def _save_camera_config(self, camera_index):
+    def _write_config_file(self, config):
         """
-        Saves the currently selected camera index to the configuration file.
-        Sauvegarde l'index de caméra actuellement sélectionné dans le fichier de configuration.
+        Writes the whole camera configuration file.
+        Écrit l'intégralité du fichier de configuration de la caméra.
 
         Args:
-            camera_index (int): The index of the camera to save.
-                                L'index de la caméra à sauvegarder.
+            config (dict): The configuration to save.
+                           La configuration à sauvegarder.
         """
-        config = {"last_camera_index": camera_index}
         try:
-            import os
-
             os.makedirs(os.path.dirname(self.CONFIG_FILE), exist_ok=True)
             with open(self.CONFIG_FILE, "w") as f:
                 json.dump(config, f)
         except IOError as e:
             print(f"Error saving camera config file: {e}")
 
+    def _load_camera_config(self):
+        """
+        Loads the last used camera index from the configuration file.
+        Charge le dernier index de caméra utilisé à partir du fichier de configuration.
+
+        Returns:
+            int or None: The cached camera index, or None if not found or error.
+                         L'index de caméra mis en cache, ou Aucun si non trouvé ou erreur.
+        """
+        return self._read_config_file().get("last_camera_index")
+
+    def _save_camera_config(self, camera_index):
+        """
+        Saves the currently selected camera index to the configuration file.
+        Sauvegarde l'index de caméra actuellement sélectionné dans le fichier de configuration.
+
+        Args:
+            camera_index (int): The index of the camera to save.
+                                L'index de la caméra à sauvegarder.
+        """
+        config = self._read_config_file()
+        config["last_camera_index"] = camera_index
+        self._write_config_file(config)
+
+    def _load_camera_settings(self, camera_index):
+        """
+        Loads the per-camera settings (e.g., capture pacing) from the configuration file.
+        Charge les paramètres propres à une caméra (par exemple, la cadence de capture) depuis le fichier de configuration.
+
+        Args:
+            camera_index (int): The index of the camera.
+                                L'index de la caméra.
+
+        Returns:
+            dict: The saved settings, empty if none were saved.
+                  Les paramètres sauvegardés, vide si aucun ne l'a été.
+        """
+        cameras = self._read_config_file().get("cameras", {})
+        return dict(cameras.get(str(camera_index), {}))
+
+    def _save_camera_settings(self, camera_index, **settings):
+        """
+        Saves per-camera settings to the configuration file, keeping the other values.
+        Sauvegarde des paramètres propres à une caméra, en conservant les autres valeurs.
+
+        Args:
+            camera_index (int): The index of the camera.
+                                L'index de la caméra.
+            **settings: Settings to store (e.g., pacing="latest").
+                        Paramètres à stocker (par exemple, pacing="latest").
+        """
+        config = self._read_config_file()
+        cameras = config.setdefault("cameras", {})
+        cameras.setdefault(str(camera_index), {}).update(settings)
+        self._write_config_file(config)
+
     def update_camera_menu(self, initial_camera_index=None):
         """
         Updates the camera selection dropdown menu with found cameras.
@@ -996,6 +1293,11 @@ class VisioDoc3(tk.Tk):
             self.camera_selection_frame.pack_forget()
 
         if not self.use_hybrid_layout:
+            # The menu is rebuilt when the camera list is revalidated after a cached startup
+            # Le menu est reconstruit lorsque la liste des caméras est revalidée après un démarrage depuis le cache
+            for child in self.camera_selection_frame.winfo_children():
+                if child is not self.camera_menu_placeholder:
+                    child.destroy()
             if (
                 self.camera_options
             ):  # If cameras were found / Si des caméras ont été trouvées
@@ -1005,10 +1307,13 @@ class VisioDoc3(tk.Tk):
 
                 # Set the initial selected value in the dropdown
                 # Définit la valeur initiale sélectionnée dans le menu déroulant
-                if initial_camera_index is not None and any(
-                    opt[1] == initial_camera_index for opt in self.camera_options
-                ):
-                    self.camera_var.set(f"Webcam {initial_camera_index}")
+                initial_names = [
+                    opt[0]
+                    for opt in self.camera_options
+                    if opt[1] == initial_camera_index
+                ]
+                if initial_camera_index is not None and initial_names:
+                    self.camera_var.set(initial_names[0])
                     selected_index = initial_camera_index
                 else:
                     self.camera_var.set(
@@ -1031,11 +1336,7 @@ class VisioDoc3(tk.Tk):
 
                 # Start video stream with the selected camera
                 # Démarre le flux vidéo avec la caméra sélectionnée
-                self.start_video_stream(
-                    selected_index,
-                    self.current_resolution[0],
-                    self.current_resolution[1],
-                )
+                self._ensure_video_stream(selected_index)
                 self._save_camera_config(
                     selected_index
                 )  # Save the successfully opened camera to config / Sauvegarde la caméra ouverte avec succès dans la configuration
@@ -1048,18 +1349,35 @@ class VisioDoc3(tk.Tk):
                     style="White.TLabel",
                 ).pack(side=tk.LEFT)
         else:
-            # Hybrid layout: select first camera and start stream
+            # Hybrid layout: keep the requested camera (or the first one) and start its stream
             if self.camera_options:
                 self.camera_options.sort(key=lambda x: x[1])
-                selected_index = self.camera_options[0][1]
-                self.start_video_stream(
-                    selected_index,
-                    self.current_resolution[0],
-                    self.current_resolution[1],
-                )
+                if any(opt[1] == initial_camera_index for opt in self.camera_options):
+                    selected_index = initial_camera_index
+                else:
+                    selected_index = self.camera_options[0][1]
+                self._ensure_video_stream(selected_index)
                 self._save_camera_config(selected_index)
 
-    def _check_camera(self, index, results_list, initial_camera_found):
+    def _ensure_video_stream(self, camera_index):
+        """
+        Starts the stream of a camera unless it is already streaming, so a stream opened
+        from the camera cache is not restarted when the camera list is revalidated.
+        Démarre le flux d'une caméra sauf si elle diffuse déjà, pour qu'un flux ouvert
+        depuis le cache des caméras ne redémarre pas lors de la revalidation de la liste.
+
+        Args:
+            camera_index (int): Index of the camera to stream from.
+                                Indice de la caméra à partir de laquelle diffuser.
+        """
+        thread = self.video_stream_thread
+        if thread and thread.is_alive() and thread.camera_index == camera_index:
+            return
+        self.start_video_stream(
+            camera_index, self.current_resolution[0], self.current_resolution[1]
+        )
+
+    def _check_camera(self, index, results_list, initial_camera_found, name=None):
         """
         Helper function to check if a camera at a given index can be opened.
         Used in a separate thread for non-blocking camera detection.
@@ -1073,22 +1391,55 @@ class VisioDoc3(tk.Tk):
                                  Une liste partagée pour ajouter les caméras trouvées.
             initial_camera_found (list): A mutable list (e.g., [False]) to signal if the first camera was found.
                                          Une liste mutable (par exemple, [False]) pour signaler si la première caméra a été trouvée.
+            name (str): Display name of the camera, "Webcam <index>" if None.
+                        Nom d'affichage de la caméra, "Webcam <index>" si None.
         """
         cap = cv2.VideoCapture(index)
         if cap.isOpened():
-            results_list.append((f"Webcam {index}", index))
-            # If this is the first camera found, start its stream and save to config
-            # Si c'est la première caméra trouvée, démarre son flux et la sauvegarde dans la configuration
-            if not initial_camera_found[0]:
-                self.after(
-                    0,
-                    lambda: self.start_video_stream(
-                        index, self.current_resolution[0], self.current_resolution[1]
-                    ),
-                )
-                self.after(0, lambda: self._save_camera_config(index))
-                initial_camera_found[0] = True
             cap.release()
+            self._add_found_camera(
+                name or f"Webcam {index}", index, results_list, initial_camera_found
+            )
+
+    def _add_found_camera(self, name, index, results_list, initial_camera_found):
+        """
+        Records a detected camera and starts the stream of the first one found.
+        Enregistre une caméra détectée et démarre le flux de la première trouvée.
+
+        Args:
+            name (str): Display name of the camera.
+                        Nom d'affichage de la caméra.
+            index (int): The camera index.
+                         L'index de la caméra.
+            results_list (list): A shared list to append found cameras.
+                                 Une liste partagée pour ajouter les caméras trouvées.
+            initial_camera_found (list): A mutable list (e.g., [False]) to signal if the first camera was found.
+                                         Une liste mutable (par exemple, [False]) pour signaler si la première caméra a été trouvée.
+        """
+        results_list.append((name, index))
+        # If this is the first camera found, start its stream and save to config
+        # Si c'est la première caméra trouvée, démarre son flux et la sauvegarde dans la configuration
+        if not initial_camera_found[0]:
+            initial_camera_found[0] = True
+            self.after(0, lambda: self._start_first_found_camera(index))
+
+    def _start_first_found_camera(self, index):
+        """
+        Starts the stream of the first camera found by a scan, unless a stream was
+        already opened from the camera cache.
+        Démarre le flux de la première caméra trouvée par une analyse, sauf si un flux
+        a déjà été ouvert depuis le cache des caméras.
+
+        Args:
+            index (int): The camera index.
+                         L'index de la caméra.
+        """
+        if self.video_stream_thread is not None:
+            return
+        self.start_video_stream(
+            index, self.current_resolution[0], self.current_resolution[1]
+        )
+        self._save_camera_config(index)
 
     def populate_cameras(self):
         """
@@ -1104,8 +1455,13 @@ class VisioDoc3(tk.Tk):
                 devices = DSShow.get_input_devices()
                 for i, device_name in enumerate(devices):
                     self.camera_options.append((device_name, i))
+                scanned = [
+                    self._scanned_camera(name, index)
+                    for name, index in self.camera_options
+                ]
+                self.after(0, lambda: self._update_camera_cache(scanned))
                 self.after(
-                    0, self.update_camera_menu
+                    0, self._refresh_camera_menu
                 )  # Update UI on main thread / Met à jour l'interface utilisateur sur le fil principal
             except Exception as e:
                 print(f"Error using pygrabber: {e}")
@@ -1119,22 +1475,54 @@ class VisioDoc3(tk.Tk):
 
     def _populate_cameras_linux(self):
         """
-        Populates available cameras by trying indices 0-9 using OpenCV.
-        Each check is done in a separate sub-thread for parallelism.
-        Peuple les caméras disponibles en essayant les indices 0-9 à l'aide d'OpenCV.
-        Chaque vérification est effectuée dans un sous-fil séparé pour le parallélisme.
+        Populates available cameras from the /dev/video* nodes and their V4L2 capabilities.
+        Metadata and output nodes are skipped without being opened; OpenCV only probes the
+        nodes whose capabilities could not be read. Without V4L2 nodes (macOS, or Windows
+        fallback), indices 0-9 are probed with OpenCV.
+        Peuple les caméras disponibles à partir des nœuds /dev/video* et de leurs capacités V4L2.
+        Les nœuds de métadonnées et de sortie sont ignorés sans être ouverts ; OpenCV ne sonde que
+        les nœuds dont les capacités n'ont pas pu être lues. Sans nœuds V4L2 (macOS, ou repli
+        sous Windows), les indices 0-9 sont sondés avec OpenCV.
         """
-        threads = []
+        devices = enumerate_v4l2_cameras() if platform.system() == "Linux" else []
         found_cameras = []
         initial_camera_found = [
             False
         ]  # Use a mutable list to pass by reference / Utilise une liste mutable pour passer par référence
-        for i in range(
-            10
-        ):  # Check up to 10 potential camera indices / Vérifie jusqu'à 10 indices de caméra potentiels
+
+        if not devices:
+            candidates = [
+                (i, None) for i in range(10)
+            ]  # Check up to 10 potential camera indices / Vérifie jusqu'à 10 indices de caméra potentiels
+        else:
+            # Several nodes of the same camera share its name; keep names unique for the menu
+            # Plusieurs nœuds d'une même caméra partagent son nom ; garde des noms uniques pour le menu
+            names = [device.name for device in devices if device.is_capture is not False]
+            candidates = []
+            for device in devices:
+                if device.is_capture is False:
+                    continue
+                name = device.name
+                if names.count(name) > 1:
+                    name = f"{name} (video{device.index})"
+                if device.is_capture:
+                    self._set_camera_capabilities(
+                        device.index,
+                        device.resolutions,
+                        device.formats,
+                        device.frame_rates,
+                    )
+                    self._add_found_camera(
+                        name, device.index, found_cameras, initial_camera_found
+                    )
+                else:
+                    candidates.append((device.index, name))
+
+        threads = []
+        for i, name in candidates:
             thread = threading.Thread(
                 target=self._check_camera,
-                args=(i, found_cameras, initial_camera_found),
+                args=(i, found_cameras, initial_camera_found, name),
                 daemon=True,
             )
             threads.append(thread)
@@ -1144,9 +1532,33 @@ class VisioDoc3(tk.Tk):
             thread.join()  # Wait for all camera check threads to complete / Attend que tous les fils de vérification de caméra se terminent
 
         self.camera_options = found_cameras
-        # Update the camera menu on the main Tkinter thread
-        # Met à jour le menu de la caméra sur le fil principal de Tkinter
-        self.after(0, self.update_camera_menu)
+        if devices:
+            found_indices = {index for _name, index in found_cameras}
+            capture_devices = [
+                device for device in devices if device.index in found_indices
+            ]
+        else:
+            # Probed cameras also revalidate the cache, e.g. on macOS
+            # Les caméras sondées revalident aussi le cache, par exemple sous macOS
+            capture_devices = [
+                self._scanned_camera(name, index) for name, index in found_cameras
+            ]
+        self.after(0, lambda: self._update_camera_cache(capture_devices))
+        # Update the camera menu on the main Tkinter thread, keeping the camera already streaming
+        # Met à jour le menu de la caméra sur le fil principal de Tkinter, en gardant la caméra qui diffuse déjà
+        self.after(0, self._refresh_camera_menu)
+
+    def _refresh_camera_menu(self):
+        """
+        Updates the camera menu after a scan, preselecting the camera that is streaming.
+        Met à jour le menu des caméras après une analyse, en présélectionnant la caméra qui diffuse.
+        """
+        thread = self.video_stream_thread
+        self.update_camera_menu(
+            initial_camera_index=(
+                thread.camera_index if thread and thread.is_alive() else None
+            )
+        )
 
     def start_video_stream(self, camera_index, width, height):
         """
@@ -1171,10 +1583,24 @@ class VisioDoc3(tk.Tk):
             if self.video_stream_thread.is_alive():
                 print("Warning: Video stream thread did not terminate within timeout")
 
-        # Create and start a new VideoStreamThread
-        # Crée et démarre un nouveau VideoStreamThread
-        self.video_stream_thread = VideoStreamThread(camera_index, width, height)
+        # Create and start a new VideoStreamThread; its sequence numbers start over
+        # Crée et démarre un nouveau VideoStreamThread ; ses numéros de séquence recommencent
+        self.displayed_frame = None
+        settings = self._load_camera_settings(camera_index)
+        self.video_stream_thread = VideoStreamThread(
+            camera_index,
+            width,
+            height,
+            on_frame=self._on_new_frame,
+            pacing=settings.get("pacing", PACING_FREE_RUN),
+            target_fps=settings.get("target_fps", 30.0),
+            fourcc=settings.get("fourcc"),
+            fps=settings.get("fps"),
+            buffer_size=settings.get("buffer_size"),
+        )
         self.video_stream_thread.start()
+        if self._frame_poll_id is None:
+            self._frame_poll_id = self.after(self.FRAME_POLL_MS, self._poll_frames)
 
     def select_camera(self, camera_name):
         """
@@ -1209,13 +1635,117 @@ class VisioDoc3(tk.Tk):
         )
         self._save_camera_config(camera_index)
 
+    def request_redraw(self, event=None):
+        """
+        Schedules a redraw for the next Tk idle cycle.
+        Several requests before that cycle are coalesced into a single redraw.
+        Planifie un rafraîchissement pour le prochain cycle d'inactivité de Tk.
+        Plusieurs demandes avant ce cycle sont regroupées en un seul rafraîchissement.
+
+        Args:
+            event (tk.Event, optional): Ignored, allows binding this method to Tk events.
+                                        Ignoré, permet de lier cette méthode aux événements Tk.
+        """
+        if self._redraw_id is None:
+            self._redraw_id = self.after_idle(self.update_display)
+
+    def invalidate_view(self):
+        """
+        Drops every cached render stage and requests a redraw, used when settings change.
+        Supprime toutes les étapes de rendu en cache et demande un rafraîchissement, utilisé lors d'un changement de paramètres.
+        """
+        self.render_pipeline.invalidate()
+        self.request_redraw()
+
+    def _on_new_frame(self):
+        """
+        Called by the VideoStreamThread each time a frame is captured. It makes no Tk call:
+        _tkinter would make the capture thread wait for the Tk thread, which deadlocks while
+        the Tk thread joins the capture thread. _poll_frames picks the flag up instead.
+        Appelé par le VideoStreamThread à chaque trame capturée. Il ne fait aucun appel Tk :
+        _tkinter ferait attendre le fil de capture après le fil Tk, ce qui bloque pendant que
+        le fil Tk attend la fin du fil de capture. _poll_frames récupère l'indicateur à la place.
+        """
+        self._frame_ready.set()
+
+    def _poll_frames(self):
+        """
+        Requests a redraw when the capture thread signalled a new frame, and checks again
+        every FRAME_POLL_MS while a stream is running (Tk thread).
+        Demande un rafraîchissement quand le fil de capture a signalé une nouvelle trame, et
+        vérifie à nouveau toutes les FRAME_POLL_MS tant qu'un flux tourne (fil Tk).
+        """
+        self._frame_poll_id = None
+        if self._frame_ready.is_set():
+            self._frame_ready.clear()
+            self.request_redraw()
+        if self.video_stream_thread and self.video_stream_thread.is_alive():
+            self._frame_poll_id = self.after(self.FRAME_POLL_MS, self._poll_frames)
+
+    def _save_negotiated_format(self):
+        """
+        Saves the format granted by the driver once per stream, next to the last camera index,
+        and records the camera's settings in the capability cache.
+        Sauvegarde une fois par flux le format accordé par le pilote, à côté du dernier index de
+        caméra, et enregistre les paramètres de la caméra dans le cache des capacités.
+        """
+        thread = self.video_stream_thread
+        if thread.negotiated is None or self._negotiated_saved_for is thread:
+            return
+        self._negotiated_saved_for = thread
+        self._save_camera_settings(thread.camera_index, negotiated=thread.negotiated)
+        # This camera streams: open it from the capability cache at the next startup
+        # Cette caméra diffuse : l'ouvre depuis le cache des capacités au prochain démarrage
+        name = next(
+            (n for n, i in self.camera_options if i == thread.camera_index),
+            f"Webcam {thread.camera_index}",
+        )
+        self.camera_cache.record_settings(
+            self._camera_identity(thread.camera_index),
+            thread.camera_index,
+            name,
+            {
+                "resolution": [thread.width, thread.height],
+                "negotiated": thread.negotiated,
+            },
+        )
+        self.camera_cache.save()
+
+    def _report_stream_stats(self, frame):
+        """
+        Measures the capture-to-display latency and shows the stream statistics
+        in the status bar, at most once per second.
+        Mesure la latence entre la capture et l'affichage et affiche les statistiques
+        du flux dans la barre d'état, au plus une fois par seconde.
+
+        Args:
+            frame (Frame): The frame about to be displayed.
+                           La trame sur le point d'être affichée.
+        """
+        now = time.perf_counter()
+        latency = now - frame.timestamp
+        self.display_latency = (
+            latency
+            if self.display_latency is None
+            else 0.9 * self.display_latency + 0.1 * latency
+        )
+        if now - self._last_stats_report < 1.0:
+            return
+        self._last_stats_report = now
+        if hasattr(self, "top_toolbar") and self.top_toolbar:
+            stats = self.video_stream_thread.get_stats()
+            self.top_toolbar.update_status(
+                f"{stats['fps']:.0f} FPS · {self.display_latency * 1000:.0f} ms"
+            )
+
     def update_display(self):
         """
-        Periodically updates the image displayed on the image_label.
-        This is the main rendering loop of the application.
-        Met à jour périodiquement l'image affichée sur image_label.
-        C'est la boucle de rendu principale de l'application.
+        Updates the image displayed on the image_label.
+        Runs once per redraw request instead of on a fixed timer.
+        Met à jour l'image affichée sur image_label.
+        S'exécute une fois par demande de rafraîchissement au lieu d'un minuteur fixe.
         """
+        self._redraw_id = None
         if (
             self.file_mode
         ):  # If in file viewing mode / Si en mode d'affichage de fichier
@@ -1224,38 +1754,194 @@ class VisioDoc3(tk.Tk):
         elif (
             self.video_stream_thread and self.video_stream_thread.is_alive()
         ):  # If in webcam mode and thread is active / Si en mode webcam et que le fil est actif
-            frame = self.video_stream_thread.get_frame()
+            last_sequence = self.displayed_frame.sequence if self.displayed_frame else 0
+            frame = self.video_stream_thread.get_frame_newer_than(last_sequence)
             if frame is not None:
-                # Convert OpenCV BGR frame to PIL RGB image for display
-                # Convertit le cadre BGR d'OpenCV en image PIL RGB pour l'affichage
-                self.display_image(
-                    Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-                )
+                self.displayed_frame = frame
+                if self.time_to_first_frame is None:
+                    self.time_to_first_frame = time.perf_counter() - self.launch_time
+                    print(
+                        f"Time to first frame: {self.time_to_first_frame * 1000:.0f} ms"
+                    )
+                self._report_stream_stats(frame)
+                self._save_negotiated_format()
+            if self.displayed_frame is not None:
+                # The BGR frame is passed as-is; it is converted only once for display.
+                # Without a newer frame only the overlays are redrawn, if they changed.
+                # Le cadre BGR est transmis tel quel ; il n'est converti qu'une fois pour l'affichage.
+                # Sans nouvelle trame seules les superpositions sont redessinées, si elles ont changé.
+                self.display_image(self.displayed_frame.image)
+
+    def display_image(self, image):
+        """
+        Processes and displays an image on the image_label, including annotations, zoom, and pan.
+        Only the render stages whose inputs changed since the last call are recomputed.
+        Traite et affiche une image sur image_label, y compris les annotations, le zoom et le panoramique.
+        Seules les étapes de rendu dont les entrées ont changé depuis le dernier appel sont recalculées.
+
+        Args:
+            image (PIL.Image.Image or numpy.ndarray): The base image to display, either a PIL RGB
+                                                      image or an OpenCV BGR frame.
+                                                      L'image de base à afficher, soit une image PIL RGB,
+                                                      soit un cadre BGR OpenCV.
+        """
+        if isinstance(image, np.ndarray):
+            original_height, original_width = image.shape[:2]
+        else:
+            original_width, original_height = image.size
+
+        # Apply zoom to the image
+        # Applique le zoom à l'image
+        scaled_width = int(original_width * self.zoom_level)
+        scaled_height = int(original_height * self.zoom_level)
+
+        label_width = self.image_label.winfo_width()
+        label_height = self.image_label.winfo_height()
+
+        # Clamp offsets to ensure the image stays within bounds during pan
+        # Clampe les décalages pour s'assurer que l'image reste dans les limites pendant le panoramique
+        self.clamp_offsets()
+
+        # Calculate paste position based on pan offsets
+        # Calcule la position de collage en fonction des décalages de panoramique
+        paste_x = -int(self.view_offset_x)
+        paste_y = -int(self.view_offset_y)
+
+        # If the scaled image is smaller than the label, center it
+        # Si l'image mise à l'échelle est plus petite que l'étiquette, la centre
+        if scaled_width < label_width:
+            paste_x = (label_width - scaled_width) // 2
+        if scaled_height < label_height:
+            paste_y = (label_height - scaled_height) // 2
+
+        if not self.render_pipeline.render(
+            image,
+            self._overlay_key(),
+            self._draw_overlays,
+            self.zoom_level,
+            (paste_x, paste_y),
+            (label_width, label_height),
+            select_interpolation(self.render_quality, self.interactive_render),
+            self._pdf_detail_for(
+                image, (paste_x, paste_y), (label_width, label_height)
+            ),
+        ):
+            return  # Nothing changed since the last frame / Rien n'a changé depuis la dernière trame
+
+        # Update the label to display the new frame
+        # Met à jour l'étiquette pour afficher le nouveau cadre
+        self.current_photo = self.render_pipeline.photo
+        self.image_label.config(image=self.current_photo)
+
+        # Store references to the images for saving functionality
+        # Stocke les références aux images pour la fonctionnalité de sauvegarde
+        self.pil_image_to_save = self.render_pipeline.annotated_image  # Original resolution with annotations / Résolution originale avec annotations
+        self.view_for_saving = self.render_pipeline.final_view  # What is currently displayed on screen (with zoom/pan) / Ce qui est actuellement affiché à l'écran (avec zoom/panoramique)
+
+    def _overlay_key(self):
+        """
+        Returns a hashable description of everything drawn by _draw_overlays.
+        The annotated image is only redrawn when this key changes.
+        Retourne une description de tout ce qui est dessiné par _draw_overlays.
+        L'image annotée n'est redessinée que lorsque cette clé change.
+        """
+        preview = None
+        if self.drawing and self.current_tool != "selection":
+            preview = (
+                self.current_tool,
+                self.start_point,
+                self.end_point,
+                len(self.current_freedraw_points),
+                self.current_annotation_color,
+                self.current_annotation_thickness,
+            )
+        return (
+            self.annotations_revision,
+            self.selected_annotation,
+            self.hovered_annotation,
+            preview,
+        )
 
-        # Schedule the next update after 10 milliseconds (approx 100 FPS, but limited by camera/processing)
-        # Planifie la prochaine mise à jour après 10 millisecondes (environ 100 FPS, mais limité par la caméra/le traitement)
-        self._update_id = self.after(33, self.update_display)
+    def _annotations_changed(self):
+        """
+        Marks the annotation list as modified so the next frame redraws it.
+        Marque la liste d'annotations comme modifiée pour que la prochaine trame la redessine.
+        """
+        self.annotations_revision += 1
+        self.request_redraw()
+
+    def _add_annotation(self, annotation):
+        """
+        Adds a new annotation on top of the others, indexes it and records it in the history.
+        Ajoute une nouvelle annotation au-dessus des autres, l'indexe et l'enregistre dans l'historique.
 
-    def display_image(self, pil_image):
+        Args:
+            annotation (Annotation): The annotation to add.
+                                     L'annotation à ajouter.
+        """
+        self.annotations.append(annotation)
+        self.annotation_index.add(annotation)
+        self.history.record_add(annotation)  # Also clears the redo stack / Vide aussi la pile de rétablissement
+        self._annotations_changed()
+
+    def _remove_annotation(self, annotation):
         """
-        Processes and displays a PIL Image on the image_label, including annotations, zoom, and pan.
-        Traite et affiche une image PIL sur image_label, y compris les annotations, le zoom et le panoramique.
+        Removes an annotation from the list and from the hit-testing index, recording its
+        position so the removal can be undone.
+        Supprime une annotation de la liste et de l'index de test de collision, en enregistrant
+        sa position pour que la suppression puisse être annulée.
 
         Args:
-            pil_image (PIL.Image.Image): The base image to display.
-                                         L'image de base à afficher.
+            annotation (Annotation): The annotation to remove.
+                                     L'annotation à supprimer.
         """
-        # Create a copy of the image to draw on without modifying the original source
-        # Crée une copie de l'image pour dessiner sans modifier la source originale
-        display_image_np = np.array(pil_image)
-        # Convert PIL RGB image to OpenCV BGR format for drawing with cv2
-        # Convertit l'image PIL RGB en format OpenCV BGR pour dessiner avec cv2
-        display_image_cv = cv2.cvtColor(display_image_np, cv2.COLOR_RGB2BGR)
+        position = self.annotations.index(annotation)
+        stamp = self.annotation_index.stamp_of(annotation)
+        del self.annotations[position]
+        self.annotation_index.remove(annotation)
+        self.history.record_remove(annotation, position, stamp)
+        self._annotations_changed()
 
+    def _draw_overlays(self, display_image_cv):
+        """
+        Draws annotations, selection feedback and the in-progress shape on a BGR frame.
+        Dessine les annotations, le retour de sélection et la forme en cours sur un cadre BGR.
+
+        Args:
+            display_image_cv (numpy.ndarray): BGR frame to draw on.
+                                              Cadre BGR sur lequel dessiner.
+
+        Returns:
+            numpy.ndarray: The annotated frame.
+                           Le cadre annoté.
+        """
         # Draw all existing annotations on the OpenCV frame
         # Dessine toutes les annotations existantes sur le cadre OpenCV
-        for annotation in self.annotations:
-            annotation.draw(display_image_cv)
+        dragging = (
+            self.drawing
+            and self.current_tool == "selection"
+            and self.selected_annotation is not None
+        )
+        if self.file_mode or dragging:
+            # The annotated page is already cached by the render pipeline, and a dragged
+            # annotation changes on every mouse event, which would rebuild the overlay each frame
+            # La page annotée est déjà mise en cache par le pipeline de rendu, et une annotation
+            # glissée change à chaque événement de souris, ce qui reconstruirait la superposition à chaque trame
+            # Blurs over a loaded file reuse their pixels until the image, the blur or the
+            # annotations under it change
+            # Les flous sur un fichier chargé réutilisent leurs pixels jusqu'à ce que l'image, le
+            # flou ou les annotations en dessous changent
+            draw_annotations(
+                display_image_cv,
+                self.annotations,
+                sequence=self.loaded_image_sequence if self.file_mode else None,
+            )
+        else:
+            # Webcam frames change while annotations don't: composite the cached overlay
+            # Les trames de la webcam changent mais pas les annotations : compose la superposition en cache
+            self.annotation_overlay.composite(
+                display_image_cv, self.annotations, self.annotations_revision
+            )
 
         # Draw bounding box and resize handles for the selected annotation
         # Dessine la boîte englobante et les poignées de redimensionnement pour l'annotation sélectionnée
@@ -1334,23 +2020,24 @@ class VisioDoc3(tk.Tk):
             elif (
                 self.current_tool == "freedraw" and self.current_freedraw_points
             ):  # For freehand, draw the current path / Pour le dessin à main levée, dessine le chemin actuel
-                temp_annotation = FreeDrawAnnotation(
+                # Only the segments added since the previous frame are rasterized
+                # Seuls les segments ajoutés depuis la trame précédente sont rastérisés
+                self.stroke_preview.composite(
+                    display_image_cv,
                     self.current_freedraw_points,
-                    color=(0, 255, 255),
-                    thickness=self.current_annotation_thickness,
+                    (0, 255, 255),
+                    self.current_annotation_thickness,
                 )
-                temp_annotation.draw(display_image_cv)
             elif self.current_tool == "blur":
-                overlay = display_image_cv.copy()
-                x1, y1 = self.start_point
-                x2, y2 = self.end_point
-                cv2.rectangle(
-                    overlay, (x1, y1), (x2, y2), (255, 255, 0), -1
-                )  # Draw a temporary yellow filled rectangle / Dessine un rectangle rempli jaune temporaire
-                alpha = 0.3  # Opacity for the temporary blur preview / Opacité pour l'aperçu de flou temporaire
-                display_image_cv = cv2.addWeighted(
-                    overlay, alpha, display_image_cv, 1 - alpha, 0
+                # Temporary translucent rectangle, blended only inside its area
+                # Rectangle translucide temporaire, mélangé uniquement à l'intérieur de sa zone
+                temp_annotation = HighlightAnnotation(
+                    self.start_point,
+                    self.end_point,
+                    color=(255, 255, 0),
+                    opacity=0.3,  # Opacity for the temporary blur preview / Opacité pour l'aperçu de flou temporaire
                 )
+                temp_annotation.draw(display_image_cv)
             elif self.current_tool == "arrow":
                 temp_annotation = ArrowAnnotation(
                     self.start_point,
@@ -1360,75 +2047,15 @@ class VisioDoc3(tk.Tk):
                 )
                 temp_annotation.draw(display_image_cv)
             elif self.current_tool == "highlight":
-                overlay = display_image_cv.copy()
-                x1, y1 = self.start_point
-                x2, y2 = self.end_point
-                cv2.rectangle(
-                    overlay, (x1, y1), (x2, y2), self.current_annotation_color, -1
-                )
-                alpha = 0.3  # Opacity for the temporary highlight preview / Opacité pour l'aperçu de surlignage temporaire
-                display_image_cv = cv2.addWeighted(
-                    overlay, alpha, display_image_cv, 1 - alpha, 0
+                temp_annotation = HighlightAnnotation(
+                    self.start_point,
+                    self.end_point,
+                    color=self.current_annotation_color,
+                    opacity=0.3,  # Opacity for the temporary highlight preview / Opacité pour l'aperçu de surlignage temporaire
                 )
+                temp_annotation.draw(display_image_cv)
 
-        # Convert the final annotated OpenCV frame back to PIL Image
-        # Convertit le cadre OpenCV annoté final en image PIL
-        final_annotated_pil = Image.fromarray(
-            cv2.cvtColor(display_image_cv, cv2.COLOR_BGR2RGB)
-        )
-        original_width, original_height = final_annotated_pil.size
-
-        # Apply zoom to the image
-        # Applique le zoom à l'image
-        scaled_width = int(original_width * self.zoom_level)
-        scaled_height = int(original_height * self.zoom_level)
-
-        # Prevent issues with zero or negative dimensions after scaling
-        # Prévient les problèmes avec des dimensions nulles ou négatives après la mise à l'échelle
-        if scaled_width <= 0 or scaled_height <= 0:
-            return
-
-        scaled_image = final_annotated_pil.resize(
-            (scaled_width, scaled_height), Image.LANCZOS
-        )
-
-        # Create a new blank canvas (final view) to paste the scaled image onto
-        # Crée un nouveau canevas vierge (vue finale) pour y coller l'image mise à l'échelle
-        label_width = self.image_label.winfo_width()
-        label_height = self.image_label.winfo_height()
-        final_view = Image.new(
-            "RGB", (label_width, label_height), (200, 200, 200)
-        )  # Grey background for empty areas / Fond gris pour les zones vides
-
-        # Clamp offsets to ensure the image stays within bounds during pan
-        # Clampe les décalages pour s'assurer que l'image reste dans les limites pendant le panoramique
-        self.clamp_offsets()
-
-        # Calculate paste position based on pan offsets
-        # Calcule la position de collage en fonction des décalages de panoramique
-        paste_x = -int(self.view_offset_x)
-        paste_y = -int(self.view_offset_y)
-
-        # If the scaled image is smaller than the label, center it
-        # Si l'image mise à l'échelle est plus petite que l'étiquette, la centre
-        if scaled_width < label_width:
-            paste_x = (label_width - scaled_width) // 2
-        if scaled_height < label_height:
-            paste_y = (label_height - scaled_height) // 2
-
-        final_view.paste(
-            scaled_image, (paste_x, paste_y)
-        )  # Paste the scaled image onto the final view canvas / Colle l'image mise à l'échelle sur le canevas de la vue finale
-
-        # Update the Tkinter PhotoImage and the label to display the new frame
-        # Met à jour le PhotoImage Tkinter et l'étiquette pour afficher le nouveau cadre
-        self.current_photo = ImageTk.PhotoImage(image=final_view)
-        self.image_label.config(image=self.current_photo)
-
-        # Store references to the images for saving functionality
-        # Stocke les références aux images pour la fonctionnalité de sauvegarde
-        self.pil_image_to_save = final_annotated_pil  # Original resolution with annotations / Résolution originale avec annotations
-        self.view_for_saving = final_view  # What is currently displayed on screen (with zoom/pan) / Ce qui est actuellement affiché à l'écran (avec zoom/panoramique)
+        return display_image_cv
 
     def on_closing(self):
         """
@@ -1448,6 +2075,9 @@ class VisioDoc3(tk.Tk):
                 print(
                     "Warning: Video stream thread did not terminate within timeout in on_closing"
                 )
+        if self._frame_poll_id is not None:
+            self.after_cancel(self._frame_poll_id)
+            self._frame_poll_id = None
         self.destroy()  # Destroy the Tkinter window / Détruit la fenêtre Tkinter
 
     def choose_annotation_color(self):
@@ -1525,7 +2155,9 @@ class VisioDoc3(tk.Tk):
         self.end_point = None
         self.drawing = False
         self.current_freedraw_points = []
+        self.stroke_preview.reset()
         self.entered_text = ""  # Reset entered text for text tool / Réinitialise le texte saisi pour l'outil texte
+        self.request_redraw()
 
         # Specific resets or actions based on the tool
         # Réinitialisations ou actions spécifiques basées sur l'outil
@@ -1670,6 +2302,7 @@ class VisioDoc3(tk.Tk):
         Gère les événements de pression du bouton de la souris sur la zone d'affichage de l'image.
         """
         click_point = self._convert_event_to_original_coords(event)
+        self.request_redraw()
 
         if self.current_tool == "selection":
             self.resize_handle = None  # Reset resize handle / Réinitialise la poignée de redimensionnement
@@ -1684,16 +2317,13 @@ class VisioDoc3(tk.Tk):
                     ):
                         self.resize_handle = handle_name  # Store the name of the dragged handle / Stocke le nom de la poignée glissée
                         self.initial_drag_point_for_resize = click_point  # Store initial drag point for resize calculation / Stocke le point de glissement initial pour le calcul de redimensionnement
+                        self.resize_state = self.selected_annotation.geometry_state()  # Restored if the resize is undone / Restauré si le redimensionnement est annulé
                         self.drawing = True  # Indicate that a resize operation is starting / Indique qu'une opération de redimensionnement commence
                         return
 
-            newly_selected = None
-            # Iterate annotations in reverse order to select the topmost one
-            # Itère les annotations dans l'ordre inverse pour sélectionner celle du dessus
-            for annotation in reversed(self.annotations):
-                if annotation.is_point_inside(click_point):
-                    newly_selected = annotation
-                    break
+            # Only the annotations whose grid cell contains the click are tested, topmost first
+            # Seules les annotations dont la cellule de la grille contient le clic sont testées, celle du dessus d'abord
+            newly_selected = self.annotation_index.hit_test(click_point)
 
             if (
                 newly_selected
@@ -1710,7 +2340,7 @@ class VisioDoc3(tk.Tk):
                 self.get_text_input()
             )  # Open text input dialog / Ouvre la boîte de dialogue de saisie de texte
             if entered_text:  # If text was entered / Si du texte a été saisi
-                self.annotations.append(
+                self._add_annotation(
                     TextAnnotation(
                         click_point,
                         entered_text,
@@ -1718,7 +2348,6 @@ class VisioDoc3(tk.Tk):
                         font_size=self.current_font_size,
                     )
                 )
-                self.redo_stack.clear()  # Clear redo stack after a new action / Efface la pile de rétablissement après une nouvelle action
                 self.set_tool(
                     "selection"
                 )  # Switch to selection tool after adding text / Passe à l'outil de sélection après avoir ajouté du texte
@@ -1738,6 +2367,7 @@ class VisioDoc3(tk.Tk):
             return
 
         current_point = self._convert_event_to_original_coords(event)
+        self.request_redraw()
 
         if (
             self.current_tool == "selection" and self.selected_annotation
@@ -1754,16 +2384,66 @@ class VisioDoc3(tk.Tk):
                 self.selected_annotation.move(
                     dx, dy
                 )  # Move the selected annotation / Déplace l'annotation sélectionnée
+                # The deltas of one drag are merged into a single history entry
+                # Les deltas d'un même glissement sont fusionnés en une seule entrée d'historique
+                self.history.record_move(self.selected_annotation, dx, dy)
+            self.annotation_index.update(self.selected_annotation)
+            self._annotations_changed()
             self.start_point = current_point  # Update start_point for continuous dragging / Met à jour start_point pour un glissement continu
         elif (
             self.current_tool != "selection"
         ):  # For other drawing tools / Pour les autres outils de dessin
             self.end_point = current_point  # Update end_point to draw temporary shape / Met à jour end_point pour dessiner la forme temporaire
             if self.current_tool == "freedraw":
-                self.current_freedraw_points.append(
+                self._append_freedraw_point(
                     self.end_point
                 )  # Add points for freehand drawing / Ajoute des points pour le dessin à main levée
 
+    def _append_freedraw_point(self, point):
+        """
+        Adds a motion point to the freehand stroke unless it is closer than
+        freedraw_min_distance screen pixels to the last kept point.
+        Ajoute un point de mouvement au tracé à main levée sauf s'il est à moins de
+        freedraw_min_distance pixels d'écran du dernier point conservé.
+
+        Args:
+            point (tuple): (x, y) coordinates in original image space.
+                           Coordonnées (x, y) dans l'espace de l'image originale.
+        """
+        self.freedraw_stats["motion_events"] += 1
+        if self.current_freedraw_points:
+            last_x, last_y = self.current_freedraw_points[-1]
+            # The distance is converted to image pixels so decimation looks the same at every zoom
+            # La distance est convertie en pixels d'image pour que la décimation soit identique à tout zoom
+            min_distance = self.freedraw_min_distance / self.zoom_level
+            if (point[0] - last_x) ** 2 + (point[1] - last_y) ** 2 < min_distance**2:
+                return
+        self.current_freedraw_points.append(point)
+
+    def _finish_freedraw_stroke(self, final_point):
+        """
+        Closes the freehand stroke at the release point and simplifies it.
+        Termine le tracé à main levée au point de relâchement et le simplifie.
+
+        Args:
+            final_point (tuple): (x, y) release point in original image space.
+                                 Point (x, y) de relâchement dans l'espace de l'image originale.
+
+        Returns:
+            numpy.ndarray: The simplified stroke points.
+                           Les points du tracé simplifié.
+        """
+        points = self.current_freedraw_points
+        if points[-1] != final_point:
+            points.append(final_point)  # Decimation may have dropped the end / La décimation a pu ignorer la fin
+        simplified = simplify_stroke(
+            points, self.freedraw_simplify_tolerance / self.zoom_level
+        )
+        self.freedraw_stats["strokes"] += 1
+        self.freedraw_stats["decimated_points"] += len(points)
+        self.freedraw_stats["simplified_points"] += len(simplified)
+        return simplified
+
     def on_mouse_up(self, event):
         """
         Handles mouse button release events on the image display area.
@@ -1775,6 +2455,11 @@ class VisioDoc3(tk.Tk):
             return
 
         self.drawing = False  # End drawing/moving/resizing operation / Termine l'opération de dessin/déplacement/redimensionnement
+        self.request_redraw()
+        if self.resize_handle and self.selected_annotation:
+            self.history.record_resize(self.selected_annotation, self.resize_state)
+        self.resize_state = None
+        self.history.end_gesture()
         self.resize_handle = (
             None  # Clear resize handle / Efface la poignée de redimensionnement
         )
@@ -1792,23 +2477,20 @@ class VisioDoc3(tk.Tk):
 
             # Create and add the appropriate annotation object based on the current tool
             # Crée et ajoute l'objet d'annotation approprié en fonction de l'outil actuel
+            new_annotation = None
             if self.current_tool == "line":
-                self.annotations.append(
-                    LineAnnotation(
-                        self.start_point,
-                        self.end_point,
-                        color=self.current_annotation_color,
-                        thickness=self.current_annotation_thickness,
-                    )
+                new_annotation = LineAnnotation(
+                    self.start_point,
+                    self.end_point,
+                    color=self.current_annotation_color,
+                    thickness=self.current_annotation_thickness,
                 )
             elif self.current_tool == "rectangle":
-                self.annotations.append(
-                    RectangleAnnotation(
-                        self.start_point,
-                        self.end_point,
-                        color=self.current_annotation_color,
-                        thickness=self.current_annotation_thickness,
-                    )
+                new_annotation = RectangleAnnotation(
+                    self.start_point,
+                    self.end_point,
+                    color=self.current_annotation_color,
+                    thickness=self.current_annotation_thickness,
                 )
             elif self.current_tool == "circle":
                 center_x = (self.start_point[0] + self.end_point[0]) // 2
@@ -1824,47 +2506,41 @@ class VisioDoc3(tk.Tk):
                 if (
                     radius > 0
                 ):  # Only add if radius is positive / Ajoute uniquement si le rayon est positif
-                    self.annotations.append(
-                        CircleAnnotation(
-                            (center_x, center_y),
-                            radius,
-                            color=self.current_annotation_color,
-                            thickness=self.current_annotation_thickness,
-                        )
+                    new_annotation = CircleAnnotation(
+                        (center_x, center_y),
+                        radius,
+                        color=self.current_annotation_color,
+                        thickness=self.current_annotation_thickness,
                     )
             elif self.current_tool == "freedraw":
                 if self.current_freedraw_points:  # Only add if points exist / Ajoute uniquement si des points existent
-                    self.annotations.append(
-                        FreeDrawAnnotation(
-                            list(self.current_freedraw_points),
-                            color=self.current_annotation_color,
-                            thickness=self.current_annotation_thickness,
-                        )
+                    new_annotation = FreeDrawAnnotation(
+                        self._finish_freedraw_stroke(final_point),
+                        color=self.current_annotation_color,
+                        thickness=self.current_annotation_thickness,
                     )
                 self.current_freedraw_points = []  # Reset points for next freehand draw / Réinitialise les points pour le prochain dessin à main levée
+                self.stroke_preview.reset()  # The committed annotation now draws the stroke / L'annotation validée dessine désormais le tracé
             elif self.current_tool == "blur":
-                self.annotations.append(
-                    BlurAnnotation(self.start_point, self.end_point)
+                new_annotation = BlurAnnotation(
+                    self.start_point, self.end_point, method=self.blur_method
                 )
             elif self.current_tool == "arrow":
-                self.annotations.append(
-                    ArrowAnnotation(
-                        self.start_point,
-                        self.end_point,
-                        color=self.current_annotation_color,
-                        thickness=self.current_annotation_thickness,
-                    )
+                new_annotation = ArrowAnnotation(
+                    self.start_point,
+                    self.end_point,
+                    color=self.current_annotation_color,
+                    thickness=self.current_annotation_thickness,
                 )
             elif self.current_tool == "highlight":
-                self.annotations.append(
-                    HighlightAnnotation(
-                        self.start_point,
-                        self.end_point,
-                        color=self.current_annotation_color,
-                    )
+                new_annotation = HighlightAnnotation(
+                    self.start_point,
+                    self.end_point,
+                    color=self.current_annotation_color,
                 )
 
-            self.redo_stack.clear()  # Clear redo stack after a new annotation is added / Efface la pile de rétablissement après l'ajout d'une nouvelle annotation
+            if new_annotation is not None:
+                self._add_annotation(new_annotation)
             self.start_point = None  # Reset start and end points / Réinitialise les points de début et de fin
             self.end_point = None
 
@@ -1879,15 +2555,15 @@ class VisioDoc3(tk.Tk):
             self.current_tool == "selection" and not self.drawing
         ):  # Only in selection mode and not currently dragging / Uniquement en mode sélection et non en cours de glissement
             mouse_point = self._convert_event_to_original_coords(event)
+            previous_hover = self.hovered_annotation
             self.hovered_annotation = (
                 None  # Reset hovered annotation / Réinitialise l'annotation survolée
             )
-            # Check for annotation under mouse, iterating in reverse to find topmost
-            # Vérifie l'annotation sous la souris, en itérant en sens inverse pour trouver celle du dessus
-            for annotation in reversed(self.annotations):
-                if annotation.is_point_inside(mouse_point):
-                    self.hovered_annotation = annotation
-                    break
+            # Check for the topmost annotation under the mouse among the grid cell candidates
+            # Vérifie l'annotation du dessus sous la souris parmi les candidates de la cellule de la grille
+            self.hovered_annotation = self.annotation_index.hit_test(mouse_point)
+            if self.hovered_annotation is not previous_hover:
+                self.request_redraw()  # Only redraw when the hover feedback changes / Rafraîchit uniquement si le survol change
 
     def zoom_in(self, event=None):
         """
@@ -1962,6 +2638,8 @@ class VisioDoc3(tk.Tk):
         self.view_offset_y = (original_y * self.zoom_level) - y
 
         self.clamp_offsets()  # Ensure offsets are within valid bounds / S'assure que les décalages sont dans des limites valides
+        self._mark_interactive()
+        self.request_redraw()
 
     def on_pan_start(self, event):
         """
@@ -1985,6 +2663,8 @@ class VisioDoc3(tk.Tk):
             self.pan_start_x = event.x  # Update start point for next drag segment / Met à jour le point de départ pour le prochain segment de glissement
             self.pan_start_y = event.y
             self.clamp_offsets()  # Keep offsets within bounds / Maintient les décalages dans les limites
+            self._mark_interactive()
+            self.request_redraw()
 
     def on_pan_end(self, event):
         """
@@ -1993,6 +2673,29 @@ class VisioDoc3(tk.Tk):
         """
         self.is_panning = False
 
+    def _mark_interactive(self, settle_delay=200):
+        """
+        Switches rendering to the fast filter of the quality policy until the gesture settles.
+        Passe le rendu au filtre rapide de la politique de qualité jusqu'à la fin du geste.
+
+        Args:
+            settle_delay (int): Idle time in milliseconds before re-rendering in high quality.
+                                Temps d'inactivité en millisecondes avant le rendu haute qualité.
+        """
+        self.interactive_render = True
+        if self._settle_id is not None:
+            self.after_cancel(self._settle_id)
+        self._settle_id = self.after(settle_delay, self._settle_render)
+
+    def _settle_render(self):
+        """
+        Ends the interactive gesture so the next frame is rendered with LANCZOS.
+        Termine le geste interactif pour que la prochaine trame soit rendue avec LANCZOS.
+        """
+        self._settle_id = None
+        self.interactive_render = False
+        self.request_redraw()
+
     def clamp_offsets(self):
         """
         Ensures that the view offsets (pan position) keep the image within the display area.
@@ -2104,36 +2807,46 @@ class VisioDoc3(tk.Tk):
 
     def clear_all_annotations(self):
         """
-        Clears all annotations from the display and resets undo/redo stacks.
-        Efface toutes les annotations de l'affichage et réinitialise les piles d'annulation/rétablissement.
+        Clears all annotations from the display; the clear can be undone.
+        Efface toutes les annotations de l'affichage ; l'effacement peut être annulé.
         """
+        if not self.annotations:
+            return
+        removed = list(self.annotations)
+        stamps = [self.annotation_index.stamp_of(annotation) for annotation in removed]
         self.annotations.clear()  # Remove all annotations / Supprime toutes les annotations
-        self.redo_stack.clear()  # Clear redo stack as well / Efface également la pile de rétablissement
-        self.undo_stack.clear()  # Clear undo stack as well / Efface également la pile d'annulation
+        self.annotation_index.clear()
+        self.history.record_clear(removed, stamps)
+        self._clear_stale_selection()
+        self._annotations_changed()
 
     def undo_last_annotation(self):
         """
-        Undoes the last annotation action by moving it from annotations to redo_stack.
-        Annule la dernière action d'annotation en la déplaçant des annotations vers redo_stack.
+        Undoes the last annotation action: add, delete, clear, move or resize.
+        Annule la dernière action d'annotation : ajout, suppression, effacement, déplacement ou redimensionnement.
         """
-        if self.annotations:  # Only if there are annotations to undo / Uniquement s'il y a des annotations à annuler
-            last_annotation = (
-                self.annotations.pop()
-            )  # Remove the last annotation / Supprime la dernière annotation
-            self.redo_stack.append(
-                last_annotation
-            )  # Add it to the redo stack / L'ajoute à la pile de rétablissement
+        if self.history.undo():  # Only if there are actions to undo / Uniquement s'il y a des actions à annuler
+            self._clear_stale_selection()
+            self._annotations_changed()
 
     def redo_last_annotation(self):
         """
-        Redoes the last undone annotation action by moving it from redo_stack back to annotations.
-        Rétablit la dernière action d'annotation annulée en la déplaçant de redo_stack vers les annotations.
+        Redoes the last undone annotation action.
+        Rétablit la dernière action d'annotation annulée.
+        """
+        if self.history.redo():  # Only if there are actions to redo / Uniquement s'il y a des actions à rétablir
+            self._clear_stale_selection()
+            self._annotations_changed()
+
+    def _clear_stale_selection(self):
+        """
+        Drops the selection and hover state of annotations no longer in the list.
+        Abandonne l'état de sélection et de survol des annotations qui ne sont plus dans la liste.
         """
-        if self.redo_stack:  # Only if there are actions to redo / Uniquement s'il y a des actions à rétablir
-            last_redone = self.redo_stack.pop()  # Get the last item from redo stack / Obtient le dernier élément de la pile de rétablissement
-            self.annotations.append(
-                last_redone
-            )  # Add it back to active annotations / Le rajoute aux annotations actives
+        if self.annotation_index.stamp_of(self.selected_annotation) is None:
+            self.selected_annotation = None
+        if self.annotation_index.stamp_of(self.hovered_annotation) is None:
+            self.hovered_annotation = None
 
     def delete_selected_annotation(self, event=None):
         """
@@ -2145,13 +2858,13 @@ class VisioDoc3(tk.Tk):
                                         L'objet événement (par exemple, à partir d'un raccourci clavier).
         """
         if self.selected_annotation:  # If an annotation is explicitly selected / Si une annotation est explicitement sélectionnée
-            self.annotations.remove(self.selected_annotation)
+            self._remove_annotation(self.selected_annotation)
             self.selected_annotation = None  # Clear selection / Efface la sélection
             self.hovered_annotation = (
                 None  # Clear hover state / Efface l'état de survol
             )
         elif self.hovered_annotation:  # If an annotation is hovered but not selected / Si une annotation est survolée mais non sélectionnée
-            self.annotations.remove(self.hovered_annotation)
+            self._remove_annotation(self.hovered_annotation)
             self.hovered_annotation = (
                 None  # Clear hover state / Efface l'état de survol
             )
@@ -2219,6 +2932,17 @@ class VisioDoc3(tk.Tk):
             "1280x720",
             "1920x1080",
         ]  # Common resolutions / Résolutions courantes
+        if self.video_stream_thread and self.camera_resolutions.get(
+            self.video_stream_thread.camera_index
+        ):
+            # Resolutions reported by the driver for this camera
+            # Résolutions signalées par le pilote pour cette caméra
+            self.resolutions = [
+                f"{width}x{height}"
+                for width, height in self.camera_resolutions[
+                    self.video_stream_thread.camera_index
+                ]
+            ]
         self.resolution_var.set(
             f"{self.current_resolution[0]}x{self.current_resolution[1]}"
         )  # Set current resolution as default / Définit la résolution actuelle comme valeur par défaut
@@ -2231,6 +2955,158 @@ class VisioDoc3(tk.Tk):
         )
         resolution_menu.pack(pady=5)
 
+        # Capture format requested from the driver (pixel format, frame rate, queue length)
+        # Format de capture demandé au pilote (format de pixels, cadence, longueur de file)
+        settings = (
+            self._load_camera_settings(self.video_stream_thread.camera_index)
+            if self.video_stream_thread
+            else {}
+        )
+
+        def auto_or(value, cast=str):
+            return "auto" if value is None else str(cast(value))
+
+        ttk.Label(
+            settings_dialog, text="Format de capture (FOURCC / FPS / tampon):", style="White.TLabel"
+        ).pack(pady=5)
+        format_frame = ttk.Frame(settings_dialog)
+        format_frame.pack(pady=5)
+        self.fourcc_var = tk.StringVar(settings_dialog, auto_or(settings.get("fourcc")))
+        self.capture_fps_var = tk.StringVar(
+            settings_dialog, auto_or(settings.get("fps"), int)
+        )
+        self.buffer_size_var = tk.StringVar(
+            settings_dialog, auto_or(settings.get("buffer_size"), int)
+        )
+
+        def apply_format(_value=None):
+            self.set_capture_format(
+                self.fourcc_var.get(),
+                self.capture_fps_var.get(),
+                self.buffer_size_var.get(),
+            )
+
+        # Formats and frame rates reported by the driver, from the scan or the cache
+        # Formats et cadences signalés par le pilote, depuis l'analyse ou le cache
+        camera_index = (
+            self.video_stream_thread.camera_index if self.video_stream_thread else None
+        )
+        formats = tuple(self.camera_formats.get(camera_index) or CAPTURE_FORMATS)
+        frame_rates = tuple(
+            f"{rate:g}" for rate in self.camera_frame_rates.get(camera_index) or ()
+        ) or ("5", "15", "24", "30", "60")
+        for variable, choices in (
+            (self.fourcc_var, ("auto",) + formats),
+            (self.capture_fps_var, ("auto",) + frame_rates),
+            (self.buffer_size_var, ("auto", "1", "2", "4")),
+        ):
+            ttk.OptionMenu(
+                format_frame, variable, variable.get(), *choices, command=apply_format
+            ).pack(side=tk.LEFT, padx=2)
+
+        # What the driver actually granted for the running stream
+        # Ce que le pilote a réellement accordé pour le flux en cours
+        negotiated = (
+            self.video_stream_thread.negotiated if self.video_stream_thread else None
+        )
+        if negotiated:
+            negotiated_text = (
+                f"Négocié : {negotiated['fourcc'] or '?'} "
+                f"{negotiated['width']}x{negotiated['height']} "
+                f"@ {negotiated['fps'] or '?'} FPS, tampon {negotiated['buffer_size'] or '?'}"
+            )
+        else:
+            negotiated_text = "Négocié : -"
+        ttk.Label(settings_dialog, text=negotiated_text, style="White.TLabel").pack(
+            pady=5
+        )
+
+        # Capture pacing mode for the current camera
+        # Mode de cadence de capture pour la caméra actuelle
+        ttk.Label(
+            settings_dialog, text="Cadence de capture:", style="White.TLabel"
+        ).pack(pady=5)
+        self.pacing_var = tk.StringVar(settings_dialog)
+        self.pacing_var.set(
+            self.video_stream_thread.pacing
+            if self.video_stream_thread
+            else PACING_FREE_RUN
+        )
+        pacing_menu = ttk.OptionMenu(
+            settings_dialog,
+            self.pacing_var,
+            self.pacing_var.get(),
+            *PACING_MODES,
+            command=self.set_capture_pacing,
+        )
+        pacing_menu.pack(pady=5)
+        ttk.Label(
+            settings_dialog, text="FPS cible (mode target_fps):", style="White.TLabel"
+        ).pack(pady=5)
+        self.target_fps_var = tk.StringVar(settings_dialog)
+        self.target_fps_var.set(
+            str(int(self.video_stream_thread.target_fps))
+            if self.video_stream_thread
+            else "30"
+        )
+        ttk.Spinbox(
+            settings_dialog,
+            from_=1,
+            to=120,
+            textvariable=self.target_fps_var,
+            width=5,
+            command=lambda: self.set_target_fps(self.target_fps_var.get()),
+        ).pack(pady=5)
+
+        # Tolerance of the freehand stroke simplification, in screen pixels
+        # Tolérance de la simplification des tracés à main levée, en pixels d'écran
+        ttk.Label(
+            settings_dialog, text="Simplification du tracé (px):", style="White.TLabel"
+        ).pack(pady=5)
+        self.simplify_tolerance_var = tk.StringVar(settings_dialog)
+        self.simplify_tolerance_var.set(str(self.freedraw_simplify_tolerance))
+        ttk.OptionMenu(
+            settings_dialog,
+            self.simplify_tolerance_var,
+            self.simplify_tolerance_var.get(),
+            "0.0",
+            "0.5",
+            "1.0",
+            "2.0",
+            command=self.set_freedraw_simplification,
+        ).pack(pady=5)
+
+        # Redaction method of new blur annotations
+        # Méthode de masquage des nouvelles annotations de flou
+        ttk.Label(
+            settings_dialog, text="Méthode de floutage:", style="White.TLabel"
+        ).pack(pady=5)
+        self.blur_method_var = tk.StringVar(settings_dialog)
+        self.blur_method_var.set(self.blur_method)
+        ttk.OptionMenu(
+            settings_dialog,
+            self.blur_method_var,
+            self.blur_method_var.get(),
+            *REDACTION_METHODS,
+            command=self.set_blur_method,
+        ).pack(pady=5)
+
+        # Render quality policy used while zooming and panning
+        # Politique de qualité de rendu utilisée pendant le zoom et le panoramique
+        ttk.Label(
+            settings_dialog, text="Qualité du rendu (zoom/panoramique):", style="White.TLabel"
+        ).pack(pady=5)
+        self.render_quality_var = tk.StringVar(settings_dialog)
+        self.render_quality_var.set(self.render_quality)
+        render_quality_menu = ttk.OptionMenu(
+            settings_dialog,
+            self.render_quality_var,
+            self.render_quality_var.get(),
+            *QUALITY_POLICIES,
+            command=self.set_render_quality,
+        )
+        render_quality_menu.pack(pady=5)
+
         ttk.Button(
             settings_dialog, text="Fermer", command=settings_dialog.destroy
         ).pack(pady=10)
@@ -2259,27 +3135,126 @@ class VisioDoc3(tk.Tk):
         if self.video_stream_thread and self.video_stream_thread.cap:
             self.video_stream_thread.cap.set(cv2.CAP_PROP_CONTRAST, float(value))
 
-    def set_resolution(self, resolution_str):
+    def set_resolution(self, resolution_str, **capture_format):
         """
-        Sets the camera's resolution and restarts the video stream.
-        Définit la résolution de la caméra et redémarre le flux vidéo.
+        Sets the camera's resolution and capture format, then restarts the video stream.
+        Définit la résolution et le format de capture de la caméra, puis redémarre le flux vidéo.
 
         Args:
             resolution_str (str): Resolution string (e.g., "1280x720").
                                   Chaîne de résolution (par exemple, "1280x720").
+            **capture_format: Optional fourcc ("MJPG", "YUYV"), fps and buffer_size to request,
+                              saved for the current camera; None restores the driver default.
+                              fourcc ("MJPG", "YUYV"), fps et buffer_size optionnels à demander,
+                              sauvegardés pour la caméra actuelle ; None rétablit la valeur du pilote.
         """
         width, height = map(int, resolution_str.split("x"))
         self.current_resolution = (width, height)
+        if self.video_stream_thread and capture_format:
+            self._save_camera_settings(
+                self.video_stream_thread.camera_index, **capture_format
+            )
         if (
             self.video_stream_thread
         ):  # If a video stream is active / Si un flux vidéo est actif
-            self.video_stream_thread.stop()  # Stop the current stream / Arrête le flux actuel
-            self.video_stream_thread.join()  # Wait for it to terminate / Attend qu'il se termine
-            # Restart the video stream with the new resolution
-            # Redémarre le flux vidéo avec la nouvelle résolution
+            # Restart the video stream with the new resolution; the current stream is
+            # stopped and joined by start_video_stream
+            # Redémarre le flux vidéo avec la nouvelle résolution ; le flux actuel est
+            # arrêté et attendu par start_video_stream
             self.start_video_stream(
                 self.video_stream_thread.camera_index, width, height
             )
+        self.invalidate_view()
+
+    def set_capture_format(self, fourcc=None, fps=None, buffer_size=None):
+        """
+        Applies the capture format chosen in the settings dialog at the current resolution.
+        Applique le format de capture choisi dans la boîte de dialogue des paramètres à la résolution actuelle.
+
+        Args:
+            fourcc (str): "auto" or one of CAPTURE_FORMATS.
+                          "auto" ou l'un des CAPTURE_FORMATS.
+            fps (str): "auto" or the frame rate to request.
+                       "auto" ou la cadence à demander.
+            buffer_size (str): "auto" or the driver queue length.
+                               "auto" ou la longueur de la file du pilote.
+        """
+        self.set_resolution(
+            f"{self.current_resolution[0]}x{self.current_resolution[1]}",
+            fourcc=None if fourcc in (None, "auto") else fourcc,
+            fps=None if fps in (None, "auto") else float(fps),
+            buffer_size=None if buffer_size in (None, "auto") else int(buffer_size),
+        )
+
+    def set_capture_pacing(self, pacing):
+        """
+        Sets the capture pacing mode of the current camera and remembers it for this camera.
+        Définit le mode de cadence de capture de la caméra actuelle et le mémorise pour cette caméra.
+
+        Args:
+            pacing (str): One of PACING_MODES ("free_run", "target_fps", "latest").
+                          L'un des PACING_MODES ("free_run", "target_fps", "latest").
+        """
+        if pacing not in PACING_MODES or not self.video_stream_thread:
+            return
+        self.video_stream_thread.pacing = pacing  # Applied on the next frame / Appliqué à la prochaine trame
+        self._save_camera_settings(self.video_stream_thread.camera_index, pacing=pacing)
+
+    def set_target_fps(self, value):
+        """
+        Sets the frame rate used by the "target_fps" pacing mode of the current camera.
+        Définit la cadence utilisée par le mode "target_fps" de la caméra actuelle.
+
+        Args:
+            value (str): Target frame rate.
+                         Cadence cible.
+        """
+        try:
+            target_fps = float(value)
+        except ValueError:
+            return
+        if target_fps <= 0 or not self.video_stream_thread:
+            return
+        self.video_stream_thread.target_fps = target_fps
+        self._save_camera_settings(
+            self.video_stream_thread.camera_index, target_fps=target_fps
+        )
+
+    def set_freedraw_simplification(self, tolerance):
+        """
+        Sets the tolerance used to simplify freehand strokes when they are committed.
+        Définit la tolérance utilisée pour simplifier les tracés à main levée lorsqu'ils sont validés.
+
+        Args:
+            tolerance (str): Maximum deviation in screen pixels, "0.0" disables simplification.
+                             Écart maximal en pixels d'écran, "0.0" désactive la simplification.
+        """
+        self.freedraw_simplify_tolerance = max(0.0, float(tolerance))
+
+    def set_blur_method(self, method):
+        """
+        Sets the redaction method used by new blur annotations.
+        Définit la méthode de masquage utilisée par les nouvelles annotations de flou.
+
+        Args:
+            method (str): One of REDACTION_METHODS ("gaussian", "box", "pixelate" or "solid").
+                          Une des valeurs de REDACTION_METHODS ("gaussian", "box", "pixelate" ou "solid").
+        """
+        if method in REDACTION_METHODS:
+            self.blur_method = method
+
+    def set_render_quality(self, policy):
+        """
+        Sets the render quality policy used during zoom and pan gestures.
+        Définit la politique de qualité de rendu utilisée pendant les gestes de zoom et de panoramique.
+
+        Args:
+            policy (str): Policy name ("fast", "balanced" or "high").
+                          Nom de la politique ("fast", "balanced" ou "high").
+        """
+        if policy in QUALITY_POLICIES:
+            self.render_quality = policy
+            self.invalidate_view()
 
     def flip_horizontal(self):
         """
@@ -2290,6 +3265,8 @@ class VisioDoc3(tk.Tk):
             self.file_mode and self.loaded_image
         ):  # If in file mode, flip the loaded image / Si en mode fichier, retourne l'image chargée
             self.loaded_image = self.loaded_image.transpose(Image.FLIP_LEFT_RIGHT)
+            self.loaded_image_sequence += 1
+            self.request_redraw()
         elif (
             not self.file_mode
             and self.video_stream_thread
@@ -2306,6 +3283,8 @@ class VisioDoc3(tk.Tk):
             self.file_mode and self.loaded_image
         ):  # If in file mode, flip the loaded image / Si en mode fichier, retourne l'image chargée
             self.loaded_image = self.loaded_image.transpose(Image.FLIP_TOP_BOTTOM)
+            self.loaded_image_sequence += 1
+            self.request_redraw()
         elif (
             not self.file_mode
             and self.video_stream_thread
@@ -2367,7 +3346,7 @@ class VisioDoc3(tk.Tk):
         """
         file_path = filedialog.askopenfilename(
             filetypes=[
-                ("Image Files", "*.png *.jpg *.jpeg *.bmp *.gif"),
+                ("Image Files", "*.png *.jpg *.jpeg *.bmp *.gif *.tif *.tiff"),
                 ("PDF Files", "*.pdf"),
                 ("All Files", "*.*"),
             ]
@@ -2376,38 +3355,90 @@ class VisioDoc3(tk.Tk):
             not file_path
         ):  # If no file was selected / Si aucun fichier n'a été sélectionné
             return
+        self.open_path(file_path)
 
+    def open_folder(self):
+        """
+        Opens a folder dialog and pages through the images of the selected folder.
+        Ouvre une boîte de dialogue de dossier et parcourt les images du dossier sélectionné.
+        """
+        folder_path = filedialog.askdirectory()
+        if not folder_path:  # If no folder was selected / Si aucun dossier n'a été sélectionné
+            return
+        self.open_path(folder_path)
+
+    def open_path(self, path):
+        """
+        Displays an image, or the first page of a paged document: a PDF, a multi-page TIFF,
+        an animated GIF or a folder of images.
+        Affiche une image, ou la première page d'un document paginé : un PDF, un TIFF
+        multipage, un GIF animé ou un dossier d'images.
+
+        Args:
+            path (str): Path of the file or folder.
+                        Chemin du fichier ou du dossier.
+        """
         self.close_file()  # Close any currently open file or stop webcam / Ferme tout fichier actuellement ouvert ou arrête la webcam
         self.file_mode = True  # Switch to file mode / Passe en mode fichier
         self.camera_selection_frame.pack_forget()  # Hide camera selection UI / Masque l'interface utilisateur de sélection de la caméra
 
-        if file_path.lower().endswith(
-            ".pdf"
-        ):  # If it's a PDF file / Si c'est un fichier PDF
-            self.pdf_document = fitz.open(
-                file_path
-            )  # Open PDF document / Ouvre le document PDF
-            self.pdf_pages = [
-                page for page in self.pdf_document
-            ]  # Get all pages / Obtient toutes les pages
-            self.current_pdf_page = (
-                0  # Start at the first page / Commence à la première page
-            )
-            self.load_pdf_page(
-                self.current_pdf_page
-            )  # Load and display the first page / Charge et affiche la première page
-            self.show_pdf_nav()  # Show PDF navigation buttons / Affiche les boutons de navigation PDF
-        else:  # If it's an image file / Si c'est un fichier image
-            try:
-                self.loaded_image = Image.open(file_path).convert(
+        try:
+            # Only the page count is read here; pages are decoded by the render thread
+            # Seul le nombre de pages est lu ici ; les pages sont décodées par le thread de rendu
+            document = open_paged_document(path)
+            if document is None:  # If it's a single image / Si c'est une image seule
+                self.loaded_image = Image.open(path).convert(
                     "RGB"
                 )  # Open and convert image to RGB / Ouvre et convertit l'image en RGB
-                self.display_image(self.loaded_image)
-            except Exception as e:
-                messagebox.showerror(
-                    "Erreur d'ouverture", f"Impossible d'ouvrir le fichier image:\n{e}"
-                )
-                self.close_file()  # Revert to webcam mode on error / Revient au mode webcam en cas d'erreur
+                self.loaded_image_sequence += 1
+        except Exception as e:
+            messagebox.showerror(
+                "Erreur d'ouverture", f"Impossible d'ouvrir le fichier:\n{e}"
+            )
+            self.close_file()  # Revert to webcam mode on error / Revient au mode webcam en cas d'erreur
+            return
+
+        if document is None:
+            self.display_image(self.loaded_image)
+            return
+        if document.page_count == 0:  # A folder without images / Un dossier sans images
+            document.close()
+            messagebox.showerror(
+                "Erreur d'ouverture", f"Aucune image dans le dossier:\n{path}"
+            )
+            self.close_file()
+            return
+
+        self.pdf_document = document
+        self.current_pdf_page = (
+            0  # Start at the first page / Commence à la première page
+        )
+        renderer = PageRenderService(path)  # Renders pages off the Tk thread / Rend les pages hors du thread Tk
+        # The callbacks run on the render thread: they are bound to this service instead of
+        # reading self.page_renderer, which may already belong to a document opened since
+        # Les rappels s'exécutent sur le thread de rendu : ils sont liés à ce service au lieu de
+        # lire self.page_renderer, qui peut déjà appartenir à un document ouvert depuis
+        renderer.on_ready = lambda page_number, image: self._on_pdf_page_rendered(
+            renderer, page_number, image
+        )
+        renderer.on_detail = lambda *detail: self._on_pdf_detail_rendered(
+            renderer, *detail
+        )
+        self.page_renderer = renderer
+        self.page_renderer.start()
+        self.thumbnail_strip.set_page_count(document.page_count)
+        thumbnails = ThumbnailService(
+            path, document.page_count, self.thumbnail_cache
+        )  # Fills the strip, visible pages first / Remplit le bandeau, pages visibles d'abord
+        thumbnails.on_thumbnail = lambda page_number, image: self._on_thumbnail_rendered(
+            thumbnails, page_number, image
+        )  # Bound like the render callbacks / Lié comme les rappels de rendu
+        self.thumbnail_service = thumbnails
+        self.thumbnail_service.start()
+        self.show_pdf_nav()  # Show page navigation buttons / Affiche les boutons de navigation des pages
+        self.load_pdf_page(
+            self.current_pdf_page
+        )  # Load and display the first page / Charge et affiche la première page
 
     def close_file(self):
         """
@@ -2421,7 +3452,17 @@ class VisioDoc3(tk.Tk):
         ):  # If a PDF was open, close it / Si un PDF était ouvert, le ferme
             self.pdf_document.close()
         self.pdf_document = None
-        self.pdf_pages = []
+        if self.page_renderer is not None:
+            self.page_renderer.stop()
+            self.page_renderer = None
+        if self.thumbnail_service is not None:
+            self.thumbnail_service.stop()
+            self.thumbnail_service = None
+        self.thumbnail_strip.clear()
+        self.pdf_page_image = None
+        self.pdf_page_shown = None
+        self.pdf_detail = None
+        self._requested_detail = None
         self.current_pdf_page = 0
         self.hide_pdf_nav()  # Hide PDF navigation buttons / Masque les boutons de navigation PDF
         self.camera_selection_frame.pack(
@@ -2432,28 +3473,149 @@ class VisioDoc3(tk.Tk):
 
     def load_pdf_page(self, page_number):
         """
-        Loads and displays a specific page from the loaded PDF document.
-        Charge et affiche une page spécifique du document PDF chargé.
-
+        Shows a specific page from the loaded PDF document. Pages are rendered by
+        page_renderer; a page that is not cached yet is shown when its rendering completes.
+        Affiche une page spécifique du document PDF chargé. Les pages sont rendues par
+        page_renderer ; une page qui n'est pas encore en cache est affichée à la fin de son rendu.
 
         Args:
-            page_number (int): The 0-based index of the PDF page to load.                                  L\'index (base 0) de la page PDF à charger.
+            page_number (int): The 0-based index of the PDF page to load.
+                               L'index (base 0) de la page PDF à charger.
         """
         if (
-            self.pdf_document and 0 <= page_number < len(self.pdf_pages)
+            self.pdf_document and 0 <= page_number < self.pdf_document.page_count
         ):  # Ensure document is open and page number is valid / S'assure que le document est ouvert et que le numéro de page est valide
-            page = self.pdf_pages[page_number]
-            pix = page.get_pixmap()  # Render page to pixmap / Rend la page en pixmap
-            self.loaded_image = Image.frombytes(
-                "RGB", [pix.width, pix.height], pix.samples
-            )  # Convert pixmap to PIL Image / Convertit le pixmap en image PIL
             self.current_pdf_page = page_number
-            self.display_image(
-                self.loaded_image
-            )  # Display the loaded page / Affiche la page chargée
             self.page_label.config(
-                text=f"Page {self.current_pdf_page + 1} / {len(self.pdf_pages)}"
+                text=f"Page {self.current_pdf_page + 1} / {self.pdf_document.page_count}"
             )  # Update page number display / Met à jour l'affichage du numéro de page
+            self.thumbnail_strip.set_current(page_number)
+            # Also prefetches the neighbours and cancels pages queued for a page skipped over
+            # Prérend aussi les voisines et annule les pages mises en file pour une page sautée
+            self.page_renderer.request(page_number, self.pdf_document.page_count)
+            image = self.page_renderer.get(page_number)
+            if image is not None:
+                self._show_pdf_page(page_number, image)
+            elif self.pdf_page_shown != page_number:
+                self._show_pdf_placeholder()
+
+    def _show_pdf_page(self, page_number, image):
+        """
+        Displays a rendered page of the current PDF.
+        Affiche une page rendue du PDF courant.
+        """
+        self.loaded_image = image
+        self.loaded_image_sequence += 1
+        self.pdf_page_image = image
+        self.pdf_page_shown = page_number
+        self.display_image(
+            self.loaded_image
+        )  # Display the loaded page / Affiche la page chargée
+
+    def _show_pdf_placeholder(self):
+        """
+        Replaces the previous page with a blank page of the same size while the requested
+        page is rendered, so the page label never describes another page.
+        Remplace la page précédente par une page vierge de même taille pendant le rendu de
+        la page demandée, pour que l'étiquette de page ne décrive jamais une autre page.
+        """
+        size = self.loaded_image.size if self.loaded_image else (612, 792)  # US Letter at 72 DPI / US Letter à 72 DPI
+        self.loaded_image = Image.new("RGB", size, (235, 235, 235))
+        self.loaded_image_sequence += 1
+        self.pdf_page_image = None
+        self.pdf_page_shown = None
+        self.display_image(self.loaded_image)
+
+    def _on_pdf_page_rendered(self, renderer, page_number, image):
+        """
+        Called from the render thread of renderer after each page; hands the page over to the Tk thread.
+        Appelé depuis le thread de rendu de renderer après chaque page ; transmet la page au thread Tk.
+        """
+
+        def show():
+            # Ignore pages of a closed document and prefetched neighbours
+            # Ignore les pages d'un document fermé et les voisines prérendues
+            if self.page_renderer is not renderer or page_number != self.current_pdf_page:
+                return
+            if image is None:
+                messagebox.showerror(
+                    "Erreur de rendu",
+                    f"Impossible d'afficher la page {page_number + 1}.",
+                )
+                return
+            self._show_pdf_page(page_number, image)
+
+        self.after(0, show)
+
+    def _on_thumbnail_rendered(self, service, page_number, image):
+        """
+        Called from the thread of service for each page; hands the thumbnail over to the Tk thread.
+        Appelé depuis le thread de service pour chaque page ; transmet la vignette au thread Tk.
+        """
+
+        def show():
+            if self.thumbnail_service is service:
+                self.thumbnail_strip.set_thumbnail(page_number, image)
+
+        self.after(0, show)
+
+    def _on_thumbnails_visible(self, first, last, missing):
+        """
+        Called when the thumbnail strip scrolls, so the pages on screen are produced next and
+        the thumbnails it released are loaded again from the disk cache.
+        Appelé quand le bandeau de vignettes défile, pour que les pages à l'écran soient produites
+        ensuite et que les vignettes qu'il a libérées soient rechargées depuis le cache disque.
+        """
+        if self.thumbnail_service is not None:
+            self.thumbnail_service.set_visible(first, last, reload=missing)
+
+    def _on_pdf_detail_rendered(self, renderer, page_number, source_box, size, image):
+        """
+        Called from the render thread of renderer with a sharp rendering of a zoomed view.
+        Appelé depuis le thread de rendu de renderer avec un rendu net d'une vue zoomée.
+        """
+
+        def show():
+            if self.page_renderer is renderer:
+                self.pdf_detail = ((page_number, source_box, size), image)
+                self.request_redraw()
+
+        self.after(0, show)
+
+    def _pdf_detail_for(self, image, paste_position, label_size):
+        """
+        Returns the (source_box, image) detail for the render pipeline when a PDF page is
+        zoomed past MAX_UPSCALE, and requests it once the zoom/pan gesture has settled.
+        Retourne le détail (source_box, image) pour le pipeline de rendu lorsqu'une page PDF
+        est zoomée au-delà de MAX_UPSCALE, et le demande une fois le geste de zoom/panoramique terminé.
+
+        Returns:
+            tuple: (source_box, image), or None to scale the page image.
+                   (source_box, image), ou Aucun pour mettre à l'échelle l'image de la page.
+        """
+        if (
+            self.page_renderer is None
+            or not self.pdf_document.supports_clip  # Image pages have no finer resolution / Les pages image n'ont pas de résolution plus fine
+            or image is not self.pdf_page_image  # Flipped pages are scaled / Les pages retournées sont mises à l'échelle
+            or self.zoom_level <= MAX_UPSCALE
+        ):
+            return None
+        visible = RenderPipeline.visible_region(
+            image.size, self.zoom_level, paste_position, label_size
+        )
+        if visible is None:
+            return None
+        source_box, destination = visible
+        size = (destination[2] - destination[0], destination[3] - destination[1])
+        key = (self.pdf_page_shown, source_box, size)
+        if self.pdf_detail is not None and self.pdf_detail[0] == key:
+            return source_box, self.pdf_detail[1]
+        # Debounced: views passed through while zooming or panning are not rendered
+        # Anti-rebond : les vues traversées pendant un zoom ou un panoramique ne sont pas rendues
+        if not self.interactive_render and key != self._requested_detail:
+            self._requested_detail = key
+            self.page_renderer.request_detail(*key)
+        return None
 
     def next_pdf_page(self):
         """
@@ -2461,7 +3623,8 @@ class VisioDoc3(tk.Tk):
         Navigue vers la page suivante du document PDF, si disponible.
         """
         if (
-            self.current_pdf_page < len(self.pdf_pages) - 1
+            self.pdf_document
+            and self.current_pdf_page < self.pdf_document.page_count - 1
         ):  # Check if not on the last page / Vérifie si ce n'est pas la dernière page
             self.load_pdf_page(self.current_pdf_page + 1)
 
@@ -2477,18 +3640,20 @@ class VisioDoc3(tk.Tk):
 
     def show_pdf_nav(self):
         """
-        Shows the PDF navigation buttons and page label.
-        Affiche les boutons de navigation PDF et l'étiquette de page.
+        Shows the PDF navigation buttons, page label and thumbnail strip.
+        Affiche les boutons de navigation PDF, l'étiquette de page et le bandeau de vignettes.
         """
         self.prev_page_button.pack(side=tk.LEFT)
         self.page_label.pack(side=tk.LEFT, padx=5)
         self.next_page_button.pack(side=tk.LEFT)
+        self.thumbnail_strip.grid()
 
     def hide_pdf_nav(self):
         """
-        Hides the PDF navigation buttons and page label.
-        Masque les boutons de navigation PDF et l'étiquette de page.
+        Hides the PDF navigation buttons, page label and thumbnail strip.
+        Masque les boutons de navigation PDF, l'étiquette de page et le bandeau de vignettes.
         """
         self.prev_page_button.pack_forget()
         self.page_label.pack_forget()
         self.next_page_button.pack_forget()
+        self.thumbnail_strip.grid_remove()